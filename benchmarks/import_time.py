@@ -0,0 +1,105 @@
+"""Measure how long the plugin takes to import, in fresh interpreters.
+
+Usage (from the plugin root)::
+
+    python benchmarks/import_time.py            # the src modules main.py uses
+    python benchmarks/import_time.py --plugin   # main.py too (needs AstrBot)
+    python benchmarks/import_time.py -n 10 --top 15
+
+Each run imports the plugin in a new ``python -X importtime`` process, so
+nothing is cached in ``sys.modules``. The median wall time is reported
+together with the slowest imported modules, and the script fails if a
+module that should only be loaded on first use (matplotlib, markdown,
+numpy, yaml) was imported at load time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ("matplotlib", "markdown", "numpy", "yaml")
+
+# What main.py imports from src at load time.
+SRC_MODULES = (
+    "src.charts", "src.client", "src.net", "src.osuapi",
+    "src.osutrackapi", "src.storage", "src.utils",
+)
+
+_PROBE = """
+import importlib, sys, time
+sys.path.insert(0, {parent!r})
+start = time.perf_counter()
+for name in {targets!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - start
+lazy = sorted(m for m in {lazy!r} if m in sys.modules)
+print("RESULT", elapsed, ",".join(lazy))
+"""
+
+
+def _run(targets: tuple[str, ...], parent: str) -> tuple[float, list[str], dict[str, int]]:
+    code = _PROBE.format(parent=parent, targets=targets, lazy=LAZY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=parent,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import failed:\n{proc.stderr.strip()[-2000:]}")
+    elapsed, lazy = 0.0, []
+    for line in proc.stdout.splitlines():
+        if line.startswith("RESULT"):
+            _, value, *rest = line.split(" ")
+            elapsed = float(value)
+            lazy = [m for m in (rest[0] if rest else "").split(",") if m]
+    # "import time: self [us] | cumulative | imported package"
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # column header
+        cumulative[fields[2].strip()] = int(fields[1])
+    return elapsed, lazy, cumulative
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--runs", type=int, default=5, help="fresh interpreters to time (default 5)")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list (default 10)")
+    parser.add_argument("--plugin", action="store_true", help="import main.py as well (requires AstrBot)")
+    args = parser.parse_args()
+
+    if args.plugin:
+        parent, targets = os.path.dirname(ROOT), (f"{os.path.basename(ROOT)}.main",)
+    else:
+        parent, targets = ROOT, SRC_MODULES
+
+    times: list[float] = []
+    lazy: list[str] = []
+    cumulative: dict[str, int] = {}
+    for _ in range(max(args.runs, 1)):
+        elapsed, lazy, cumulative = _run(targets, parent)
+        times.append(elapsed)
+
+    print(f"import {', '.join(targets)}:\n  median {statistics.median(times) * 1000:.1f} ms, "
+          f"min {min(times) * 1000:.1f} ms over {len(times)} runs")
+    print("\nslowest imports (cumulative, last run):")
+    for name, us in sorted(cumulative.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    if lazy:
+        print(f"\nFAIL: loaded at import time but should be lazy: {', '.join(lazy)}")
+        return 1
+    print(f"\nOK: none of {', '.join(LAZY_MODULES)} imported at load time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
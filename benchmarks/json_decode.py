@@ -0,0 +1,89 @@
+"""Compare the installed JSON decoding backends on API-sized payloads.
+
+Usage (from the plugin root)::
+
+    python benchmarks/json_decode.py                  # synthetic payloads
+    python benchmarks/json_decode.py dump1.json ...   # recorded responses
+
+Recorded payloads are raw response bodies saved from the osu! API (e.g.
+``/scores``, ``beatmapsets/search``, ``rankings/osu/performance``). Without
+arguments, payloads shaped like those responses are generated instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.net import codec  # noqa: E402
+
+
+def _score(i: int) -> dict:
+    return {
+        "id": 4_000_000_000 + i,
+        "user_id": random.randint(1, 30_000_000),
+        "beatmap_id": random.randint(1, 5_000_000),
+        "accuracy": random.random(),
+        "pp": random.uniform(0, 1200),
+        "max_combo": random.randint(1, 3000),
+        "mods": [{"acronym": "HD"}, {"acronym": "DT", "settings": {"speed_change": 1.5}}],
+        "statistics": {"great": 1500, "ok": 12, "meh": 1, "miss": 0},
+        "rank": "S",
+        "ended_at": "2026-10-18T12:34:56Z",
+        "passed": True,
+        "ruleset_id": 0,
+    }
+
+
+def _beatmapset(i: int) -> dict:
+    return {
+        "id": i,
+        "artist": "Artist %d" % i,
+        "title": "タイトル %d" % i,
+        "creator": "mapper",
+        "status": "ranked",
+        "covers": {k: "https://assets.ppy.sh/beatmaps/%d/covers/%s.jpg" % (i, k) for k in ("cover", "card", "list")},
+        "beatmaps": [
+            {"id": i * 10 + d, "version": "Diff %d" % d, "difficulty_rating": d * 1.3, "bpm": 180, "total_length": 200}
+            for d in range(6)
+        ],
+    }
+
+
+def synthetic_payloads() -> dict[str, bytes]:
+    random.seed(0)
+    return {
+        "scores (1000)": json.dumps({"scores": [_score(i) for i in range(1000)], "cursor_string": "x"}).encode(),
+        "beatmapsets/search (50)": json.dumps({"beatmapsets": [_beatmapset(i) for i in range(50)]}).encode(),
+        "users/{id}/scores/best (100)": json.dumps([_score(i) for i in range(100)]).encode(),
+    }
+
+
+def main(paths: list[str]) -> None:
+    if paths:
+        payloads = {}
+        for path in paths:
+            with open(path, "rb") as f:
+                payloads[os.path.basename(path)] = f.read()
+    else:
+        payloads = synthetic_payloads()
+
+    backends = codec.available_backends()
+    print(f"backends: {', '.join(backends)} (active: {codec.backend()})")
+    for name, body in payloads.items():
+        print(f"\n{name}: {len(body) / 1024:.0f} KiB")
+        timings = {
+            backend: min(timeit.repeat(lambda: loads(body), number=20, repeat=5)) / 20
+            for backend, loads in backends.items()
+        }
+        for backend, best in timings.items():
+            print(f"  {backend:8s} {best * 1000:8.3f} ms   {timings['json'] / best:.2f}x vs json")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
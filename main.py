@@ -6,23 +6,27 @@ import astrbot.api.message_components as Comp
 
 import os
 import re
-import json
 import urllib.parse
 import asyncio
 import datetime
 from datetime import timedelta
-from io import BytesIO
 from pathlib import Path
-from typing import List
-
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 
+from .src.charts import (
+    ChartRenderer, Scores, Series, render_accuracy_chart, render_pp_chart, render_rank_chart,
+)
 from .src.utils import load_help_data, get_info, validate_osu_mode, to_track_mode
-from .src.client import LinkAccountManager, OAuthClient, OsuApiClient, TokenManager
-from .src.osutrackapi import OsuTrackApi, StatsUpdate, RecordedScore, PeakData
+from .src.client import LinkAccountManager, OAuthClient, OsuApiClient, TokenManager, UsernameIndex
+from .src.net import (
+    DiskCache,
+    HttpTransport,
+    Priority,
+    RateLimiter,
+    ResponseCache,
+    TransportConfig,
+)
+from .src.storage import BACKENDS as STORAGE_BACKENDS, open_storage
+from .src.osutrackapi import OsuTrackApi, OsuTrackHistory, PeakData
 
 try:
     from astrbot.core.utils.astrbot_path import get_astrbot_data_path
@@ -47,20 +51,72 @@ class OsuTrackPlugin(Star):
         self.client_secret = config.get("client_secret")
         self.redirect_uri = config.get("redirect_uri", "http://localhost:7210/")
 
+        # 所有 HTTP 客户端共享同一个连接池
+        self.http = HttpTransport(TransportConfig.from_config(config))
+        # 同一 client_id 下的所有请求共享限流配额（交互命令 > LLM 工具 > 后台任务）
+        rate_limit = config.get("api_rate_limit", 60)
+        self.rate_limiter = RateLimiter(
+            rate_limit, burst=config.get("api_rate_burst", 10),
+        ) if rate_limit and rate_limit > 0 else None
+        # 公共数据（谱面、排行、新闻、Wiki 等）在所有用户间共享缓存
+        cache_mb = config.get("api_cache_max_mb", 32)
+        self.api_cache = ResponseCache(
+            int(cache_mb * 1024 * 1024),
+        ) if cache_mb and cache_mb > 0 else None
+        # 已上架谱面、已结束比赛等不可变数据持久化到磁盘，重启后无需重新拉取
+        self.api_disk_cache = DiskCache(
+            os.path.join(_DATA_DIR, "api_cache.sqlite3"),
+        ) if config.get("api_disk_cache_enabled", True) else None
+
+        # 令牌、绑定关系、用户名索引、新闻推送状态共用同一存储后端
+        storage_backend = config.get("storage_backend", "json")
+        if storage_backend not in STORAGE_BACKENDS:
+            logger.warning(f"osu! 插件: 未知的存储后端 {storage_backend}，已改用 json")
+            storage_backend = "json"
+        self.storage = open_storage(storage_backend, _DATA_DIR)
+
         # 初始化管理器
-        self.token_manager = TokenManager(_DATA_DIR)
-        self.link_mgr = LinkAccountManager(_DATA_DIR)
+        self.token_manager = TokenManager(self.storage)
+        self.link_mgr = LinkAccountManager(
+            self.storage, legacy_file=os.path.join(_DATA_DIR, "osuaccount.json"),
+        )
         self.oauth = OAuthClient(
             client_id=self.client_id or 0,
             client_secret=self.client_secret or "",
             redirect_uri=self.redirect_uri,
             token_manager=self.token_manager,
+            transport=self.http,
+            rate_limiter=self.rate_limiter,
+            cache=self.api_cache,
+            disk_cache=self.api_disk_cache,
         )
-        self.osu = OsuApiClient(self.oauth)
-        self.osutrack = OsuTrackApi()
-
-        # 帮助信息
-        self.help_data = load_help_data()
+        # 用户名 -> ID 索引，避免重复解析同一玩家的用户名
+        self.user_index = UsernameIndex(
+            self.storage, legacy_file=os.path.join(_DATA_DIR, "osu_usernames.json"),
+        )
+        # 个人/玩家卡片：在新鲜期内直接使用缓存，过期后先返回旧数据并在后台刷新
+        self.osu = OsuApiClient(
+            self.oauth,
+            user_index=self.user_index,
+            profile_fresh=config.get("profile_swr_fresh", 60),
+            profile_max_age=config.get("profile_swr_max_age", 600),
+        )
+        self.osu_tool = self.osu.with_priority(Priority.TOOL)
+        self.osutrack = OsuTrackApi(transport=self.http)
+        # osutrack 历史数据保存在本地，之后只增量拉取新记录
+        self.track_history = OsuTrackHistory(
+            self.osutrack, os.path.join(_DATA_DIR, "osutrack_history.sqlite3"),
+        )
+        # 图表在独立进程中绘制，避免阻塞事件循环
+        self.charts = ChartRenderer(workers=config.get("chart_workers", 2))
+        chart_cache_mb = config.get("chart_cache_max_mb", 8)
+        self._chart_cache = ResponseCache(
+            int(chart_cache_mb * 1024 * 1024),
+        ) if chart_cache_mb and chart_cache_mb > 0 else None
+        # 每种图表最近一次所用的数据键（按条目计数）；其图表仍在缓存中时直接复用，不再同步 osutrack
+        self._chart_latest = ResponseCache(4096) if self._chart_cache is not None else None
+        # /osu update 后递增，使该用户此前记录的数据键失效
+        self._chart_epoch: dict[tuple[str, str], int] = {}
 
         # 图片输出配置
         self._use_image_output: bool = config.get("use_image_output", True)
@@ -84,14 +140,21 @@ class OsuTrackPlugin(Star):
         self._news_push_cron = config.get("news_push_cron", "0 8 * * *")
         self._news_push_interval = max(config.get("news_push_interval", 10), 1)
         self._news_push_sessions: list[str] = config.get("news_push_sessions", [])
-        self._news_state_file = os.path.join(_DATA_DIR, "news_push_state.json")
         self._news_pending: list[dict] = []  # scheduled 模式下待推送的新闻
         self._news_poll_task: asyncio.Task | None = None
         self._news_cron_job_id: str | None = None
         # 用于 client_credentials 获取新闻的独立 SDK 客户端
         self._news_client: OsuClient | None = None
 
+    @property
+    def help_data(self) -> dict:
+        # help.yaml 在首次使用时才加载（已缓存）
+        return load_help_data()
+
     async def initialize(self):
+        # 在令牌过期前于后台提前刷新，避免命令执行时等待 OAuth 往返
+        if self.client_id and self.client_secret:
+            self.oauth.start_refresh_scheduler()
         if self._news_push_enabled and self.client_id and self.client_secret:
             await self._start_news_push()
 
@@ -101,6 +164,11 @@ class OsuTrackPlugin(Star):
         self._news_client = OsuClient(
             client_id=self.client_id,
             client_secret=self.client_secret,
+            transport=self.http,
+            rate_limiter=self.rate_limiter,
+            default_priority=Priority.BACKGROUND,
+            cache=self.api_cache,
+            disk_cache=self.api_disk_cache,
         )
         await self._news_client.client_credentials()
         self._news_poll_task = asyncio.create_task(self._news_poll_loop())
@@ -124,15 +192,12 @@ class OsuTrackPlugin(Star):
                      f"间隔: {self._news_push_interval}分钟, "
                      f"目标会话: {len(self._news_push_sessions)}个)")
 
-    def _load_news_state(self) -> dict:
-        if os.path.exists(self._news_state_file):
-            with open(self._news_state_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+    # 存储读写可能落盘（JSON 后端会重写整个文件），放到线程中执行以免阻塞事件循环
+    async def _load_news_state(self) -> dict:
+        return await asyncio.to_thread(self.storage.items, "news_push_state")
 
-    def _save_news_state(self, state: dict):
-        with open(self._news_state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, ensure_ascii=False)
+    async def _save_news_state(self, state: dict):
+        await asyncio.to_thread(self.storage.set_many, "news_push_state", state)
 
     async def _news_poll_loop(self):
         """Background loop that periodically checks for new osu! news."""
@@ -163,7 +228,7 @@ class OsuTrackPlugin(Star):
         if not posts:
             return
 
-        state = self._load_news_state()
+        state = await self._load_news_state()
         last_seen_id = state.get("last_seen_id")
         last_seen_slug = state.get("last_seen_slug")
 
@@ -184,7 +249,7 @@ class OsuTrackPlugin(Star):
         latest = posts[0]
         state["last_seen_id"] = latest.get("id")
         state["last_seen_slug"] = latest.get("slug", "")
-        self._save_news_state(state)
+        await self._save_news_state(state)
 
         # 按时间正序推送（最旧的先推）
         new_posts.reverse()
@@ -428,9 +493,9 @@ class OsuTrackPlugin(Star):
 
         try:
             await event.send(MessageChain([Comp.Plain(get_info("common.loading", type="个人"))]))
-            user_info = await self.osu.get_own_data(platform_id, mode)
+            user_info, as_of = await self.osu.get_own_data_swr(platform_id, mode)
             # 尝试文转图
-            img_url = await self._render_user_card(user_info)
+            img_url = await self._render_user_card(user_info, as_of)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
@@ -480,9 +545,9 @@ class OsuTrackPlugin(Star):
                 if user.isdigit():
                     processed_user = int(user)
 
-            user_info = await self.osu.get_user(platform_id, processed_user, mode)
+            user_info, as_of = await self.osu.get_user_swr(platform_id, processed_user, mode)
             # 尝试文转图
-            img_url = await self._render_user_card(user_info)
+            img_url = await self._render_user_card(user_info, as_of)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
@@ -590,6 +655,9 @@ class OsuTrackPlugin(Star):
                 get_info("common.uploading", mode=validated_mode.upper()))]))
 
             update_resp = await self.osutrack.update_user(osu_id, track_mode)
+            self.track_history.invalidate(osu_id, track_mode)
+            epoch_key = (str(osu_id), validated_mode)
+            self._chart_epoch[epoch_key] = self._chart_epoch.get(epoch_key, 0) + 1
 
             result_text = get_info(
                 "update.success",
@@ -725,10 +793,16 @@ class OsuTrackPlugin(Star):
                 await event.send(MessageChain([Comp.Plain(
                     get_info("common.querying", count=len(valid_ids), type="谱面集"))]))
 
+                # 并发获取（由限流器控制请求速率），再按输入顺序逐条发送
+                fetched = await asyncio.gather(
+                    *(self.osu.get_beatmapset(platform_id, mid) for mid in valid_ids),
+                    return_exceptions=True,
+                )
                 ok_count, fail_count = 0, 0
-                for i, mid in enumerate(valid_ids, 1):
+                for i, (mid, bs) in enumerate(zip(valid_ids, fetched), 1):
                     try:
-                        bs = await self.osu.get_beatmapset(platform_id, mid)
+                        if isinstance(bs, Exception):
+                            raise bs
                         img_url = await self._render_beatmap_card(bs=bs)
                         if img_url:
                             await event.send(MessageChain([
@@ -848,32 +922,144 @@ class OsuTrackPlugin(Star):
             await event.send(MessageChain([Comp.Plain(
                 get_info("common.loading", type=f"{type.upper()} 图表"))]))
 
-            stats_history = await self.osutrack.get_stats_history(osu_id, track_mode, from_str, to_str)
+            # 同一图表在缓存有效期内重复查询时，直接复用上次绘制的结果，不再访问 osutrack
+            chart_type = "accuracy" if type == "acc" else type
+            latest_key = (
+                str(osu_id), validated_mode, days, chart_type,
+                self._chart_epoch.get((str(osu_id), validated_mode), 0),
+            )
+            chart_key = self._chart_latest.get(latest_key) if self._chart_latest is not None else None
+            chart_png = self._chart_cache.get(chart_key) if chart_key is not None else None
+            if chart_png is None:
+                stats_history = await self.track_history.get_stats_history(osu_id, track_mode, from_str, to_str)
+                if not stats_history:
+                    await event.send(MessageChain([Comp.Plain(get_info(
+                        "common.error_generic", operation="获取统计数据",
+                        error=f"在过去 {days} 天内没有找到任何统计数据"))]))
+                    return
+                hiscores = []
+                if chart_type == "pp":
+                    hiscores = await self.track_history.get_hiscores(osu_id, track_mode, from_str, to_str)
+
+                # 缓存键只由数据决定：数据未变化时直接复用上次绘制的图表
+                chart_key = (
+                    str(osu_id), validated_mode, days, chart_type,
+                    stats_history[-1].timestamp, hiscores[-1].score_time if hiscores else None,
+                )
+                chart_png = self._chart_cache.get(chart_key) if self._chart_cache is not None else None
+                if chart_png is None:
+                    user_info, _ = await self.osu.get_own_data_swr(platform_id, validated_mode)
+                    chart_png = await self._draw_chart(
+                        platform_id, chart_type, user_info.username, validated_mode, days, stats_history, hiscores,
+                    )
+                    if self._chart_cache is not None:
+                        self._chart_cache.set(chart_key, chart_png, ttl=self._CHART_CACHE_TTL, size=len(chart_png))
+                if self._chart_latest is not None:
+                    self._chart_latest.set(latest_key, chart_key, ttl=self._CHART_CACHE_TTL, size=1)
+
+            await event.send(MessageChain([Comp.Image.fromBytes(chart_png)]))
+        except ValueError as e:
+            await event.send(MessageChain([Comp.Plain(
+                get_info("common.error_generic", operation="参数验证", error=str(e)))]))
+        except Exception as e:
+            logger.error(f"生成图表失败: {e}")
+            await event.send(MessageChain([Comp.Plain(
+                get_info("common.error_generic", operation="生成图表", error=str(e)))]))
+        event.stop_event()
+
+    # ================================================================
+    # stats
+    # ================================================================
+
+    @osu_group.command("stats", alias={"数据", "摘要"})
+    async def get_stats_summary(self, event: AstrMessageEvent, mode: str = "osu", days: int = 30):
+        auth_ok, platform_id, osu_id = await self._check_auth(event)
+        if not auth_ok:
+            return
+
+        if days < 1 or days > 365:
+            await event.send(MessageChain([Comp.Plain(get_info(
+                "common.error_generic", operation="生成数据摘要",
+                error="天数范围必须在 1-365 之间"))]))
+            return
+
+        try:
+            validated_mode = validate_osu_mode(mode)
+            track_mode = to_track_mode(validated_mode)
+
+            to_date = datetime.datetime.now(datetime.timezone.utc)
+            from_date = to_date - timedelta(days=days)
+            from_str = from_date.strftime("%Y-%m-%d")
+            to_str = to_date.strftime("%Y-%m-%d")
+
+            await event.send(MessageChain([Comp.Plain(get_info("common.loading", type="数据摘要"))]))
+            stats_history = await self.track_history.get_stats_history(osu_id, track_mode, from_str, to_str)
             if not stats_history:
                 await event.send(MessageChain([Comp.Plain(get_info(
                     "common.error_generic", operation="获取统计数据",
                     error=f"在过去 {days} 天内没有找到任何统计数据"))]))
                 return
+            hiscores = await self.track_history.get_hiscores(osu_id, track_mode, from_str, to_str)
+
+            from .src.analytics import ScoreFrame, StatsFrame, summarize  # NumPy 在首次使用时才加载
+            summary = summarize(StatsFrame.from_updates(stats_history), ScoreFrame.from_scores(hiscores), days)
+            titles = await self._beatmap_titles(platform_id, [bid for bid, _, _ in summary.top_gains])
+
+            best_day = (datetime.datetime.fromtimestamp(summary.best_day, datetime.timezone.utc).strftime("%Y-%m-%d")
+                        if summary.best_day is not None else "-")
+            rank_change = f"{summary.rank_change:+,}" if summary.rank_change else "±0"
+            parts = [
+                get_info("stats.header", mode=validated_mode.upper(), days=days, snapshots=summary.snapshots),
+                get_info("stats.pp", start=f"{summary.pp_start:,.2f}", end=f"{summary.pp_end:,.2f}",
+                         change=f"{summary.pp_change:+,.2f}"),
+                get_info("stats.rank", start=f"{summary.rank_start:,}", end=f"{summary.rank_end:,}",
+                         change=rank_change),
+                get_info("stats.accuracy", start=f"{summary.accuracy_start:.2f}", end=f"{summary.accuracy_end:.2f}"),
+                get_info("stats.playcount", gain=f"{summary.playcount_gain:,}", active_days=summary.active_days),
+                get_info("stats.daily_gain", average=f"{summary.avg_daily_gain:+.2f}",
+                         recent=f"{summary.recent_daily_gain:+.2f}"),
+                get_info("stats.best_day", date=best_day, gain=f"{summary.best_day_gain:+.2f}"),
+                get_info("stats.new_hiscores", count=summary.new_hiscores),
+            ]
+            if summary.top_gains:
+                parts.append(get_info("stats.top_gains_header"))
+                for i, (bid, pp, gain) in enumerate(summary.top_gains, 1):
+                    parts.append(get_info("stats.top_gain", index=i, title=titles.get(bid, f"#{bid}"),
+                                          pp=f"{pp:.0f}", gain=f"{gain:+.2f}"))
 
-            user_info = await self.osu.get_own_data(platform_id, validated_mode)
-            username = user_info.username
-
-            if type == "pp":
-                hiscores = await self.osutrack.get_hiscores(osu_id, track_mode, from_str, to_str)
-                chart_buf = self._generate_pp_chart(stats_history, hiscores, username, validated_mode, days)
-            elif type == "rank":
-                chart_buf = self._generate_rank_chart(stats_history, username, validated_mode, days)
+            # 尝试文转图
+            sections = [{"type": "grid", "items": [
+                {"label": "PP", "value": f"{summary.pp_end:,.2f}", "color": "pp", "highlight": True,
+                 "sub": f"{summary.pp_change:+,.2f}"},
+                {"label": "全球排名", "value": f"#{summary.rank_end:,}", "color": "rank", "highlight": True,
+                 "sub": rank_change},
+                {"label": "准确率", "value": f"{summary.accuracy_end:.2f}%", "color": "acc",
+                 "sub": f"{summary.accuracy_end - summary.accuracy_start:+.2f}%"},
+                {"label": "游戏次数", "value": f"+{summary.playcount_gain:,}",
+                 "sub": f"活跃 {summary.active_days} 天"},
+                {"label": "日均 PP", "value": f"{summary.avg_daily_gain:+.2f}",
+                 "sub": f"近 7 天 {summary.recent_daily_gain:+.2f}"},
+                {"label": "最佳单日", "value": f"{summary.best_day_gain:+.2f}", "sub": best_day},
+            ]}]
+            if summary.top_gains:
+                sections.append({"type": "rows", "label": "PP 增长来源", "items": [
+                    {"label": titles.get(bid, f"#{bid}"), "value": f"{gain:+.2f} PP ({pp:.0f}pp)"}
+                    for bid, pp, gain in summary.top_gains
+                ]})
+            img_url = await self._render_info_card(
+                "📊 数据摘要", sections,
+                subtitle=f"{validated_mode.upper()} · 近 {days} 天", icon="📊",
+            )
+            if img_url:
+                await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
-                chart_buf = self._generate_accuracy_chart(stats_history, username, validated_mode, days)
-
-            await event.send(MessageChain([Comp.Image.fromBytes(chart_buf.read())]))
+                await event.send(MessageChain([Comp.Plain("\n".join(parts))]))
         except ValueError as e:
-            await event.send(MessageChain([Comp.Plain(
-                get_info("common.error_generic", operation="参数验证", error=str(e)))]))
+            await event.send(MessageChain([Comp.Plain(get_info("common.param_error", error=str(e)))]))
         except Exception as e:
-            logger.error(f"生成图表失败: {e}")
+            logger.error(f"生成数据摘要失败: {e}")
             await event.send(MessageChain([Comp.Plain(
-                get_info("common.error_generic", operation="生成图表", error=str(e)))]))
+                get_info("common.error_generic", operation="生成数据摘要", error=str(e)))]))
         event.stop_event()
 
     # ================================================================
@@ -899,7 +1085,7 @@ class OsuTrackPlugin(Star):
                 return
 
             # 尝试文转图
-            img_url = await self._render_score_card(scores, "🏆 最佳成绩", str(osu_id))
+            img_url = await self._render_score_card(scores, "🏆 最佳成绩", str(osu_id), platform_id)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
@@ -934,7 +1120,7 @@ class OsuTrackPlugin(Star):
                 return
 
             # 尝试文转图
-            img_url = await self._render_score_card(scores, "🕐 最近游玩", str(osu_id))
+            img_url = await self._render_score_card(scores, "🕐 最近游玩", str(osu_id), platform_id)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
@@ -977,7 +1163,7 @@ class OsuTrackPlugin(Star):
                 return
 
             # 尝试文转图
-            img_url = await self._render_score_card(result.scores[:10], f"🏅 谱面排行 #{beatmap_id}", f"共 {len(result.scores)} 条")
+            img_url = await self._render_score_card(result.scores[:10], f"🏅 谱面排行 #{beatmap_id}", f"共 {len(result.scores)} 条", platform_id)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
@@ -1530,16 +1716,21 @@ class OsuTrackPlugin(Star):
     # ================================================================
 
     @osu_group.command("changelog", alias={"更新日志"})
-    async def get_changelog(self, event: AstrMessageEvent, stream: str = None):
+    async def get_changelog(self, event: AstrMessageEvent, stream: str = None, limit: int = 10):
         auth_ok, platform_id, _ = await self._check_auth(event)
         if not auth_ok:
             return
 
+        # 只给出数量时 (/osu changelog 20) 不按更新流筛选
+        if stream and stream.isdigit():
+            stream, limit = None, int(stream)
+        limit = max(1, min(limit, 30))
         try:
             await event.send(MessageChain([Comp.Plain(
                 get_info("common.loading", type="更新日志"))]))
-            data = await self.osu.get_changelog_listing(platform_id, stream=stream)
-            builds = data.get("builds", [])
+            # 超过一页时自动翻页，并在处理当前页时预取下一页
+            pages = await self.osu.iter_changelog_builds(platform_id, stream=stream, max_items=limit)
+            builds = await pages.collect()
 
             if not builds:
                 await event.send(MessageChain([Comp.Plain(
@@ -1548,7 +1739,7 @@ class OsuTrackPlugin(Star):
 
             parts = [get_info("changelog.header", count=len(builds))]
             items = []
-            for idx, b in enumerate(builds[:10], 1):
+            for idx, b in enumerate(builds, 1):
                 display_ver = b.get("display_version", b.get("version", "?"))
                 stream_name = b.get("update_stream", {}).get("display_name", "?")
                 created_at = (b.get("created_at") or "-")[:10]
@@ -1740,16 +1931,18 @@ class OsuTrackPlugin(Star):
     # ================================================================
 
     @osu_group.command("events", alias={"事件"})
-    async def get_events(self, event: AstrMessageEvent):
+    async def get_events(self, event: AstrMessageEvent, limit: int = 15):
         auth_ok, platform_id, _ = await self._check_auth(event)
         if not auth_ok:
             return
 
+        limit = max(1, min(limit, 50))
         try:
             await event.send(MessageChain([Comp.Plain(
                 get_info("common.loading", type="事件流"))]))
-            data = await self.osu.get_events(platform_id)
-            events_list = data.get("events", [])
+            # 超过一页时按 cursor 自动翻页，并在处理当前页时预取下一页
+            pages = await self.osu.iter_events(platform_id, max_items=limit)
+            events_list = await pages.collect()
 
             if not events_list:
                 await event.send(MessageChain([Comp.Plain(
@@ -1758,7 +1951,7 @@ class OsuTrackPlugin(Star):
 
             # 尝试文转图
             items = []
-            for i, ev in enumerate(events_list[:15], 1):
+            for i, ev in enumerate(events_list, 1):
                 ev_type = ev.get("type", "?")
                 created_at = (ev.get("created_at") or "-")[:16]
                 user = ev.get("user", {})
@@ -1772,7 +1965,7 @@ class OsuTrackPlugin(Star):
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
             else:
                 parts = [get_info("events.header", count=len(events_list))]
-                for i, ev in enumerate(events_list[:15], 1):
+                for i, ev in enumerate(events_list, 1):
                     ev_type = ev.get("type", "?")
                     created_at = (ev.get("created_at") or "-")[:16]
                     user = ev.get("user", {})
@@ -1805,7 +1998,7 @@ class OsuTrackPlugin(Star):
             return
         try:
             processed: str | int = int(username) if username.isdigit() else username
-            user_info = await self.osu.get_user(platform_id, processed)
+            user_info = await self.osu_tool.get_user(platform_id, processed)
             img_url = await self._render_user_card(user_info)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
@@ -1828,7 +2021,7 @@ class OsuTrackPlugin(Star):
             yield event.plain_result("用户尚未绑定 osu! 账号或授权已过期，请先使用 /osu link 绑定。")
             return
         try:
-            bm = await self.osu.get_beatmap(platform_id, int(beatmap_id))
+            bm = await self.osu_tool.get_beatmap(platform_id, int(beatmap_id))
             img_url = await self._render_beatmap_card(bm=bm)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
@@ -1853,16 +2046,16 @@ class OsuTrackPlugin(Star):
             return
         try:
             processed: str | int = int(username) if username.isdigit() else username
-            user_info = await self.osu.get_user(platform_id, processed, mode=mode)
+            user_info = await self.osu_tool.get_user_brief(platform_id, processed, mode=mode)
             count = min(max(int(limit), 1), 10)
-            scores = await self.osu.get_user_scores(platform_id, user_info.id, "best", mode=mode, limit=count)
+            scores = await self.osu_tool.get_user_scores(platform_id, user_info.id, "best", mode=mode, limit=count)
             if not scores:
                 yield event.plain_result(f"玩家 {user_info.username} 暂无最佳成绩记录。")
                 return
             lines = [f"🏆 {user_info.username} 的最佳成绩 ({mode}):"]
             for i, s in enumerate(scores, 1):
                 lines.append(self._format_score(s, index=i))
-            img_url = await self._render_score_card(scores, f"🏆 {user_info.username} 最佳成绩", user_info.username)
+            img_url = await self._render_score_card(scores, f"🏆 {user_info.username} 最佳成绩", user_info.username, platform_id)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
                 yield event.plain_result("查询成功，最佳成绩已通过图片发送。")
@@ -1886,16 +2079,16 @@ class OsuTrackPlugin(Star):
             return
         try:
             processed: str | int = int(username) if username.isdigit() else username
-            user_info = await self.osu.get_user(platform_id, processed, mode=mode)
+            user_info = await self.osu_tool.get_user_brief(platform_id, processed, mode=mode)
             count = min(max(int(limit), 1), 10)
-            scores = await self.osu.get_user_scores(platform_id, user_info.id, "recent", mode=mode, limit=count, include_fails=1)
+            scores = await self.osu_tool.get_user_scores(platform_id, user_info.id, "recent", mode=mode, limit=count, include_fails=1)
             if not scores:
                 yield event.plain_result(f"玩家 {user_info.username} 最近没有游玩记录。")
                 return
             lines = [f"🕐 {user_info.username} 的最近游玩 ({mode}):"]
             for i, s in enumerate(scores, 1):
                 lines.append(self._format_score(s, index=i))
-            img_url = await self._render_score_card(scores, f"🕐 {user_info.username} 最近游玩", user_info.username)
+            img_url = await self._render_score_card(scores, f"🕐 {user_info.username} 最近游玩", user_info.username, platform_id)
             if img_url:
                 await event.send(MessageChain([Comp.Image.fromURL(img_url)]))
                 yield event.plain_result("查询成功，最近成绩已通过图片发送。")
@@ -1916,7 +2109,7 @@ class OsuTrackPlugin(Star):
             yield event.plain_result("用户尚未绑定 osu! 账号或授权已过期，请先使用 /osu link 绑定。")
             return
         try:
-            result = await self.osu.search_beatmapsets(platform_id, query=query)
+            result = await self.osu_tool.search_beatmapsets(platform_id, query=query)
             beatmapsets = result.beatmapsets[:5] if result.beatmapsets else []
             if not beatmapsets:
                 yield event.plain_result(f"未找到与「{query}」相关的谱面。")
@@ -1952,14 +2145,14 @@ class OsuTrackPlugin(Star):
         try:
             if username:
                 processed: str | int = int(username) if username.isdigit() else username
-                user_info = await self.osu.get_user(platform_id, processed)
+                user_info = await self.osu_tool.get_user_brief(platform_id, processed)
                 uid = user_info.id
                 uname = user_info.username
             else:
                 uid = int(osu_id)
-                own = await self.osu.get_own_data(platform_id)
+                own = await self.osu_tool.get_own_data(platform_id)
                 uname = own.username
-            result = await self.osu.get_user_beatmap_score(platform_id, int(beatmap_id), uid)
+            result = await self.osu_tool.get_user_beatmap_score(platform_id, int(beatmap_id), uid)
             score = result.score
             pos = result.position
             text = self._format_score(score)
@@ -1989,7 +2182,7 @@ class OsuTrackPlugin(Star):
             yield event.plain_result("用户尚未绑定 osu! 账号或授权已过期，请先使用 /osu link 绑定。")
             return
         try:
-            data = await self.osu.get_ranking(platform_id, mode, type)
+            data = await self.osu_tool.get_ranking(platform_id, mode, type)
             ranking_list = data.get("ranking", [])[:10]
             if not ranking_list:
                 yield event.plain_result("排行榜数据为空。")
@@ -2027,7 +2220,7 @@ class OsuTrackPlugin(Star):
             yield event.plain_result("用户尚未绑定 osu! 账号或授权已过期，请先使用 /osu link 绑定。")
             return
         try:
-            data = await self.osu.get_wiki_page(platform_id, locale, path)
+            data = await self.osu_tool.get_wiki_page(platform_id, locale, path)
             title = data.get("title", path)
             markdown = data.get("markdown", "")
             # 将 markdown 转换为 HTML
@@ -2068,7 +2261,7 @@ class OsuTrackPlugin(Star):
         try:
             if news_id:
                 key = "id" if news_id.isdigit() else None
-                data = await self.osu.get_news_post(platform_id, news_id, key=key)
+                data = await self.osu_tool.get_news_post(platform_id, news_id, key=key)
                 title = data.get("title", "?")
                 preview = data.get("preview", "")
                 author = data.get("author", "?")
@@ -2086,7 +2279,7 @@ class OsuTrackPlugin(Star):
                 else:
                     yield event.plain_result(text)
             else:
-                data = await self.osu.get_news_listing(platform_id, limit=10)
+                data = await self.osu_tool.get_news_listing(platform_id, limit=10)
                 posts = data.get("news_posts", [])
                 if not posts:
                     yield event.plain_result("暂无新闻。")
@@ -2192,8 +2385,11 @@ class OsuTrackPlugin(Star):
     # HTML rendering helpers
     # --------------------------------------------------
 
-    async def _render_user_card(self, user_info) -> str | None:
-        """Render a user profile card as image URL. Returns None on failure."""
+    async def _render_user_card(self, user_info, as_of: float | None = None) -> str | None:
+        """Render a user profile card as image URL. Returns None on failure.
+
+        *as_of* (Unix time the data was fetched) is shown in the footer.
+        """
         tmpl = self._templates.get("user_card")
         if not tmpl or not self._use_image_output:
             return None
@@ -2228,6 +2424,7 @@ class OsuTrackPlugin(Star):
             "ranked_score": f"{s.ranked_score:,}" if s and s.ranked_score is not None else None,
             "total_score": f"{s.total_score:,}" if s and s.total_score is not None else None,
             "grades": grades,
+            "as_of": datetime.datetime.fromtimestamp(as_of).strftime("%Y-%m-%d %H:%M:%S") if as_of else None,
         }
         try:
             return await self.html_render(tmpl, data, options={"quality": 80})
@@ -2235,16 +2432,38 @@ class OsuTrackPlugin(Star):
             logger.debug(f"HTML 渲染用户卡片失败: {e}")
             return None
 
-    async def _render_score_card(self, scores: list, title: str, player_name: str) -> str | None:
-        """Render a score list card as image URL. Returns None on failure."""
+    @staticmethod
+    def _beatmap_display_name(bm) -> str:
+        bs = bm.beatmapset
+        return f"{bs.artist} - {bs.title} [{bm.version}]" if bs else f"[{bm.version}]"
+
+    async def _beatmap_titles(self, platform_id: str, beatmap_ids: list[int]) -> dict[int, str]:
+        """Resolve display names for many beatmaps in one or two requests ({} on failure)."""
+        try:
+            beatmaps = await self.osu.get_beatmaps_by_id(platform_id, beatmap_ids)
+        except Exception as e:
+            logger.debug(f"批量获取谱面信息失败: {e}")
+            return {}
+        return {bid: self._beatmap_display_name(bm) for bid, bm in beatmaps.items()}
+
+    async def _render_score_card(self, scores: list, title: str, player_name: str,
+                                 platform_id: str | None = None) -> str | None:
+        """Render a score list card as image URL. Returns None on failure.
+
+        With *platform_id*, beatmap titles are fetched in bulk so each row
+        shows the map name instead of a bare ID.
+        """
         tmpl = self._templates.get("score_card")
         if not tmpl or not self._use_image_output:
             return None
+        titles = await self._beatmap_titles(
+            platform_id, [s.beatmap_id for s in scores]) if platform_id else {}
         score_data = []
         for s in scores:
             mods_str = ", ".join((m.get("acronym", "?") if isinstance(m, dict) else str(m)) for m in s.mods) if s.mods else ""
             score_data.append({
                 "beatmap_id": s.beatmap_id,
+                "beatmap_title": titles.get(s.beatmap_id, ""),
                 "rank": s.rank,
                 "pp": f"{s.pp:.2f}" if s.pp is not None else None,
                 "accuracy": f"{s.accuracy * 100:.2f}",
@@ -2535,100 +2754,35 @@ class OsuTrackPlugin(Star):
     # Chart generation
     # --------------------------------------------------
 
-    _RANK_COLORS = {
-        "XH": "#FFD700", "X": "#C0C0C0", "SH": "#FFD700", "S": "#C0C0C0",
-        "A": "#00FF00", "B": "#4169E1", "C": "#FF00FF", "D": "#FF0000", "F": "#808080",
-    }
-    _RANK_MARKERS = {
-        "XH": "*", "X": "*", "SH": "D", "S": "D",
-        "A": "o", "B": "s", "C": "^", "D": "v", "F": "x",
-    }
-
-    def _generate_pp_chart(self, stats: List[StatsUpdate], hiscores: List[RecordedScore],
-                           username: str, mode: str, days: int) -> BytesIO:
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-        fig.suptitle(f"{username} - {mode.upper()} Mode PP Statistics (Last {days} Days)",
-                     fontsize=16, fontweight="bold")
-
-        if stats:
-            ts = [datetime.datetime.fromisoformat(s.timestamp.replace("Z", "+00:00")) for s in stats]
-            pp = [s.pp_raw for s in stats]
-            ax1.plot(ts, pp, color="#FF66AA", linewidth=2, marker="o", markersize=4, label="PP")
-            ax1.set_xlabel("Date"); ax1.set_ylabel("PP")
-            ax1.set_title("PP Over Time", fontsize=14, fontweight="bold")
-            ax1.grid(True, alpha=0.3); ax1.legend()
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-            ax1.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, days // 10)))
-            plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha="right")
-
-        if hiscores:
-            by_rank: dict[str, dict] = {}
-            for sc in hiscores:
-                entry = by_rank.setdefault(sc.rank, {"t": [], "p": []})
-                entry["t"].append(datetime.datetime.fromisoformat(sc.score_time.replace("Z", "+00:00")))
-                entry["p"].append(sc.pp)
-            for rank, d in by_rank.items():
-                ax2.scatter(d["t"], d["p"], c=self._RANK_COLORS.get(rank.upper(), "#808080"),
-                            marker=self._RANK_MARKERS.get(rank.upper(), "o"),
-                            s=100, alpha=0.6, label=f"Rank {rank}", edgecolors="black", linewidths=0.5)
-            ax2.set_xlabel("Date"); ax2.set_ylabel("PP")
-            ax2.set_title("Score Performance (PP by Rank)", fontsize=14, fontweight="bold")
-            ax2.grid(True, alpha=0.3); ax2.legend(loc="upper left", fontsize=8, ncol=2)
-            ax2.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-            ax2.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, days // 10)))
-            plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha="right")
-
-        plt.tight_layout()
-        buf = BytesIO()
-        plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-        buf.seek(0); plt.close(fig)
-        return buf
-
-    def _generate_rank_chart(self, stats: List[StatsUpdate],
-                             username: str, mode: str, days: int) -> BytesIO:
-        fig, ax = plt.subplots(figsize=(12, 6))
-        fig.suptitle(f"{username} - {mode.upper()} Mode Rank Statistics (Last {days} Days)",
-                     fontsize=16, fontweight="bold")
-        if stats:
-            ts = [datetime.datetime.fromisoformat(s.timestamp.replace("Z", "+00:00")) for s in stats]
-            ranks = [s.pp_rank for s in stats]
-            ax.plot(ts, ranks, color="#66B2FF", linewidth=2, marker="o", markersize=4, label="Global Rank")
-            ax.set_xlabel("Date"); ax.set_ylabel("Rank")
-            ax.set_title("Global Rank Over Time", fontsize=14, fontweight="bold")
-            ax.grid(True, alpha=0.3); ax.legend()
-            ax.invert_yaxis()
-            ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, days // 10)))
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
-        plt.tight_layout()
-        buf = BytesIO()
-        plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-        buf.seek(0); plt.close(fig)
-        return buf
-
-    def _generate_accuracy_chart(self, stats: List[StatsUpdate],
-                                 username: str, mode: str, days: int) -> BytesIO:
-        fig, ax = plt.subplots(figsize=(12, 6))
-        fig.suptitle(f"{username} - {mode.upper()} Mode Accuracy Statistics (Last {days} Days)",
-                     fontsize=16, fontweight="bold")
-        if stats:
-            ts = [datetime.datetime.fromisoformat(s.timestamp.replace("Z", "+00:00")) for s in stats]
-            accs = [s.accuracy for s in stats]
-            ax.plot(ts, accs, color="#FFB366", linewidth=2, marker="o", markersize=4, label="Accuracy")
-            ax.set_xlabel("Date"); ax.set_ylabel("Accuracy (%)")
-            ax.set_title("Accuracy Over Time", fontsize=14, fontweight="bold")
-            ax.grid(True, alpha=0.3); ax.legend()
-            if accs:
-                pad = (max(accs) - min(accs)) * 0.1 or 1
-                ax.set_ylim(min(accs) - pad, max(accs) + pad)
-            ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, days // 10)))
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
-        plt.tight_layout()
-        buf = BytesIO()
-        plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-        buf.seek(0); plt.close(fig)
-        return buf
+    # 在 PP 图表中标注谱面名称的最高 PP 成绩数
+    _CHART_LABELLED_PLAYS = 5
+    # 图表缓存有效期（秒）；期间重复查询同一图表不访问 osutrack，/osu update 后立即失效
+    _CHART_CACHE_TTL = 3600
+
+    async def _draw_chart(self, platform_id: str, type: str, username: str, mode: str, days: int,
+                          stats: list, hiscores: list) -> bytes:
+        """Render a chart in the worker pool; only timestamp/value arrays are sent over."""
+        from .src.analytics import ScoreFrame, StatsFrame  # NumPy 在首次使用时才加载
+
+        frame = StatsFrame.from_updates(stats)
+        if type == "pp":
+            scores = ScoreFrame.from_scores(hiscores)
+            top = scores.top(self._CHART_LABELLED_PLAYS)
+            titles = await self._beatmap_titles(platform_id, scores.beatmap_id[top].tolist())
+            labels: list[str | None] = [None] * len(scores)
+            for i in top.tolist():
+                labels[i] = titles.get(int(scores.beatmap_id[i]))
+            return await self.charts.render(
+                render_pp_chart, username, mode, days,
+                Series(frame.t, frame.pp), Scores(scores.t, scores.pp, scores.rank, labels),
+            )
+        if type == "rank":
+            return await self.charts.render(
+                render_rank_chart, username, mode, days, Series(frame.t, frame.rank),
+            )
+        return await self.charts.render(
+            render_accuracy_chart, username, mode, days, Series(frame.t, frame.accuracy),
+        )
 
     # --------------------------------------------------
 
@@ -2648,5 +2802,14 @@ class OsuTrackPlugin(Star):
             await self._news_client.close()
         await self.osu.close()
         await self.osutrack.close()
+        self.track_history.close()
+        self.charts.close()
         await self.oauth.close()
+        await self.http.close()
+        if self.api_disk_cache:
+            self.api_disk_cache.close()
+        await self.user_index.flush()
+        await self.token_manager.flush()
+        await self.link_mgr.close()
+        self.storage.close()
         return await super().terminate()
\ No newline at end of file
@@ -0,0 +1,264 @@
+"""Vectorised analytics over osutrack stats history and hiscores (NumPy).
+
+Model lists are converted once into columnar arrays (:class:`StatsFrame`,
+:class:`ScoreFrame`); resampling, deltas, rolling averages and pp-gain
+attribution then run as array operations instead of per-point Python.
+Timestamps are UTC epoch seconds throughout.
+"""
+
+from __future__ import annotations
+
+import datetime
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+DAY = 86400.0
+
+
+def epoch_seconds(timestamps: Sequence[str]) -> np.ndarray:
+    """Parse ISO-8601 UTC timestamps (``Z`` suffix allowed) into epoch seconds."""
+    if not len(timestamps):
+        return np.empty(0, dtype=np.float64)
+    values = np.asarray(timestamps, dtype=str)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            parsed = np.char.rstrip(values, "Z").astype("datetime64[ms]")
+        return parsed.astype(np.int64) / 1000.0
+    except (ValueError, UserWarning):
+        # Explicit offsets (``+00:00``) are not understood by NumPy.
+        return np.array([
+            datetime.datetime.fromisoformat(v.replace("Z", "+00:00")).timestamp() for v in timestamps
+        ], dtype=np.float64)
+
+
+def _column(records: Sequence[Any], name: str, dtype: Any) -> np.ndarray:
+    return np.fromiter((getattr(r, name) for r in records), dtype=dtype, count=len(records))
+
+
+# ----------------------------------------------------------------------
+# Frames
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class StatsFrame:
+    """Stats snapshots as parallel arrays, sorted by time."""
+    t: np.ndarray
+    pp: np.ndarray
+    rank: np.ndarray
+    accuracy: np.ndarray
+    playcount: np.ndarray
+
+    @classmethod
+    def from_updates(cls, updates: Iterable[Any]) -> StatsFrame:
+        """Build from ``StatsUpdate`` objects (any order)."""
+        records = list(updates)
+        frame = cls(
+            t=epoch_seconds([r.timestamp for r in records]),
+            pp=_column(records, "pp_raw", np.float64),
+            rank=_column(records, "pp_rank", np.int64),
+            accuracy=_column(records, "accuracy", np.float64),
+            playcount=_column(records, "playcount", np.int64),
+        )
+        return frame.take(np.argsort(frame.t, kind="stable"))
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def take(self, index: np.ndarray) -> StatsFrame:
+        return StatsFrame(
+            t=self.t[index], pp=self.pp[index], rank=self.rank[index],
+            accuracy=self.accuracy[index], playcount=self.playcount[index],
+        )
+
+    def daily(self) -> StatsFrame:
+        """Resample to one snapshot per UTC day: the last one of that day."""
+        if not len(self):
+            return self
+        days = np.floor(self.t / DAY)
+        # Sorted by time, so the last row of each day is where the day changes.
+        last = np.flatnonzero(np.append(days[1:] != days[:-1], True))
+        return self.take(last)
+
+
+@dataclass
+class ScoreFrame:
+    """Recorded hiscores as parallel arrays, sorted by score time."""
+    t: np.ndarray
+    pp: np.ndarray
+    beatmap_id: np.ndarray
+    rank: np.ndarray
+
+    @classmethod
+    def from_scores(cls, scores: Iterable[Any]) -> ScoreFrame:
+        """Build from ``RecordedScore`` objects (any order)."""
+        records = list(scores)
+        frame = cls(
+            t=epoch_seconds([r.score_time for r in records]),
+            pp=_column(records, "pp", np.float64),
+            beatmap_id=_column(records, "beatmap_id", np.int64),
+            rank=np.array([r.rank for r in records], dtype=str),
+        )
+        order = np.argsort(frame.t, kind="stable")
+        return cls(frame.t[order], frame.pp[order], frame.beatmap_id[order], frame.rank[order])
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def top(self, n: int) -> np.ndarray:
+        """Indices of the *n* highest-pp scores, best first."""
+        return np.argsort(-self.pp, kind="stable")[:n]
+
+
+# ----------------------------------------------------------------------
+# Series operations
+# ----------------------------------------------------------------------
+
+
+def deltas(values: np.ndarray) -> np.ndarray:
+    """Change between consecutive values (one shorter than *values*)."""
+    return np.diff(values.astype(np.float64))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over up to *window* values (shorter at the start)."""
+    values = values.astype(np.float64)
+    if window <= 1 or not len(values):
+        return values
+    sums = np.cumsum(np.insert(values, 0, 0.0))
+    idx = np.arange(1, len(values) + 1)
+    start = np.maximum(idx - window, 0)
+    return (sums[idx] - sums[start]) / (idx - start)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of at most *threshold* points that keep the shape of ``(x, y)``.
+
+    Largest-Triangle-Three-Buckets: the first and last points are kept,
+    the rest are split into ``threshold - 2`` buckets and from each the
+    point forming the largest triangle with the previously kept point and
+    the next bucket's average is chosen. Peaks and dips survive, unlike
+    with plain striding. *x* must be sorted.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    # Bucket averages, plus the last point standing in as the bucket after the last one.
+    counts = np.diff(np.append(edges, n))
+    avg_x = np.add.reduceat(x, edges) / counts
+    avg_y = np.add.reduceat(y, edges) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        bx, by = avg_x[i + 1], avg_y[i + 1]
+        area = np.abs((x[a] - bx) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (by - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+@dataclass
+class PpAttribution:
+    """How a period's pp gain splits over the hiscores set in it."""
+    gain: np.ndarray          # pp attributed to each score of the ScoreFrame
+    unattributed: float       # gain on days without a new hiscore (decay, recalcs)
+
+
+def attribute_pp_gain(daily: StatsFrame, scores: ScoreFrame) -> PpAttribution:
+    """Split each day's pp change across the hiscores set that day.
+
+    A day's gain (its pp minus the previous day's) is shared among that
+    day's new hiscores in proportion to their raw pp; gains on days with
+    no new hiscore are reported as unattributed. This approximates the
+    weighted top-play contribution without needing the full top-100.
+    """
+    if len(daily) < 2:
+        return PpAttribution(np.zeros(len(scores)), 0.0)
+    gain_days = np.floor(daily.t[1:] / DAY)   # day each gain was reached
+    day_gain = np.diff(daily.pp)
+
+    score_days = np.floor(scores.t / DAY)
+    slot = np.minimum(np.searchsorted(gain_days, score_days), len(gain_days) - 1)
+    matched = gain_days[slot] == score_days
+    weights = np.where(matched, scores.pp, 0.0)
+
+    day_weight = np.bincount(slot, weights=weights, minlength=len(gain_days))
+    share = np.divide(weights, day_weight[slot], out=np.zeros_like(weights), where=weights > 0)
+    return PpAttribution(
+        gain=share * day_gain[slot],
+        unattributed=float(day_gain[day_weight == 0].sum()),
+    )
+
+
+# ----------------------------------------------------------------------
+# Summary
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class StatsSummary:
+    """Headline numbers for a period of stats history."""
+    days: int = 0
+    snapshots: int = 0
+    pp_start: float = 0.0
+    pp_end: float = 0.0
+    rank_start: int = 0
+    rank_end: int = 0
+    accuracy_start: float = 0.0
+    accuracy_end: float = 0.0
+    playcount_gain: int = 0
+    active_days: int = 0
+    avg_daily_gain: float = 0.0
+    recent_daily_gain: float = 0.0
+    best_day: Optional[float] = None
+    best_day_gain: float = 0.0
+    new_hiscores: int = 0
+    top_gains: list[tuple[int, float, float]] = field(default_factory=list)  # (beatmap_id, pp, gain)
+    unattributed: float = 0.0
+
+    @property
+    def pp_change(self) -> float:
+        return self.pp_end - self.pp_start
+
+    @property
+    def rank_change(self) -> int:
+        # Positive means climbing (a smaller rank number).
+        return self.rank_start - self.rank_end if self.rank_start and self.rank_end else 0
+
+
+def summarize(stats: StatsFrame, scores: ScoreFrame, days: int, top: int = 3) -> StatsSummary:
+    """Summarise *stats* and *scores* for the last *days* days."""
+    summary = StatsSummary(days=days, snapshots=len(stats))
+    if not len(stats):
+        return summary
+    daily = stats.daily()
+    summary.pp_start, summary.pp_end = float(stats.pp[0]), float(stats.pp[-1])
+    summary.rank_start, summary.rank_end = int(stats.rank[0]), int(stats.rank[-1])
+    summary.accuracy_start, summary.accuracy_end = float(stats.accuracy[0]), float(stats.accuracy[-1])
+    summary.playcount_gain = int(stats.playcount[-1] - stats.playcount[0])
+
+    gains = deltas(daily.pp)
+    if len(gains):
+        summary.active_days = int(np.count_nonzero(deltas(daily.playcount) > 0))
+        summary.avg_daily_gain = float(gains.sum() / max(days, 1))
+        summary.recent_daily_gain = float(rolling_mean(gains, 7)[-1])
+        best = int(np.argmax(gains))
+        summary.best_day, summary.best_day_gain = float(daily.t[best + 1]), float(gains[best])
+
+    summary.new_hiscores = len(scores)
+    attribution = attribute_pp_gain(daily, scores)
+    summary.unattributed = attribution.unattributed
+    for i in np.argsort(-attribution.gain, kind="stable")[:top]:
+        if attribution.gain[i] > 0:
+            summary.top_gains.append((int(scores.beatmap_id[i]), float(scores.pp[i]), float(attribution.gain[i])))
+    return summary
@@ -0,0 +1,292 @@
+"""Chart rendering (matplotlib) off the event loop, in worker processes.
+
+Renderers are module-level functions taking plain, picklable data –
+arrays of epoch-second timestamps and values, usually columns of a
+:mod:`src.analytics` frame – and returning PNG bytes, so they can run in
+a :class:`~concurrent.futures.ProcessPoolExecutor`. matplotlib is only
+imported where a chart is actually drawn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+RANK_COLORS = {
+    "XH": "#FFD700", "X": "#C0C0C0", "SH": "#FFD700", "S": "#C0C0C0",
+    "A": "#00FF00", "B": "#4169E1", "C": "#FF00FF", "D": "#FF0000", "F": "#808080",
+}
+RANK_MARKERS = {
+    "XH": "*", "X": "*", "SH": "D", "S": "D",
+    "A": "o", "B": "s", "C": "^", "D": "v", "F": "x",
+}
+
+
+# Figures are FIGURE_WIDTH inches wide at DPI; line series are downsampled
+# to one point per PIXELS_PER_POINT pixels of that width before plotting,
+# so drawing time does not grow with the length of the history.
+FIGURE_WIDTH = 12
+DPI = 150
+PIXELS_PER_POINT = 3
+MAX_POINTS = FIGURE_WIDTH * DPI // PIXELS_PER_POINT
+# Point markers are only drawn while they are still distinguishable.
+MARKER_LIMIT = 120
+
+
+class Series(NamedTuple):
+    """Parallel arrays of epoch-second timestamps and values."""
+    times: Sequence[float]
+    values: Sequence[float]
+
+
+class Scores(NamedTuple):
+    """Recorded scores for the PP scatter plot; *labels* may hold ``None``."""
+    times: Sequence[float]
+    pp: Sequence[float]
+    ranks: Sequence[str]
+    labels: Sequence[Optional[str]]
+
+
+# ----------------------------------------------------------------------
+# Renderers (run in worker processes)
+# ----------------------------------------------------------------------
+
+
+def _pyplot() -> Any:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _dates(times: Sequence[float]) -> Any:
+    import numpy as np
+    return (np.asarray(times, dtype=np.float64) * 1000).astype("datetime64[ms]")
+
+
+def _plot_line(ax: Any, series: Series, **kwargs: Any) -> None:
+    """Plot *series* as a line, downsampled to :data:`MAX_POINTS` (LTTB)."""
+    import numpy as np
+    from .analytics import lttb
+    times = np.asarray(series.times, dtype=np.float64)
+    values = np.asarray(series.values, dtype=np.float64)
+    keep = lttb(times, values, MAX_POINTS)
+    marker = {"marker": "o", "markersize": 4} if len(keep) <= MARKER_LIMIT else {}
+    ax.plot(_dates(times[keep]), values[keep], linewidth=2, **marker, **kwargs)
+
+
+def _date_axis(plt: Any, ax: Any, days: int) -> None:
+    import matplotlib.dates as mdates
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+    ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, days // 10)))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
+
+
+def _png(plt: Any, fig: Any) -> bytes:
+    plt.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=DPI, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def render_pp_chart(
+    username: str,
+    mode: str,
+    days: int,
+    pp: Series,
+    scores: Scores,
+) -> bytes:
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(FIGURE_WIDTH, 10))
+    fig.suptitle(f"{username} - {mode.upper()} Mode PP Statistics (Last {days} Days)",
+                 fontsize=16, fontweight="bold")
+
+    if len(pp.times):
+        _plot_line(ax1, pp, color="#FF66AA", label="PP")
+        ax1.set_xlabel("Date"); ax1.set_ylabel("PP")
+        ax1.set_title("PP Over Time", fontsize=14, fontweight="bold")
+        ax1.grid(True, alpha=0.3); ax1.legend()
+        _date_axis(plt, ax1, days)
+
+    if len(scores.times):
+        import numpy as np
+        dates, pps, ranks = _dates(scores.times), np.asarray(scores.pp), np.asarray(scores.ranks)
+        for rank in dict.fromkeys(ranks.tolist()):
+            mask = ranks == rank
+            ax2.scatter(dates[mask], pps[mask],
+                        c=RANK_COLORS.get(rank.upper(), "#808080"),
+                        marker=RANK_MARKERS.get(rank.upper(), "o"),
+                        s=100, alpha=0.6, label=f"Rank {rank}", edgecolors="black", linewidths=0.5)
+        for date, value, label in zip(dates, pps, scores.labels):
+            if label:
+                name = label if len(label) <= 40 else label[:39] + "…"
+                ax2.annotate(name, (date, value),
+                             textcoords="offset points", xytext=(6, 6), fontsize=7, alpha=0.8)
+        ax2.set_xlabel("Date"); ax2.set_ylabel("PP")
+        ax2.set_title("Score Performance (PP by Rank)", fontsize=14, fontweight="bold")
+        ax2.grid(True, alpha=0.3); ax2.legend(loc="upper left", fontsize=8, ncol=2)
+        _date_axis(plt, ax2, days)
+
+    return _png(plt, fig)
+
+
+def render_rank_chart(username: str, mode: str, days: int, ranks: Series) -> bytes:
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(FIGURE_WIDTH, 6))
+    fig.suptitle(f"{username} - {mode.upper()} Mode Rank Statistics (Last {days} Days)",
+                 fontsize=16, fontweight="bold")
+    if len(ranks.times):
+        _plot_line(ax, ranks, color="#66B2FF", label="Global Rank")
+        ax.set_xlabel("Date"); ax.set_ylabel("Rank")
+        ax.set_title("Global Rank Over Time", fontsize=14, fontweight="bold")
+        ax.grid(True, alpha=0.3); ax.legend()
+        ax.invert_yaxis()
+        _date_axis(plt, ax, days)
+    return _png(plt, fig)
+
+
+def render_accuracy_chart(username: str, mode: str, days: int, accuracy: Series) -> bytes:
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(FIGURE_WIDTH, 6))
+    fig.suptitle(f"{username} - {mode.upper()} Mode Accuracy Statistics (Last {days} Days)",
+                 fontsize=16, fontweight="bold")
+    if len(accuracy.times):
+        _plot_line(ax, accuracy, color="#FFB366", label="Accuracy")
+        ax.set_xlabel("Date"); ax.set_ylabel("Accuracy (%)")
+        ax.set_title("Accuracy Over Time", fontsize=14, fontweight="bold")
+        ax.grid(True, alpha=0.3); ax.legend()
+        low, high = min(accuracy.values), max(accuracy.values)
+        pad = (high - low) * 0.1 or 1
+        ax.set_ylim(low - pad, high + pad)
+        _date_axis(plt, ax, days)
+    return _png(plt, fig)
+
+
+def _init_worker() -> None:
+    _pyplot()
+
+
+def _timed(fn: Callable[..., bytes], submitted: float, *args: Any) -> tuple[float, bytes]:
+    # Wall-clock time is comparable across processes; monotonic is not.
+    started = time.time()
+    return started - submitted, fn(*args)
+
+
+# ----------------------------------------------------------------------
+# Executor
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class ChartRendererStats:
+    """Point-in-time view of a :class:`ChartRenderer`."""
+    workers: int = 0
+    pending: int = 0
+    rendered: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.rendered if self.rendered else 0.0
+
+
+class ChartRenderer:
+    """Run chart renderers on a bounded pool of *workers* processes.
+
+    Queue wait – the time a chart spends waiting for a free worker – is
+    tracked in :meth:`stats` and logged when it exceeds *warn_after*
+    seconds. Workers are spawned (not forked, the bot is multi-threaded)
+    when the first chart is rendered. With ``workers=0``, or if workers
+    cannot be started or the pool breaks, charts are rendered in a thread
+    instead, which still keeps the event loop free.
+    """
+
+    def __init__(self, workers: int = 2, *, warn_after: float = 2.0) -> None:
+        self.workers = max(workers, 0)
+        self._warn_after = warn_after
+        self._pool: Optional[Executor] = None
+        self._pending = 0
+        self._stats = ChartRendererStats(workers=self.workers)
+
+    def _executor(self) -> Optional[Executor]:
+        if self._pool is None and self.workers:
+            try:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            except (OSError, NotImplementedError, ImportError) as e:
+                # e.g. no working sem_open on this host
+                self._fall_back(None, e)
+        return self._pool
+
+    def _fall_back(self, pool: Optional[Executor], error: BaseException) -> None:
+        logger.warning("chart worker pool unavailable, rendering in a thread from now on: %s", error)
+        self.workers = 0
+        self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def render(self, fn: Callable[..., bytes], *args: Any) -> bytes:
+        """Render ``fn(*args)`` in a worker and return the PNG bytes."""
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            pool = self._executor()
+            result: Optional[tuple[float, bytes]] = None
+            try:
+                # Submitting spawns the workers on first use.
+                future = loop.run_in_executor(pool, _timed, fn, time.time(), *args)
+            except (BrokenProcessPool, OSError) as e:
+                self._fall_back(pool, e)
+            else:
+                try:
+                    result = await future
+                except BrokenProcessPool as e:
+                    self._fall_back(pool, e)
+            if result is None:
+                result = await loop.run_in_executor(None, _timed, fn, time.time(), *args)
+            waited, png = result
+        finally:
+            self._pending -= 1
+
+        stats = self._stats
+        stats.rendered += 1
+        stats.total_wait += waited
+        stats.last_wait = waited
+        stats.max_wait = max(stats.max_wait, waited)
+        if waited >= self._warn_after:
+            logger.warning(
+                "chart rendering saturated: waited %.1fs for a worker, %d still pending",
+                waited, self._pending,
+            )
+        return png
+
+    def stats(self) -> ChartRendererStats:
+        s = self._stats
+        return ChartRendererStats(
+            workers=self.workers,
+            pending=self._pending,
+            rendered=s.rendered,
+            total_wait=s.total_wait,
+            max_wait=s.max_wait,
+            last_wait=s.last_wait,
+        )
+
+    def close(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
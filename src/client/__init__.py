@@ -4,6 +4,7 @@ from .link_account import LinkAccountManager
 from .oauth_client import OAuthClient
 from .osu_client import OsuApiClient
 from .token_manager import TokenData, TokenManager
+from .user_index import UsernameIndex
 
 __all__ = [
     "LinkAccountManager",
@@ -11,4 +12,5 @@ __all__ = [
     "OsuApiClient",
     "TokenData",
     "TokenManager",
+    "UsernameIndex",
 ]
@@ -1,81 +1,126 @@
-"""Platform <-> osu! account linking (JSON persistence)."""
+"""Platform <-> osu! account linking."""
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
 
+from ..storage import Storage
 
-class LinkAccountManager:
-    """Bidirectional mapping between osu! IDs and platform user IDs."""
-
-    def __init__(self, data_dir: str) -> None:
-        self._path = os.path.join(data_dir, "osuaccount.json")
-        self._ensure_file()
-
-    # ------------------------------------------------------------------
+logger = logging.getLogger(__name__)
 
-    def _ensure_file(self) -> None:
-        if not os.path.exists(self._path):
-            os.makedirs(os.path.dirname(self._path), exist_ok=True)
-            self._write({"osu_to_platforms": {}, "platform_to_osu": {}})
 
-    def _read(self) -> dict:
+class LinkAccountManager:
+    """Bidirectional mapping between osu! IDs and platform user IDs.
+
+    Both directions are indexed in memory, loaded once at startup, so
+    lookups are O(1) dict reads. Links are persisted through the storage's
+    link methods (an indexed ``links`` table under SQLite); changes are
+    written through on a single worker thread, which keeps disk I/O off the
+    event loop while preserving write order; a failed write is logged and
+    the in-memory link stays in place. Links from a *legacy_file* (the old
+    ``osuaccount.json``) are imported once, the first time this storage is
+    used.
+    """
+
+    def __init__(self, storage: Storage, legacy_file: Optional[str] = None) -> None:
+        self._storage = storage
+        if legacy_file and not storage.get("osu_migrations", os.path.basename(legacy_file)):
+            self._import_legacy(legacy_file)
+        self._platform_to_osu: dict[str, str] = storage.links()
+        self._osu_to_platforms: dict[str, list[str]] = {}
+        for platform_id, osu_id in self._platform_to_osu.items():
+            self._osu_to_platforms.setdefault(osu_id, []).append(platform_id)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="osu-links")
+
+    def _import_legacy(self, path: str) -> None:
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
+            with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            data.setdefault("osu_to_platforms", {})
-            data.setdefault("platform_to_osu", {})
-            return data
         except (json.JSONDecodeError, FileNotFoundError):
-            self._ensure_file()
-            return {"osu_to_platforms": {}, "platform_to_osu": {}}
+            data = {}
+        with self._storage.transaction():
+            for platform_id, osu_id in data.get("platform_to_osu", {}).items():
+                self._storage.set_link(str(platform_id), str(osu_id))
+            self._storage.set("osu_migrations", os.path.basename(path), True)
 
-    def _write(self, data: dict) -> None:
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    # ------------------------------------------------------------------
+
+    def _persist(self, fn: Callable[..., Any], *args: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            fn(*args)
+            return
+        future = loop.run_in_executor(self._writer, fn, *args)
+        future.add_done_callback(lambda f, key=args[0]: self._write_done(f, key))
+
+    @staticmethod
+    def _write_done(future: asyncio.Future, platform_id: str) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("Failed to persist osu! link for %s: %s", platform_id, error, exc_info=error)
+
+    def _write_through(self, platform_id: str, osu_id: Optional[str]) -> None:
+        if osu_id is None:
+            self._persist(self._storage.delete_link, platform_id)
+        else:
+            self._persist(self._storage.set_link, platform_id, osu_id)
+
+    async def close(self) -> None:
+        """Wait for pending writes to reach the storage."""
+        await asyncio.to_thread(self._writer.shutdown, True)
 
     # ------------------------------------------------------------------
 
     def link(self, osu_id: Union[str, int], platform_id: Union[str, int]) -> bool:
         osu_id, platform_id = str(osu_id), str(platform_id)
-        data = self._read()
 
-        existing = data["platform_to_osu"].get(platform_id)
+        existing = self._platform_to_osu.get(platform_id)
         if existing and existing != osu_id:
             return False
 
-        platforms = data["osu_to_platforms"].setdefault(osu_id, [])
+        platforms = self._osu_to_platforms.setdefault(osu_id, [])
         if platform_id not in platforms:
             platforms.append(platform_id)
-        data["platform_to_osu"][platform_id] = osu_id
+        self._platform_to_osu[platform_id] = osu_id
 
-        self._write(data)
+        self._write_through(platform_id, osu_id)
         return True
 
     def unlink(self, platform_id: Union[str, int]) -> bool:
         platform_id = str(platform_id)
-        data = self._read()
 
-        osu_id = data["platform_to_osu"].pop(platform_id, None)
+        osu_id = self._platform_to_osu.pop(platform_id, None)
         if osu_id is None:
             return False
 
-        plist = data["osu_to_platforms"].get(osu_id, [])
+        plist = self._osu_to_platforms.get(osu_id, [])
         if platform_id in plist:
             plist.remove(platform_id)
         if not plist:
-            data["osu_to_platforms"].pop(osu_id, None)
+            self._osu_to_platforms.pop(osu_id, None)
 
-        self._write(data)
+        self._write_through(platform_id, None)
         return True
 
     def get_osu_id(self, platform_id: Union[str, int]) -> Optional[str]:
-        return self._read()["platform_to_osu"].get(str(platform_id))
+        return self._platform_to_osu.get(str(platform_id))
 
     def get_platform_ids(self, osu_id: Union[str, int]) -> list[str]:
-        return self._read()["osu_to_platforms"].get(str(osu_id), [])
+        """Platform users linked to *osu_id*, from the in-memory index.
+
+        The storage keeps the same mapping (see
+        :meth:`Storage.linked_platform_ids`), so the index can always be
+        rebuilt from it.
+        """
+        return list(self._osu_to_platforms.get(str(osu_id), []))
 
     def is_linked(self, platform_id: Union[str, int]) -> bool:
         return self.get_osu_id(platform_id) is not None
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import math
 import time
 import urllib.parse
 from typing import Any, Optional
 
+from ..net import DiskCache, HttpTransport, Priority, RateLimiter, ResponseCache, SingleFlight
 from ..osuapi import OsuApi
 from .token_manager import TokenData, TokenManager
 
+logger = logging.getLogger(__name__)
+
 
 class OAuthClient:
-    """Wraps the raw :class:`OsuApi` with per-platform-user token lifecycle."""
+    """Wraps the raw :class:`OsuApi` with per-platform-user token lifecycle.
+
+    At most one refresh per platform user is in flight; concurrent callers
+    share its outcome. :meth:`start_refresh_scheduler` additionally renews
+    tokens of recently active users *refresh_ahead* seconds before they
+    expire, in batches of *refresh_batch* on the background rate-limit
+    lane, so commands rarely wait on an OAuth round-trip.
+    """
 
     def __init__(
         self,
@@ -19,9 +32,30 @@ class OAuthClient:
         client_secret: str,
         redirect_uri: str,
         token_manager: TokenManager,
+        transport: Optional[HttpTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        *,
+        refresh_ahead: float = 900,
+        refresh_interval: float = 300,
+        refresh_batch: int = 5,
+        active_window: float = 3 * 24 * 3600,
     ) -> None:
-        self.api = OsuApi(client_id, client_secret, redirect_uri)
+        self.api = OsuApi(
+            client_id, client_secret, redirect_uri,
+            transport=transport, rate_limiter=rate_limiter,
+            cache=cache, disk_cache=disk_cache,
+        )
         self.token_manager = token_manager
+        self.refresh_ahead = refresh_ahead
+        self.refresh_interval = refresh_interval
+        self.refresh_batch = max(refresh_batch, 1)
+        self.active_window = active_window
+        self._refreshes = SingleFlight()
+        self._last_used: dict[str, float] = {}
+        self._retry_after: dict[str, float] = {}
+        self._scheduler: Optional[asyncio.Task] = None
 
     # ------------------------------------------------------------------
     # Authorization
@@ -50,6 +84,7 @@ class OAuthClient:
             scope=granted_scope,
         )
         self.token_manager.save(platform_id, token)
+        self._last_used[platform_id] = time.monotonic()
         return token
 
     # ------------------------------------------------------------------
@@ -61,13 +96,17 @@ class OAuthClient:
 
         Returns ``None`` when no usable token exists.
         """
+        self._last_used[platform_id] = time.monotonic()
         if self.token_manager.is_expired(platform_id):
-            refreshed = await self._refresh(platform_id)
+            refreshed = await self._refresh_once(platform_id)
             if not refreshed:
                 return None
         td = self.token_manager.get(platform_id)
         return td.access_token if td else None
 
+    async def _refresh_once(self, platform_id: str) -> bool:
+        return await self._refreshes.do(platform_id, lambda: self._refresh(platform_id))
+
     async def _refresh(self, platform_id: str) -> bool:
         td = self.token_manager.get(platform_id)
         if not td or not td.refresh_token:
@@ -86,6 +125,60 @@ class OAuthClient:
         except Exception:
             return False
 
+    # ------------------------------------------------------------------
+    # Background refresh
+    # ------------------------------------------------------------------
+
+    def start_refresh_scheduler(self) -> None:
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._refresh_loop())
+
+    async def stop_refresh_scheduler(self) -> None:
+        task, self._scheduler = self._scheduler, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                refreshed = await self.refresh_expiring()
+                if refreshed:
+                    logger.debug("Refreshed %d OAuth tokens ahead of expiry", refreshed)
+            except Exception as e:
+                logger.warning("Background token refresh failed: %s", e)
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh_expiring(self) -> int:
+        """Refresh tokens of active users that expire soon; return how many succeeded."""
+        now = time.monotonic()
+        due = [
+            platform_id for platform_id in self.token_manager.expiring(self.refresh_ahead)
+            if now - self._last_used.get(platform_id, -math.inf) < self.active_window
+            and self._retry_after.get(platform_id, 0) <= now
+        ]
+        refreshed = 0
+        for i in range(0, len(due), self.refresh_batch):
+            batch = due[i:i + self.refresh_batch]
+            results = await asyncio.gather(*(self._refresh_in_background(pid) for pid in batch))
+            refreshed += sum(results)
+        return refreshed
+
+    async def _refresh_in_background(self, platform_id: str) -> bool:
+        limiter = self.api.rate_limiter
+        if limiter is not None:
+            await limiter.acquire(Priority.BACKGROUND)
+        ok = await self._refresh_once(platform_id)
+        if ok:
+            self._retry_after.pop(platform_id, None)
+        else:
+            # A rejected refresh token will not recover soon; let the lazy path retry.
+            self._retry_after[platform_id] = time.monotonic() + self.refresh_interval * 12
+        return ok
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -101,14 +194,16 @@ class OAuthClient:
 
     def remove_token(self, platform_id: str) -> None:
         self.token_manager.remove(platform_id)
+        self._last_used.pop(platform_id, None)
+        self._retry_after.pop(platform_id, None)
 
     async def get_user_info(self, platform_id: str) -> Optional[dict[str, Any]]:
         """Fetch /me for *platform_id*."""
         token = await self.ensure_token(platform_id)
         if not token:
             return None
-        self.api.set_access_token(token)
-        return await self.api.get("me")
+        return await self.api.bind(token).get("me")
 
     async def close(self) -> None:
+        await self.stop_refresh_scheduler()
         await self.api.close()
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Union
-
-from ..osuapi import OsuClient, UserExtended, BeatmapExtended, BeatmapsetExtended, BeatmapsetSearchResult, Score, BeatmapScores, BeatmapUserScore
+import asyncio
+import copy
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+
+from ..net import Priority, ResponseCache
+from ..osuapi import BatchLoader, BoundOsuClient, CursorPaginator, OsuApiError, OsuClient, UserExtended, BeatmapExtended, BeatmapsetExtended, BeatmapsetSearchResult, Score, BeatmapScores, BeatmapUserScore
 from ..osuapi.enums import (
     BeatmapsetSearchCategory,
     BeatmapsetSearchExplicitContent,
@@ -14,6 +19,16 @@ from ..osuapi.enums import (
     Ruleset,
 )
 from .oauth_client import OAuthClient
+from .user_index import UsernameIndex
+
+logger = logging.getLogger(__name__)
+
+# Statuses meaning the token itself was rejected, not the lookup.
+_AUTH_ERROR_STATUSES = frozenset({401, 403})
+
+
+def _is_auth_error(error: Exception) -> bool:
+    return isinstance(error, OsuApiError) and error.status in _AUTH_ERROR_STATUSES
 
 
 class OsuApiClient:
@@ -22,57 +37,240 @@ class OsuApiClient:
     Every public method accepts a *platform_id* to select the right token.
     """
 
-    def __init__(self, oauth: OAuthClient) -> None:
+    def __init__(
+        self,
+        oauth: OAuthClient,
+        user_index: Optional[UsernameIndex] = None,
+        profile_fresh: float = 60,
+        profile_max_age: float = 0,
+    ) -> None:
         self._oauth = oauth
-        # We keep a shared OsuClient; before each call we swap in the
-        # correct access token.
+        self._user_index = user_index
+        # Stale-while-revalidate profiles: (UserExtended, fetched_at) per key,
+        # sized in entries. Disabled when profile_max_age is 0.
+        self._profile_fresh = profile_fresh
+        self._profile_max_age = profile_max_age
+        self._profiles = ResponseCache(2000) if profile_max_age > 0 else None
+        self._revalidating: dict[Hashable, asyncio.Task] = {}
+        # One shared OsuClient (and connection pool); each call goes through
+        # a per-token bound view so concurrent users never share a token.
         self._api = OsuClient(
             client_id=oauth.api.client_id,
             client_secret=oauth.api.client_secret,
             redirect_uri=oauth.api.redirect_uri,
+            transport=oauth.api.transport,
+            rate_limiter=oauth.api.rate_limiter,
+            cache=oauth.api.cache,
+            disk_cache=oauth.api.disk_cache,
+        )
+        self._priority = Priority.INTERACTIVE
+        self._fresh = False
+        # Individual id lookups arriving together become one users?ids[] call,
+        # sent with the first caller's token; if that token is rejected the
+        # other callers' lookups are retried with their own tokens.
+        self._user_loader: BatchLoader[tuple[int, str], UserExtended] = BatchLoader(
+            self._load_users, max_batch=50, retry_on=_is_auth_error,
         )
 
-    async def _set_token(self, platform_id: str) -> None:
+    def with_priority(self, priority: Priority) -> OsuApiClient:
+        """Return a view of this client whose calls use another rate-limit lane.
+
+        The view shares the underlying SDK client, tokens and connection pool.
+        """
+        view = copy.copy(self)
+        view._priority = priority
+        return view
+
+    def _fresh_view(self) -> OsuApiClient:
+        """A view whose requests skip the shared response cache."""
+        view = copy.copy(self)
+        view._fresh = True
+        return view
+
+    async def _bind(self, platform_id: str) -> BoundOsuClient:
         token = await self._oauth.ensure_token(platform_id)
         if not token:
             raise ValueError(f"没有有效的访问令牌 (platform_id={platform_id})，请先使用 /osu link 进行授权。")
-        self._api.set_access_token(token)
+        return self._api.bind(token, priority=self._priority, fresh=self._fresh)
 
     # ------------------------------------------------------------------
     # Users
     # ------------------------------------------------------------------
 
+    def _resolve_name(self, user: Union[int, str]) -> Union[int, str]:
+        """Swap a username for its indexed user ID when it is known."""
+        if self._user_index is None or not isinstance(user, str) or user.isdigit():
+            return user
+        if self._user_index.is_missing(user):
+            raise OsuApiError(404, f"User {user.lstrip('@')} not found")
+        user_id = self._user_index.lookup(user)
+        return user if user_id is None else user_id
+
+    def _index(self, users: Any) -> None:
+        if self._user_index is not None:
+            for u in users if isinstance(users, list) else [users]:
+                self._user_index.remember(u)
+
     async def get_user(
         self,
         platform_id: str,
         user: Union[int, str],
         mode: Optional[str] = None,
     ) -> UserExtended:
-        await self._set_token(platform_id)
+        api = await self._bind(platform_id)
+        resolved = self._resolve_name(user)
+        if resolved is not user:
+            # The indexed ID may be stale: the account was restricted or
+            # deleted, or the name now belongs to someone else.
+            try:
+                result = await api.users.get_user(resolved, mode=mode)
+            except OsuApiError as e:
+                if e.status != 404:
+                    raise
+                result = None
+            if result is not None:
+                self._index(result)
+                if self._user_index.matches(result, user):
+                    return result
+            self._user_index.forget(user)
         if isinstance(user, str) and not user.startswith("@") and not user.isdigit():
             user = f"@{user}"
-        return await self._api.users.get_user(user, mode=mode)
+        try:
+            result = await api.users.get_user(user, mode=mode)
+        except OsuApiError as e:
+            if e.status == 404 and isinstance(user, str) and self._user_index is not None:
+                self._user_index.remember_missing(user)
+            raise
+        self._index(result)
+        return result
+
+    async def get_user_brief(
+        self,
+        platform_id: str,
+        user: Union[int, str],
+        mode: Optional[str] = None,
+    ) -> UserExtended:
+        """Look up a user's compact profile (id, name, country, *mode* stats).
+
+        Numeric ids are batched with other concurrent lookups into a single
+        ``GET /users?ids[]`` request; the result lacks profile-only fields
+        such as badges or rank history, so user cards use :meth:`get_user`.
+        Names are first resolved through the username index; unknown ones
+        cannot be batched and fall back to :meth:`get_user`, as do indexed
+        names whose ID no longer belongs to a user of that name.
+        """
+        resolved = self._resolve_name(user)
+        if isinstance(resolved, str) and not resolved.isdigit():
+            return await self.get_user(platform_id, resolved, mode=mode)
+        api = await self._bind(platform_id)
+        result = await self._user_loader.load((int(resolved), mode or "osu"), api)
+        if resolved is not user and (result is None or not self._user_index.matches(result, user)):
+            self._user_index.forget(user)
+            return await self.get_user(platform_id, user, mode=mode)
+        if result is None:
+            raise OsuApiError(404, f"User {user} not found")
+        return result
+
+    async def _load_users(
+        self,
+        keys: list[tuple[int, str]],
+        api: BoundOsuClient,
+    ) -> dict[tuple[int, str], UserExtended]:
+        by_mode: dict[str, list[int]] = {}
+        for user_id, mode in keys:
+            by_mode.setdefault(mode, []).append(user_id)
+        results: dict[tuple[int, str], UserExtended] = {}
+        for mode, ids in by_mode.items():
+            users = await api.users.get_users(ids, mode=mode)
+            self._index(users)
+            for u in users:
+                results[(u.id, mode)] = u
+        return results
+
+    async def get_user_swr(
+        self,
+        platform_id: str,
+        user: Union[int, str],
+        mode: Optional[str] = None,
+    ) -> tuple[UserExtended, float]:
+        """:meth:`get_user` with stale-while-revalidate; see :meth:`_swr`."""
+        resolved = self._resolve_name(user)
+        key = ("user", str(resolved).lstrip("@").lower(), mode)
+        return await self._swr(key, lambda view: view.get_user(platform_id, user, mode))
+
+    async def get_own_data_swr(
+        self,
+        platform_id: str,
+        mode: Optional[str] = None,
+    ) -> tuple[UserExtended, float]:
+        """:meth:`get_own_data` with stale-while-revalidate; see :meth:`_swr`."""
+        key = ("me", platform_id, mode)
+        return await self._swr(key, lambda view: view.get_own_data(platform_id, mode))
+
+    async def _swr(
+        self,
+        key: Hashable,
+        fetch: Callable[[OsuApiClient], Awaitable[UserExtended]],
+    ) -> tuple[UserExtended, float]:
+        """Return ``(profile, fetched_at)``, answering from memory when possible.
+
+        A copy younger than *profile_max_age* is returned immediately; if it
+        is also older than *profile_fresh*, a background-lane refresh is
+        started so the next call sees fresh data. ``fetched_at`` is a Unix
+        timestamp callers can show as "as of"; the profile is always fetched
+        past the shared response cache, so it is the actual download time.
+        """
+        if self._profiles is None:
+            return await fetch(self._fresh_view()), time.time()
+        entry = self._profiles.get(key)
+        if entry is not None:
+            profile, fetched_at = entry
+            if time.time() - fetched_at > self._profile_fresh and key not in self._revalidating:
+                self._revalidating[key] = asyncio.create_task(self._revalidate(key, fetch))
+            return profile, fetched_at
+        profile = await fetch(self._fresh_view())
+        fetched_at = time.time()
+        self._profiles.set(key, (profile, fetched_at), self._profile_max_age, 1)
+        return profile, fetched_at
+
+    async def _revalidate(
+        self,
+        key: Hashable,
+        fetch: Callable[[OsuApiClient], Awaitable[UserExtended]],
+    ) -> None:
+        try:
+            profile = await fetch(self.with_priority(Priority.BACKGROUND)._fresh_view())
+            self._profiles.set(key, (profile, time.time()), self._profile_max_age, 1)
+        except Exception as e:
+            # Keep serving the stale copy; the next call retries.
+            logger.debug("background profile refresh failed for %s: %s", key, e)
+        finally:
+            self._revalidating.pop(key, None)
 
     async def get_users(
         self,
         platform_id: str,
         user_ids: list[Union[int, str]],
     ) -> list:
-        await self._set_token(platform_id)
+        api = await self._bind(platform_id)
         ids = [int(uid) if str(uid).isdigit() else uid for uid in user_ids]
-        return await self._api.users.get_users(ids)
+        users = await api.users.get_users(ids)
+        self._index(users)
+        return users
 
     async def get_own_data(
         self,
         platform_id: str,
         mode: Optional[str] = None,
     ) -> UserExtended:
-        await self._set_token(platform_id)
-        return await self._api.users.get_own_data(mode=mode)
+        api = await self._bind(platform_id)
+        result = await api.users.get_own_data(mode=mode)
+        self._index(result)
+        return result
 
     async def get_friends(self, platform_id: str) -> list:
-        await self._set_token(platform_id)
-        return await self._api.users.get_friends()
+        api = await self._bind(platform_id)
+        return await api.users.get_friends()
 
     async def get_user_scores(
         self,
@@ -85,8 +283,8 @@ class OsuApiClient:
         offset: Optional[int] = None,
         include_fails: Optional[int] = None,
     ) -> list[Score]:
-        await self._set_token(platform_id)
-        data = await self._api.users.get_user_scores(
+        api = await self._bind(platform_id)
+        data = await api.users.get_user_scores(
             user_id, score_type,
             mode=mode, limit=limit, offset=offset,
             include_fails=include_fails,
@@ -98,12 +296,31 @@ class OsuApiClient:
     # ------------------------------------------------------------------
 
     async def get_beatmap(self, platform_id: str, beatmap_id: int) -> BeatmapExtended:
-        await self._set_token(platform_id)
-        return await self._api.beatmaps.get_beatmap(beatmap_id)
+        api = await self._bind(platform_id)
+        return await api.beatmaps.get_beatmap(beatmap_id)
+
+    async def get_beatmaps_by_id(
+        self,
+        platform_id: str,
+        beatmap_ids: list[int],
+    ) -> dict[int, BeatmapExtended]:
+        """Resolve many beatmaps at once, 50 ids per ``GET /beatmaps`` request.
+
+        Duplicate and zero ids are dropped; ids the API does not return
+        (deleted or restricted maps) are simply missing from the result.
+        """
+        ids = list(dict.fromkeys(int(i) for i in beatmap_ids if i))
+        if not ids:
+            return {}
+        api = await self._bind(platform_id)
+        chunks = await asyncio.gather(*(
+            api.beatmaps.get_beatmaps(ids[i:i + 50]) for i in range(0, len(ids), 50)
+        ))
+        return {bm.id: bm for chunk in chunks for bm in chunk}
 
     async def get_beatmapset(self, platform_id: str, beatmapset_id: int) -> BeatmapsetExtended:
-        await self._set_token(platform_id)
-        return await self._api.beatmapsets.get_beatmapset(beatmapset_id)
+        api = await self._bind(platform_id)
+        return await api.beatmapsets.get_beatmapset(beatmapset_id)
 
     async def search_beatmapsets(
         self,
@@ -111,8 +328,8 @@ class OsuApiClient:
         query: Optional[str] = None,
         **kwargs: Any,
     ) -> BeatmapsetSearchResult:
-        await self._set_token(platform_id)
-        return await self._api.beatmapsets.search(query=query, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.beatmapsets.search(query=query, **kwargs)
 
     async def get_beatmap_scores(
         self,
@@ -121,8 +338,8 @@ class OsuApiClient:
         *,
         mode: Optional[str] = None,
     ) -> BeatmapScores:
-        await self._set_token(platform_id)
-        return await self._api.beatmaps.get_beatmap_scores(beatmap_id, mode=mode)
+        api = await self._bind(platform_id)
+        return await api.beatmaps.get_beatmap_scores(beatmap_id, mode=mode)
 
     async def get_user_beatmap_score(
         self,
@@ -132,8 +349,8 @@ class OsuApiClient:
         *,
         mode: Optional[str] = None,
     ) -> BeatmapUserScore:
-        await self._set_token(platform_id)
-        return await self._api.beatmaps.get_user_beatmap_score(beatmap_id, user_id, mode=mode)
+        api = await self._bind(platform_id)
+        return await api.beatmaps.get_user_beatmap_score(beatmap_id, user_id, mode=mode)
 
     # ------------------------------------------------------------------
     # Rankings
@@ -142,32 +359,32 @@ class OsuApiClient:
     async def get_ranking(
         self, platform_id: str, mode: str, type: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.rankings.get_ranking(mode, type, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.rankings.get_ranking(mode, type, **kwargs)
 
     async def get_kudosu_ranking(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.rankings.get_kudosu_ranking(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.rankings.get_kudosu_ranking(**kwargs)
 
     async def get_spotlights(self, platform_id: str) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.rankings.get_spotlights()
+        api = await self._bind(platform_id)
+        return await api.rankings.get_spotlights()
 
     # ------------------------------------------------------------------
     # Scores
     # ------------------------------------------------------------------
 
     async def get_score(self, platform_id: str, score_id: int) -> Score:
-        await self._set_token(platform_id)
-        return await self._api.scores.get_score(score_id)
+        api = await self._bind(platform_id)
+        return await api.scores.get_score(score_id)
 
     async def get_scores_stream(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.scores.get_scores(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.scores.get_scores(**kwargs)
 
     # ------------------------------------------------------------------
     # Matches
@@ -176,14 +393,14 @@ class OsuApiClient:
     async def get_matches(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.matches.get_matches(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.matches.get_matches(**kwargs)
 
     async def get_match(
         self, platform_id: str, match_id: int, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.matches.get_match(match_id, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.matches.get_match(match_id, **kwargs)
 
     # ------------------------------------------------------------------
     # Beatmap Packs
@@ -192,14 +409,14 @@ class OsuApiClient:
     async def get_beatmap_packs(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.beatmaps.get_beatmap_packs(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.beatmaps.get_beatmap_packs(**kwargs)
 
     async def get_beatmap_pack(
         self, platform_id: str, pack: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.beatmaps.get_beatmap_pack(pack, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.beatmaps.get_beatmap_pack(pack, **kwargs)
 
     # ------------------------------------------------------------------
     # Changelog
@@ -208,20 +425,27 @@ class OsuApiClient:
     async def get_changelog_build(
         self, platform_id: str, stream: str, build: str,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.changelog.get_changelog_build(stream, build)
+        api = await self._bind(platform_id)
+        return await api.changelog.get_changelog_build(stream, build)
 
     async def get_changelog_listing(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.changelog.get_changelog_listing(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.changelog.get_changelog_listing(**kwargs)
+
+    async def iter_changelog_builds(
+        self, platform_id: str, **kwargs: Any,
+    ) -> CursorPaginator:
+        """Changelog builds across pages; see :meth:`ChangelogEndpoint.iter_changelog_builds`."""
+        api = await self._bind(platform_id)
+        return api.changelog.iter_changelog_builds(**kwargs)
 
     async def lookup_changelog_build(
         self, platform_id: str, changelog: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.changelog.lookup_changelog_build(changelog, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.changelog.lookup_changelog_build(changelog, **kwargs)
 
     # ------------------------------------------------------------------
     # Comments
@@ -230,14 +454,14 @@ class OsuApiClient:
     async def get_comments(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.comments.get_comments(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.comments.get_comments(**kwargs)
 
     async def get_comment(
         self, platform_id: str, comment_id: int,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.comments.get_comment(comment_id)
+        api = await self._bind(platform_id)
+        return await api.comments.get_comment(comment_id)
 
     # ------------------------------------------------------------------
     # Events
@@ -246,8 +470,15 @@ class OsuApiClient:
     async def get_events(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.events.get_events(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.events.get_events(**kwargs)
+
+    async def iter_events(
+        self, platform_id: str, **kwargs: Any,
+    ) -> CursorPaginator:
+        """Events across pages; see :meth:`EventsEndpoint.iter_events`."""
+        api = await self._bind(platform_id)
+        return api.events.iter_events(**kwargs)
 
     # ------------------------------------------------------------------
     # News
@@ -256,14 +487,14 @@ class OsuApiClient:
     async def get_news_listing(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.news.get_news_listing(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.news.get_news_listing(**kwargs)
 
     async def get_news_post(
         self, platform_id: str, news: Union[int, str], **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.news.get_news_post(news, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.news.get_news_post(news, **kwargs)
 
     # ------------------------------------------------------------------
     # Wiki
@@ -272,8 +503,8 @@ class OsuApiClient:
     async def get_wiki_page(
         self, platform_id: str, locale: str, path: str,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.wiki.get_wiki_page(locale, path)
+        api = await self._bind(platform_id)
+        return await api.wiki.get_wiki_page(locale, path)
 
     # ------------------------------------------------------------------
     # Search
@@ -282,8 +513,8 @@ class OsuApiClient:
     async def search_site(
         self, platform_id: str, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.search.search(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.search.search(**kwargs)
 
     # ------------------------------------------------------------------
     # Multiplayer
@@ -292,28 +523,28 @@ class OsuApiClient:
     async def get_rooms(
         self, platform_id: str, **kwargs: Any,
     ) -> Any:
-        await self._set_token(platform_id)
-        return await self._api.multiplayer.get_rooms(**kwargs)
+        api = await self._bind(platform_id)
+        return await api.multiplayer.get_rooms(**kwargs)
 
     async def get_room(
         self, platform_id: str, room_id: int,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.multiplayer.get_room(room_id)
+        api = await self._bind(platform_id)
+        return await api.multiplayer.get_room(room_id)
 
     async def get_playlist_scores(
         self, platform_id: str, room_id: int, playlist_id: int, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.multiplayer.get_playlist_scores(
+        api = await self._bind(platform_id)
+        return await api.multiplayer.get_playlist_scores(
             room_id, playlist_id, **kwargs
         )
 
     async def get_room_leaderboard(
         self, platform_id: str, room_id: int,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.multiplayer.get_room_leaderboard(room_id)
+        api = await self._bind(platform_id)
+        return await api.multiplayer.get_room_leaderboard(room_id)
 
     # ------------------------------------------------------------------
     # Teams
@@ -322,8 +553,8 @@ class OsuApiClient:
     async def get_team(
         self, platform_id: str, team: Union[int, str], **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.teams.get_team(team, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.teams.get_team(team, **kwargs)
 
     # ------------------------------------------------------------------
     # Users (additional)
@@ -332,14 +563,14 @@ class OsuApiClient:
     async def get_user_beatmaps_passed(
         self, platform_id: str, user_id: int, **kwargs: Any,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.users.get_user_beatmaps_passed(user_id, **kwargs)
+        api = await self._bind(platform_id)
+        return await api.users.get_user_beatmaps_passed(user_id, **kwargs)
 
     async def get_beatmapset_favourites(
         self, platform_id: str,
     ) -> list[dict[str, Any]]:
-        await self._set_token(platform_id)
-        return await self._api.users.get_beatmapset_favourites()
+        api = await self._bind(platform_id)
+        return await api.users.get_beatmapset_favourites()
 
     # ------------------------------------------------------------------
     # Misc
@@ -348,12 +579,12 @@ class OsuApiClient:
     async def get_seasonal_backgrounds(
         self, platform_id: str,
     ) -> dict[str, Any]:
-        await self._set_token(platform_id)
-        return await self._api.misc.get_seasonal_backgrounds()
+        api = await self._bind(platform_id)
+        return await api.misc.get_seasonal_backgrounds()
 
     async def get_tags(self, platform_id: str) -> list[dict[str, Any]]:
-        await self._set_token(platform_id)
-        return await self._api.misc.get_tags()
+        api = await self._bind(platform_id)
+        return await api.misc.get_tags()
 
     # ------------------------------------------------------------------
     # Token helpers (delegated)
@@ -366,4 +597,6 @@ class OsuApiClient:
         return self._oauth.has_scope(platform_id, scope)
 
     async def close(self) -> None:
+        for task in list(self._revalidating.values()):
+            task.cancel()
         await self._api.close()
@@ -1,13 +1,14 @@
-"""Per-user token persistence (JSON file)."""
+"""Per-user token persistence (in memory, flushed to a storage backend)."""
 
 from __future__ import annotations
 
-import json
-import os
+import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 
+from ..storage import Storage
+
 
 @dataclass
 class TokenData:
@@ -19,63 +20,101 @@ class TokenData:
 
 
 class TokenManager:
-    """Read / write per-platform-user OAuth tokens to a JSON file."""
-
-    def __init__(self, data_dir: str) -> None:
-        self._path = os.path.join(data_dir, "osu_tokens.json")
-        self._ensure_file()
+    """Per-platform-user OAuth tokens, held in memory and persisted to *storage*.
+
+    Tokens are loaded once at startup; lookups never touch the storage.
+    Changes are flushed by a debounced background write that commits every
+    token changed since the last flush in one storage transaction, off the
+    event loop. Call :meth:`flush` on shutdown to persist pending changes.
+    """
+
+    NAMESPACE = "osu_tokens"
+
+    def __init__(self, storage: Storage, flush_delay: float = 1.0) -> None:
+        self._storage = storage
+        self._flush_delay = flush_delay
+        self._tokens: dict[str, TokenData] = {}
+        self._dirty: set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        for platform_id, entry in storage.items(self.NAMESPACE).items():
+            self._tokens[platform_id] = TokenData(
+                access_token=entry["access_token"],
+                refresh_token=entry["refresh_token"],
+                expires_at=entry["expires_at"],
+                token_type=entry.get("token_type", "Bearer"),
+                scope=entry.get("scope", "public identify"),
+            )
 
     # ------------------------------------------------------------------
 
-    def _ensure_file(self) -> None:
-        if not os.path.exists(self._path):
-            os.makedirs(os.path.dirname(self._path), exist_ok=True)
-            self._write({})
-
-    def _read(self) -> dict:
+    def _take_changes(self) -> dict[str, Optional[dict]]:
+        changes = {}
+        for platform_id in self._dirty:
+            token = self._tokens.get(platform_id)
+            changes[platform_id] = asdict(token) if token is not None else None
+        self._dirty.clear()
+        return changes
+
+    def _write(self, changes: dict[str, Optional[dict]]) -> None:
+        with self._storage.transaction():
+            for platform_id, entry in changes.items():
+                if entry is None:
+                    self._storage.delete(self.NAMESPACE, platform_id)
+                else:
+                    self._storage.set(self.NAMESPACE, platform_id, entry)
+
+    def _changed(self, platform_id: str) -> None:
+        self._dirty.add(platform_id)
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            self._ensure_file()
-            return {}
-
-    def _write(self, data: dict) -> None:
-        with open(self._path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._take_changes())
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self._flush_delay)
+        await self._flush_now()
+
+    async def _flush_now(self) -> None:
+        async with self._write_lock:
+            # Collect at write time so every change made meanwhile is included.
+            changes = self._take_changes()
+            if changes:
+                await asyncio.to_thread(self._write, changes)
+
+    async def flush(self) -> None:
+        """Persist pending changes immediately."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+        await self._flush_now()
 
     # ------------------------------------------------------------------
 
     def save(self, platform_id: str, token: TokenData) -> None:
-        tokens = self._read()
-        tokens[platform_id] = {
-            "access_token": token.access_token,
-            "refresh_token": token.refresh_token,
-            "expires_at": token.expires_at,
-            "token_type": token.token_type,
-            "scope": token.scope,
-        }
-        self._write(tokens)
+        self._tokens[platform_id] = token
+        self._changed(platform_id)
 
     def get(self, platform_id: str) -> Optional[TokenData]:
-        entry = self._read().get(platform_id)
-        if not entry:
-            return None
-        return TokenData(
-            access_token=entry["access_token"],
-            refresh_token=entry["refresh_token"],
-            expires_at=entry["expires_at"],
-            token_type=entry.get("token_type", "Bearer"),
-            scope=entry.get("scope", "public identify"),
-        )
+        return self._tokens.get(platform_id)
 
     def is_expired(self, platform_id: str) -> bool:
-        token = self.get(platform_id)
+        token = self._tokens.get(platform_id)
         if not token:
             return True
         return time.time() >= (token.expires_at - 300)
 
+    def expiring(self, within: float) -> list[str]:
+        """Platform IDs of refreshable tokens that expire within *within* seconds."""
+        deadline = time.time() + within
+        return [
+            platform_id for platform_id, token in self._tokens.items()
+            if token.refresh_token and token.expires_at <= deadline
+        ]
+
     def remove(self, platform_id: str) -> None:
-        tokens = self._read()
-        tokens.pop(platform_id, None)
-        self._write(tokens)
+        if self._tokens.pop(platform_id, None) is not None:
+            self._changed(platform_id)
@@ -0,0 +1,193 @@
+"""Username -> osu! user ID index (persisted through a storage backend)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from ..storage import Storage
+
+
+class UsernameIndex:
+    """Bounded, persistent name -> id map so name lookups skip ``users/@name``.
+
+    Current usernames and ``previous_usernames`` are both indexed; a
+    previous name never overrides another user's current one. Entries are
+    trusted for *max_age* seconds (names can be released and reused) and
+    the least recently used ones are dropped beyond *max_entries*. Names
+    the API reported as not found are remembered in memory for
+    *negative_ttl* seconds, at most *max_missing* of them.
+
+    The index is loaded from *storage* once at startup. Changed names are
+    flushed by a debounced background write at most every *save_interval*
+    seconds, in one storage transaction off the event loop; changes made
+    without a running loop wait for the next :meth:`flush`, which should
+    also be called on shutdown. A *legacy_file* (the old
+    ``osu_usernames.json``) is imported once.
+    """
+
+    NAMESPACE = "osu_username_index"
+
+    def __init__(
+        self,
+        storage: Storage,
+        legacy_file: Optional[str] = None,
+        *,
+        max_entries: int = 5000,
+        max_age: float = 30 * 24 * 3600,
+        negative_ttl: float = 300,
+        max_missing: int = 1000,
+        save_interval: float = 30,
+    ) -> None:
+        self._storage = storage
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.negative_ttl = negative_ttl
+        self.max_missing = max_missing
+        self.save_interval = save_interval
+        if legacy_file and not storage.get("osu_migrations", os.path.basename(legacy_file)):
+            self._import_legacy(legacy_file)
+        # name -> [user_id, confirmed_at, is_current_name], least recently used first
+        entries = [
+            (name, entry) for name, entry in storage.items(self.NAMESPACE).items()
+            if isinstance(entry, list) and len(entry) == 3
+        ]
+        entries.sort(key=lambda item: item[1][1])
+        self._names: OrderedDict[str, list[Any]] = OrderedDict(entries)
+        # name -> expiry; ordered by expiry since every entry has the same TTL
+        self._missing: OrderedDict[str, float] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+
+    def _import_legacy(self, path: str) -> None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            data = {}
+        with self._storage.transaction():
+            self._storage.set_many(self.NAMESPACE, data.get("names", {}))
+            self._storage.set("osu_migrations", os.path.basename(path), True)
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().lstrip("@").lower()
+
+    def _take_changes(self) -> dict[str, Optional[list[Any]]]:
+        # Entries are replaced, never mutated, so they are safe to hand over.
+        changes = {name: self._names.get(name) for name in self._dirty}
+        self._dirty.clear()
+        return changes
+
+    def _write(self, changes: dict[str, Optional[list[Any]]]) -> None:
+        with self._storage.transaction():
+            for name, entry in changes.items():
+                if entry is None:
+                    self._storage.delete(self.NAMESPACE, name)
+                else:
+                    self._storage.set(self.NAMESPACE, name, entry)
+
+    def _changed(self, *names: str) -> None:
+        self._dirty.update(names)
+        while len(self._names) > self.max_entries:
+            self._dirty.add(self._names.popitem(last=False)[0])
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(self.save_interval)
+        await self._flush_now()
+
+    async def _flush_now(self) -> None:
+        async with self._write_lock:
+            # Collect at write time so every change made meanwhile is included.
+            changes = self._take_changes()
+            if changes:
+                await asyncio.to_thread(self._write, changes)
+
+    async def flush(self) -> None:
+        """Persist pending changes immediately."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+        await self._flush_now()
+
+    # ------------------------------------------------------------------
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the cached user ID for *name*, if known and fresh."""
+        key = self._key(name)
+        entry = self._names.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[1] > self.max_age:
+            del self._names[key]
+            self._changed(key)
+            return None
+        self._names.move_to_end(key)
+        return int(entry[0])
+
+    def is_missing(self, name: str) -> bool:
+        """Whether *name* was recently reported as not found."""
+        key = self._key(name)
+        expires = self._missing.get(key)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            del self._missing[key]
+            return False
+        return True
+
+    def remember_missing(self, name: str) -> None:
+        key = self._key(name)
+        now = time.monotonic()
+        self._missing.pop(key, None)
+        self._missing[key] = now + self.negative_ttl
+        # Oldest first: drop what has expired, then whatever exceeds the cap.
+        while self._missing and next(iter(self._missing.values())) <= now:
+            self._missing.popitem(last=False)
+        while len(self._missing) > self.max_missing:
+            self._missing.popitem(last=False)
+
+    def remember(self, user: Any) -> None:
+        """Index a user object's current and previous usernames."""
+        user_id = getattr(user, "id", 0)
+        username = getattr(user, "username", "")
+        if not user_id or not username:
+            return
+        now = time.time()
+        key = self._key(username)
+        self._names[key] = [user_id, now, True]
+        self._names.move_to_end(key)
+        self._missing.pop(key, None)
+        changed = [key]
+        for old in getattr(user, "previous_usernames", None) or []:
+            old_key = self._key(old)
+            entry = self._names.get(old_key)
+            if entry is not None and entry[2] and entry[0] != user_id:
+                continue
+            self._names[old_key] = [user_id, now, False]
+            changed.append(old_key)
+        self._changed(*changed)
+
+    def forget(self, name: str) -> None:
+        """Drop *name*, e.g. when its user was deleted or renamed."""
+        key = self._key(name)
+        if self._names.pop(key, None) is not None:
+            self._changed(key)
+
+    def matches(self, user: Any, name: str) -> bool:
+        """Whether *name* is *user*'s current or a previous username."""
+        names = [getattr(user, "username", "")] + list(getattr(user, "previous_usernames", None) or [])
+        return self._key(name) in {self._key(n) for n in names if n}
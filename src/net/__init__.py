@@ -0,0 +1,27 @@
+"""Shared networking layer used by every plugin HTTP client."""
+
+from . import codec
+from .cache import CacheStats, ResponseCache
+from .diskcache import DiskCache
+from .ratelimit import Priority, RateLimiter, RateLimiterStats
+from .retry import IDEMPOTENT_METHODS, NO_RETRY, RetryPolicy, parse_retry_after
+from .singleflight import SingleFlight
+from .transport import HttpTransport, RawResponse, TransportConfig
+
+__all__ = [
+    "codec",
+    "CacheStats",
+    "ResponseCache",
+    "DiskCache",
+    "Priority",
+    "RateLimiter",
+    "RateLimiterStats",
+    "IDEMPOTENT_METHODS",
+    "NO_RETRY",
+    "RetryPolicy",
+    "parse_retry_after",
+    "SingleFlight",
+    "HttpTransport",
+    "RawResponse",
+    "TransportConfig",
+]
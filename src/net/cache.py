@@ -0,0 +1,99 @@
+"""Memory-bounded TTL + LRU cache for decoded API responses."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+
+@dataclass
+class CacheStats:
+    """Point-in-time view of a :class:`ResponseCache`."""
+    entries: int = 0
+    size: int = 0
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """LRU cache bounded by the byte size of the cached payloads.
+
+    Each entry carries its own expiry; expired entries count as misses and
+    are dropped lazily. The size of an entry is what the caller reports
+    (normally the length of the raw response body), so the budget tracks
+    what was downloaded rather than Python object overhead. Cached values
+    are shared by reference and must be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 32 * 1024 * 1024) -> None:
+        self.max_size = max(int(max_size), 0)
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._size = 0
+        self._stats = CacheStats(max_size=self.max_size)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for *key*, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        expires, size, value = entry
+        if expires <= time.monotonic():
+            self._drop(key, size)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int) -> None:
+        """Store *value* for *ttl* seconds, evicting LRU entries over budget."""
+        if ttl <= 0 or size > self.max_size:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old[1]
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._size += size
+        while self._size > self.max_size:
+            lru, (_, lru_size, _) = next(iter(self._entries.items()))
+            self._drop(lru, lru_size)
+            self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._drop(key, entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _drop(self, key: Hashable, size: int) -> None:
+        del self._entries[key]
+        self._size -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            entries=len(self._entries),
+            size=self._size,
+            max_size=self.max_size,
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+        )
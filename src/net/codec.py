@@ -0,0 +1,74 @@
+"""JSON decoding backend: orjson or msgspec when installed, stdlib otherwise.
+
+Large API payloads (``/scores``, beatmapset search, rankings, match event
+logs) make JSON decoding the dominant CPU cost during bursts. Both optional
+backends decode straight from ``bytes`` and are several times faster than
+:mod:`json`; neither is a hard dependency.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+Decoder = Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_loads(data: Union[bytes, str]) -> Any:
+    return json.loads(data)
+
+
+def _msgspec_decoder() -> Decoder:
+    decode = msgspec.json.Decoder().decode
+
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            # Callers expect json.JSONDecodeError's ValueError contract.
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def available_backends() -> dict[str, Decoder]:
+    """Installed decoders, fastest first."""
+    backends: dict[str, Decoder] = {}
+    if orjson is not None:
+        backends["orjson"] = orjson.loads
+    if msgspec is not None:
+        backends["msgspec"] = _msgspec_decoder()
+    backends["json"] = _stdlib_loads
+    return backends
+
+
+_backend_name, _loads = next(iter(available_backends().items()))
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the active backend."""
+    return _loads(data)
+
+
+def backend() -> str:
+    """Name of the active backend (``orjson``, ``msgspec`` or ``json``)."""
+    return _backend_name
+
+
+def set_backend(name: str) -> None:
+    """Force a specific backend, e.g. to compare them or rule one out."""
+    global _backend_name, _loads
+    backends = available_backends()
+    if name not in backends:
+        raise ValueError(f"JSON backend {name!r} is not installed (have: {', '.join(backends)})")
+    _backend_name, _loads = name, backends[name]
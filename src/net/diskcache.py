@@ -0,0 +1,99 @@
+"""SQLite-backed persistent cache for API objects that (almost) never change."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key     TEXT PRIMARY KEY,
+    body    BLOB NOT NULL,
+    stored  REAL NOT NULL,
+    expires REAL
+)
+"""
+
+
+class DiskCache:
+    """Raw response bodies stored zlib-compressed in one SQLite file.
+
+    Entries with ``expires`` of ``NULL`` live forever (e.g. ranked beatmaps,
+    finished matches); others are ignored once expired and purged when the
+    cache is opened. All SQLite work runs in a worker thread so the event
+    loop never blocks on disk I/O.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.execute(
+                "DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time(),),
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body FROM responses WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return zlib.decompress(row[0]) if row else None
+
+    def _set(self, key: str, body: bytes, ttl: Optional[float]) -> None:
+        now = time.time()
+        blob = zlib.compress(body, 6)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored, expires) VALUES (?, ?, ?, ?)",
+                (key, blob, now, None if ttl is None or math.isinf(ttl) else now + ttl),
+            )
+            conn.commit()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the raw body stored under *key*, or ``None``."""
+        try:
+            body = await asyncio.to_thread(self._get, key)
+        except (sqlite3.Error, zlib.error) as e:
+            logger.warning("disk cache read failed for %s: %s", key, e)
+            body = None
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    async def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        """Store *body* for *ttl* seconds (``None`` or ``inf`` = never expires)."""
+        try:
+            await asyncio.to_thread(self._set, key, body, ttl)
+        except sqlite3.Error as e:
+            logger.warning("disk cache write failed for %s: %s", key, e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,158 @@
+"""Client-side token-bucket rate limiting with priority lanes."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request lanes; lower values are served first."""
+    INTERACTIVE = 0
+    TOOL = 1
+    BACKGROUND = 2
+
+
+@dataclass
+class RateLimiterStats:
+    """Point-in-time view of a :class:`RateLimiter`."""
+    rate_per_minute: float = 0.0
+    tokens: float = 0.0
+    queued: dict[str, int] = field(default_factory=dict)
+    granted: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self.queued.values())
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.delayed if self.delayed else 0.0
+
+
+class RateLimiter:
+    """Token bucket shared by every client using one API credential.
+
+    Tokens refill continuously at *rate_per_minute*; up to *burst* tokens
+    may accumulate while idle. When the bucket is empty, callers queue and
+    are released strictly by :class:`Priority`, then FIFO within a lane, so
+    background polling never delays a user waiting on a command.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[int] = None,
+        *,
+        warn_after: float = 5.0,
+    ) -> None:
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate_per_minute = rate_per_minute
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(max(burst if burst is not None else int(rate_per_minute // 6), 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._warn_after = warn_after
+        self._stats = RateLimiterStats(rate_per_minute=rate_per_minute)
+
+    # ------------------------------------------------------------------
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        if self._timer is not None or not self._waiters:
+            return
+        self._refill()
+        delay = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():  # cancelled while queued
+                continue
+            self._tokens -= 1
+            fut.set_result(None)
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        self._schedule()
+
+    # ------------------------------------------------------------------
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> float:
+        """Wait for one request slot. Returns the time spent waiting."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._stats.granted += 1
+            self._stats.last_wait = 0.0
+            return 0.0
+
+        start = time.monotonic()
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), fut))
+        self._schedule()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._tokens += 1  # slot was granted but never used
+            raise
+
+        waited = time.monotonic() - start
+        stats = self._stats
+        stats.granted += 1
+        stats.delayed += 1
+        stats.total_wait += waited
+        stats.last_wait = waited
+        stats.max_wait = max(stats.max_wait, waited)
+        if waited >= self._warn_after:
+            logger.warning(
+                "osu! API rate limit saturated: waited %.1fs (%s lane), %d still queued",
+                waited, Priority(priority).name.lower(), self.queue_depth,
+            )
+        return waited
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of queue depth and wait-time counters."""
+        self._refill()
+        queued = {p.name.lower(): 0 for p in Priority}
+        for prio, _, fut in self._waiters:
+            if not fut.done():
+                queued[Priority(prio).name.lower()] += 1
+        s = self._stats
+        return RateLimiterStats(
+            rate_per_minute=self.rate_per_minute,
+            tokens=self._tokens,
+            queued=queued,
+            granted=s.granted,
+            delayed=s.delayed,
+            total_wait=s.total_wait,
+            max_wait=s.max_wait,
+            last_wait=s.last_wait,
+        )
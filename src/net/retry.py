@@ -0,0 +1,109 @@
+"""Retry policy with jittered exponential backoff and Retry-After support."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import email.utils
+import fnmatch
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Mapping, Optional
+
+import aiohttp
+
+from .transport import RawResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before replaying a failed request.
+
+    Only methods in *methods* are replayed (idempotent ones by default).
+    *overrides* maps endpoint glob patterns (e.g. ``"beatmaps/*/attributes"``)
+    to the policy used for matching endpoints instead of this one.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    max_retry_after: float = 30.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    overrides: Mapping[str, RetryPolicy] = field(default_factory=dict)
+
+    def replace(self, **changes) -> RetryPolicy:
+        return dataclasses.replace(self, **changes)
+
+    def for_endpoint(self, endpoint: str) -> RetryPolicy:
+        endpoint = endpoint.lstrip("/")
+        for pattern, policy in self.overrides.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return policy
+        return self
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay after the *attempt*-th failure."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    async def run(
+        self,
+        method: str,
+        endpoint: str,
+        send: Callable[[], Awaitable[RawResponse]],
+    ) -> RawResponse:
+        """Call *send* until it succeeds or the policy gives up.
+
+        Returns the last response even when its status is an error, so the
+        caller can raise its own exception type. Network errors are re-raised
+        once attempts are exhausted.
+        """
+        policy = self.for_endpoint(endpoint)
+        replayable = method.upper() in policy.methods
+        attempt = 0
+        while True:
+            attempt += 1
+            can_retry = replayable and attempt < policy.max_attempts
+            try:
+                resp = await send()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not can_retry:
+                    raise
+                delay = policy.backoff(attempt)
+                logger.debug("%s %s failed (%r), retrying in %.2fs", method, endpoint, e, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if resp.status not in policy.retry_statuses or not can_retry:
+                return resp
+            delay = policy.backoff(attempt)
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > policy.max_retry_after:
+                    return resp
+                delay = max(delay, retry_after)
+            logger.debug("%s %s returned %d, retrying in %.2fs", method, endpoint, resp.status, delay)
+            await asyncio.sleep(delay)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,44 @@
+"""Coalesce identical concurrent calls into one in-flight request."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; later callers share its result.
+
+    The shared call runs as its own task, so cancelling one waiter never
+    cancels the request the others are waiting on. Results are shared by
+    reference and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+            self.started += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,97 @@
+"""One tuned aiohttp session shared by all plugin clients."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import aiohttp
+from multidict import CIMultiDictProxy
+
+from . import codec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RawResponse:
+    """A fully-read HTTP response, detached from its connection."""
+    status: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+
+    @classmethod
+    async def read(cls, resp: aiohttp.ClientResponse) -> RawResponse:
+        return cls(resp.status, resp.headers, await resp.read())
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return codec.loads(self.body) if self.body else None
+
+    def error_message(self) -> str:
+        """Best-effort readable error payload (JSON repr or raw text)."""
+        try:
+            return str(self.json())
+        except ValueError:
+            return self.text()
+
+
+@dataclass
+class TransportConfig:
+    """Connection-pool settings for :class:`HttpTransport`."""
+    pool_size: int = 100
+    pool_size_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    request_timeout: float = 30.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> TransportConfig:
+        """Build from the plugin config, falling back to defaults."""
+        default = cls()
+        return cls(
+            pool_size=max(int(config.get("http_pool_size", default.pool_size)), 1),
+            pool_size_per_host=max(int(config.get("http_pool_size_per_host", default.pool_size_per_host)), 1),
+            keepalive_timeout=max(float(config.get("http_keepalive_timeout", default.keepalive_timeout)), 0.0),
+            dns_cache_ttl=max(int(config.get("http_dns_cache_ttl", default.dns_cache_ttl)), 0),
+            request_timeout=max(float(config.get("http_request_timeout", default.request_timeout)), 1.0),
+        )
+
+
+class HttpTransport:
+    """Owns the single :class:`aiohttp.ClientSession` every client shares.
+
+    Clients receive the transport instead of creating their own sessions, so
+    the plugin pays for one DNS cache and one keep-alive pool no matter how
+    many SDK clients are alive. Clients never close the shared session; the
+    owner calls :meth:`close` on shutdown.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None) -> None:
+        self.config = config or TransportConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            cfg = self.config
+            connector = aiohttp.TCPConnector(
+                limit=cfg.pool_size,
+                limit_per_host=cfg.pool_size_per_host,
+                keepalive_timeout=cfg.keepalive_timeout,
+                ttl_dns_cache=cfg.dns_cache_ttl or None,
+                use_dns_cache=cfg.dns_cache_ttl > 0,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=cfg.request_timeout),
+            )
+            logger.debug("Created shared HTTP session: %s", cfg)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self._session = None
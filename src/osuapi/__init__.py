@@ -9,7 +9,29 @@ Usage::
     user = await api.users.get_user(2)
 """
 
-from .api import OsuApi, OsuApiError
+from __future__ import annotations
+
+from typing import Optional
+
+from ..net import (
+    DiskCache,
+    HttpTransport,
+    Priority,
+    RateLimiter,
+    ResponseCache,
+    RetryPolicy,
+)
+from .api import (
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_PERSIST_TTLS,
+    DEFAULT_RETRY_POLICY,
+    BoundOsuApi,
+    CacheTtl,
+    OsuApi,
+    OsuApiError,
+)
+from .batching import BatchLoader
+from .pagination import CursorPaginator
 from .enums import (
     Ruleset,
     RankStatus,
@@ -58,6 +80,9 @@ from .endpoints import (
 __all__ = [
     "OsuApi",
     "OsuApiError",
+    "BoundOsuApi",
+    "BatchLoader",
+    "CursorPaginator",
     # Enums
     "Ruleset",
     "RankStatus",
@@ -100,9 +125,28 @@ __all__ = [
     "TeamsEndpoint",
     "MiscEndpoint",
     "OsuClient",
+    "BoundOsuClient",
 ]
 
 
+def _attach_endpoints(api: OsuApi | BoundOsuApi) -> None:
+    api.users = UsersEndpoint(api)
+    api.beatmaps = BeatmapsEndpoint(api)
+    api.beatmapsets = BeatmapsetsEndpoint(api)
+    api.rankings = RankingsEndpoint(api)
+    api.scores = ScoresEndpoint(api)
+    api.matches = MatchesEndpoint(api)
+    api.changelog = ChangelogEndpoint(api)
+    api.comments = CommentsEndpoint(api)
+    api.events = EventsEndpoint(api)
+    api.news = NewsEndpoint(api)
+    api.wiki = WikiEndpoint(api)
+    api.search = SearchEndpoint(api)
+    api.multiplayer = MultiplayerEndpoint(api)
+    api.teams = TeamsEndpoint(api)
+    api.misc = MiscEndpoint(api)
+
+
 class OsuClient(OsuApi):
     """High-level osu! API client with endpoint accessors.
 
@@ -115,20 +159,59 @@ class OsuClient(OsuApi):
         beatmap = await client.beatmaps.get_beatmap(75)
     """
 
-    def __init__(self, client_id: int, client_secret: str, redirect_uri: str = ""):
-        super().__init__(client_id, client_secret, redirect_uri)
-        self.users = UsersEndpoint(self)
-        self.beatmaps = BeatmapsEndpoint(self)
-        self.beatmapsets = BeatmapsetsEndpoint(self)
-        self.rankings = RankingsEndpoint(self)
-        self.scores = ScoresEndpoint(self)
-        self.matches = MatchesEndpoint(self)
-        self.changelog = ChangelogEndpoint(self)
-        self.comments = CommentsEndpoint(self)
-        self.events = EventsEndpoint(self)
-        self.news = NewsEndpoint(self)
-        self.wiki = WikiEndpoint(self)
-        self.search = SearchEndpoint(self)
-        self.multiplayer = MultiplayerEndpoint(self)
-        self.teams = TeamsEndpoint(self)
-        self.misc = MiscEndpoint(self)
+    def __init__(
+        self,
+        client_id: int,
+        client_secret: str,
+        redirect_uri: str = "",
+        transport: Optional[HttpTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        default_priority: Priority = Priority.INTERACTIVE,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: dict[str, CacheTtl] = DEFAULT_CACHE_TTLS,
+        disk_cache: Optional[DiskCache] = None,
+        persist_ttls: dict[str, CacheTtl] = DEFAULT_PERSIST_TTLS,
+    ):
+        super().__init__(
+            client_id, client_secret, redirect_uri,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            default_priority=default_priority,
+            retry_policy=retry_policy,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            disk_cache=disk_cache,
+            persist_ttls=persist_ttls,
+        )
+        _attach_endpoints(self)
+
+    def bind(
+        self,
+        access_token: str,
+        token_type: str = "Bearer",
+        priority: Optional[Priority] = None,
+        fresh: bool = False,
+    ) -> BoundOsuClient:
+        """Return a per-token client sharing this client's session.
+
+        Usage::
+
+            me = await client.bind(user_token).users.get_own_data()
+        """
+        return BoundOsuClient(self, access_token, token_type, priority, fresh)
+
+
+class BoundOsuClient(BoundOsuApi):
+    """Endpoint accessors over a :class:`BoundOsuApi` (see :meth:`OsuClient.bind`)."""
+
+    def __init__(
+        self,
+        api: OsuApi,
+        access_token: str,
+        token_type: str = "Bearer",
+        priority: Optional[Priority] = None,
+        fresh: bool = False,
+    ):
+        super().__init__(api, access_token, token_type, priority, fresh)
+        _attach_endpoints(self)
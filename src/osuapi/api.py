@@ -1,18 +1,191 @@
 from __future__ import annotations
 
+import fnmatch
 import json
 import logging
+import math
+import re
 import urllib.parse
-from typing import Any, Optional
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Optional, Union
 
 import aiohttp
 
+from ..net import (
+    codec,
+    IDEMPOTENT_METHODS,
+    HttpTransport,
+    Priority,
+    DiskCache,
+    RateLimiter,
+    RawResponse,
+    ResponseCache,
+    RetryPolicy,
+    SingleFlight,
+)
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://osu.ppy.sh/api/v2"
 TOKEN_URL = "https://osu.ppy.sh/oauth/token"
 AUTHORIZE_URL = "https://osu.ppy.sh/oauth/authorize"
 
+# Endpoints whose responses are the same whichever user's token asks for
+# them. Everything else (``me``, friends, favourites, beatmap leaderboards
+# that embed the caller's own score, comment bundles carrying the caller's
+# ``user_votes`` / ``user_follow``, ...) is scoped to the token.
+_SHARED_ENDPOINT_RE = re.compile(
+    r"^(?:"
+    r"beatmaps/(?:lookup|packs(?:/[^/]+)?|\d+)"
+    r"|beatmaps"
+    r"|beatmapsets/(?:lookup|search|\d+)"
+    r"|rankings/.+|spotlights"
+    r"|users(?:/[^/]+(?:/[^/]+)*)?"
+    r"|scores(?:/\d+)?"
+    r"|matches(?:/\d+)?"
+    r"|changelog(?:/.+)?|news(?:/.+)?|wiki/.+"
+    r"|events|search|teams/.+"
+    r"|seasonal-backgrounds|tags"
+    r")$"
+)
+
+
+# Beatmapset search filters whose results depend on who is searching:
+# the caller's own maps / favourites, maps they (have not) played, their
+# rank achieved, and the "recommended" / "follows" general filters.
+_PERSONAL_SEARCH_SECTIONS = frozenset({"mine", "favourites"})
+_PERSONAL_SEARCH_GENERAL = frozenset({"recommended", "follows"})
+_PERSONAL_SEARCH_PARAMS = frozenset({"played", "r"})
+
+
+def _is_personal_search(params: Iterable[tuple[str, str]]) -> bool:
+    for name, value in params:
+        if name in _PERSONAL_SEARCH_PARAMS:
+            return True
+        if name == "s" and value in _PERSONAL_SEARCH_SECTIONS:
+            return True
+        if name == "c" and _PERSONAL_SEARCH_GENERAL.intersection(value.split(".")):
+            return True
+    return False
+
+
+def _is_personal_ranking(params: Iterable[tuple[str, str]]) -> bool:
+    """``filter=friends`` (anything but ``all``) ranks the caller's friends."""
+    return any(name == "filter" and value != "all" for name, value in params)
+
+
+def token_scope(endpoint: str, access_token: str, params: Iterable[tuple[str, str]] = ()) -> str:
+    """Return the key under which responses for *endpoint* may be shared.
+
+    *params* are the flattened query parameters; a beatmapset search or a
+    ranking that filters on the caller's own data is scoped to the token.
+    """
+    path = endpoint.strip("/")
+    if not _SHARED_ENDPOINT_RE.match(path):
+        return access_token
+    if path == "beatmapsets/search" and _is_personal_search(params):
+        return access_token
+    if path.startswith("rankings/") and _is_personal_ranking(params):
+        return access_token
+    return "public"
+
+
+def _status_ttl(body: Any) -> float:
+    """Ranked/approved/loved maps are frozen; anything else may still change."""
+    status = body.get("status") if isinstance(body, dict) else None
+    return 24 * 3600.0 if status in ("ranked", "approved", "loved") else 300.0
+
+
+CacheTtl = Union[float, Callable[[Any], float]]
+
+# Seconds to keep a GET response in the shared :class:`ResponseCache`, by
+# endpoint glob (first match wins). A callable receives the decoded body.
+# Endpoints without a rule (or with 0) are never cached.
+DEFAULT_CACHE_TTLS: dict[str, CacheTtl] = {
+    "users/*/scores/recent": 0,
+    "users/*/scores/*": 120,
+    "users/*/recent_activity": 30,
+    "users/*": 60,
+    "users": 60,
+    "me": 30,
+    "me/*": 30,
+    "friends": 60,
+    "beatmaps/*/scores*": 60,
+    "beatmaps/packs*": 3600,
+    "beatmaps/lookup": _status_ttl,
+    "beatmaps/*": _status_ttl,
+    "beatmaps": 600,
+    "beatmapsets/search": 300,
+    "beatmapsets/lookup": _status_ttl,
+    "beatmapsets/*": _status_ttl,
+    "scores/*": 3600,
+    "rankings/*": 300,
+    "spotlights": 3600,
+    "wiki/*": 3600,
+    "news/*": 3600,
+    "news": 60,
+    "changelog*": 600,
+    "matches*": 30,
+    "rooms*": 30,
+    "events": 30,
+    "comments*": 60,
+    "teams/*": 600,
+    "search": 300,
+    "seasonal-backgrounds": 24 * 3600,
+    "tags": 24 * 3600,
+}
+
+
+def _persist_map_ttl(body: Any) -> float:
+    """Ranked maps never change; graveyard/loved ones only rarely."""
+    status = body.get("status") if isinstance(body, dict) else None
+    if status in ("ranked", "approved"):
+        return math.inf
+    if status == "loved":
+        return 30 * 24 * 3600.0
+    if status == "graveyard":
+        return 7 * 24 * 3600.0
+    return 0.0
+
+
+def _persist_match_ttl(body: Any) -> float:
+    match = body.get("match") if isinstance(body, dict) else None
+    return math.inf if isinstance(match, dict) and match.get("end_time") else 0.0
+
+
+# Seconds to keep a GET response in the on-disk :class:`DiskCache` (same
+# glob rules as :data:`DEFAULT_CACHE_TTLS`; ``math.inf`` = forever). Only
+# objects that are immutable once settled belong here.
+DEFAULT_PERSIST_TTLS: dict[str, CacheTtl] = {
+    "beatmaps/*/*": 0,
+    "beatmaps/lookup": 0,
+    "beatmaps/packs": 0,
+    "beatmaps/*": _persist_map_ttl,
+    "beatmapsets/*/*": 0,
+    "beatmapsets/lookup": 0,
+    "beatmapsets/search": 0,
+    "beatmapsets/*": _persist_map_ttl,
+    "scores/*/*": 0,
+    "scores/*": math.inf,
+    "matches/*/*": 0,
+    "matches/*": _persist_match_ttl,
+    "wiki/*": 24 * 3600.0,
+}
+
+
+# Endpoints polled for freshness; their ETag / Last-Modified validators are
+# kept so a re-fetch can be answered with 304 Not Modified.
+CONDITIONAL_ENDPOINTS: tuple[str, ...] = ("news", "news/*", "changelog*", "wiki/*")
+
+# Validators outlive the response cache TTLs; they only save bandwidth.
+_VALIDATOR_TTL = 7 * 24 * 3600.0
+
+
+# The difficulty-attributes lookup is a POST but has no side effects.
+DEFAULT_RETRY_POLICY = RetryPolicy(overrides={
+    "beatmaps/*/attributes": RetryPolicy(methods=IDEMPOTENT_METHODS | {"POST"}),
+})
+
 
 class OsuApiError(Exception):
     """Base exception for osu! API errors."""
@@ -23,7 +196,29 @@ class OsuApiError(Exception):
         super().__init__(f"[{status}] {message}")
 
 
-class OsuApi:
+class _VerbHelpers(ABC):
+    """HTTP verb shortcuts shared by :class:`OsuApi` and its bound views."""
+
+    @abstractmethod
+    async def request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Send one request; subclasses decide which token it carries."""
+
+    async def get(self, endpoint: str, **params: Any) -> Any:
+        cleaned = {k: v for k, v in params.items() if v is not None}
+        return await self.request("GET", endpoint, params=cleaned or None)
+
+    async def post(self, endpoint: str, *, params: dict | None = None, json_body: dict | None = None) -> Any:
+        return await self.request("POST", endpoint, params=params, json_body=json_body)
+
+    async def put(self, endpoint: str, *, params: dict | None = None, json_body: dict | None = None) -> Any:
+        return await self.request("PUT", endpoint, params=params, json_body=json_body)
+
+    async def delete(self, endpoint: str, **params: Any) -> Any:
+        cleaned = {k: v for k, v in params.items() if v is not None}
+        return await self.request("DELETE", endpoint, params=cleaned or None)
+
+
+class OsuApi(_VerbHelpers):
     """Low-level HTTP client for the osu! API v2.
 
     Handles authentication (Client Credentials & Authorization Code),
@@ -35,6 +230,14 @@ class OsuApi:
         client_id: int,
         client_secret: str,
         redirect_uri: str = "",
+        transport: Optional[HttpTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        default_priority: Priority = Priority.INTERACTIVE,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        cache: Optional[ResponseCache] = None,
+        cache_ttls: dict[str, CacheTtl] = DEFAULT_CACHE_TTLS,
+        disk_cache: Optional[DiskCache] = None,
+        persist_ttls: dict[str, CacheTtl] = DEFAULT_PERSIST_TTLS,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -43,18 +246,39 @@ class OsuApi:
         self._refresh_token: Optional[str] = None
         self._token_type: str = "Bearer"
         self._scope: str = ""
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.default_priority = default_priority
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.cache_ttls = cache_ttls
+        self.disk_cache = disk_cache
+        self.persist_ttls = persist_ttls
+        self.conditional_endpoints = CONDITIONAL_ENDPOINTS
+        self._validators = ResponseCache(4 * 1024 * 1024)
+        self._inflight = SingleFlight()
         self._session: Optional[aiohttp.ClientSession] = None
 
+    @staticmethod
+    def _ttl_rule(rules: dict[str, CacheTtl], endpoint: str) -> Optional[CacheTtl]:
+        for pattern, ttl in rules.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl or None
+        return None
+
     # ------------------------------------------------------------------
     # Session management
     # ------------------------------------------------------------------
 
     async def _get_session(self) -> aiohttp.ClientSession:
+        if self.transport is not None:
+            return await self.transport.get_session()
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession()
         return self._session
 
     async def close(self) -> None:
+        # A shared transport is closed by its owner, not by each client.
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -143,6 +367,16 @@ class OsuApi:
         """Manually set the Bearer token."""
         self._access_token = token
 
+    def bind(
+        self,
+        access_token: str,
+        token_type: str = "Bearer",
+        priority: Optional[Priority] = None,
+        fresh: bool = False,
+    ) -> BoundOsuApi:
+        """Return a view that sends every request with *access_token*."""
+        return BoundOsuApi(self, access_token, token_type, priority, fresh)
+
     def _apply_token(self, data: dict[str, Any]) -> None:
         self._access_token = data.get("access_token")
         self._refresh_token = data.get("refresh_token")
@@ -160,18 +394,35 @@ class OsuApi:
         *,
         params: dict[str, Any] | None = None,
         json_body: dict[str, Any] | None = None,
+        access_token: str | None = None,
+        token_type: str | None = None,
+        priority: Priority | None = None,
+        retry: RetryPolicy | None = None,
+        fresh: bool = False,
     ) -> Any:
         """Execute an authenticated API request.
 
-        Returns the parsed JSON response.
+        *access_token* overrides the client's own token for this call only,
+        which lets many users share one client (and one connection pool)
+        concurrently. *priority* selects the rate-limiter lane (defaults to
+        :attr:`default_priority`) and *retry* overrides :attr:`retry_policy`
+        for this call. GETs are served from :attr:`cache` when a rule in
+        :attr:`cache_ttls` allows it, then from :attr:`disk_cache` for the
+        immutable public objects listed in :attr:`persist_ttls`. Endpoints in
+        :attr:`conditional_endpoints` are revalidated with ETag /
+        Last-Modified, reusing the previous body on 304 Not Modified. With
+        *fresh*, :attr:`cache` is not read (the response still refreshes
+        it), for callers that must not be handed an older copy. Returns the
+        parsed JSON response.
         """
-        if not self._access_token:
+        token = access_token or self._access_token
+        if not token:
             raise OsuApiError(0, "No access token set. Authenticate first.")
 
         session = await self._get_session()
         url = f"{BASE_URL}/{endpoint.lstrip('/')}"
         headers = {
-            "Authorization": f"{self._token_type} {self._access_token}",
+            "Authorization": f"{token_type or self._token_type} {token}",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
@@ -188,31 +439,134 @@ class OsuApi:
                     real_params.append((key, str(value)))
 
         data_str = json.dumps(json_body) if json_body else None
-
-        async with session.request(
-            method,
-            url,
-            headers=headers,
-            params=real_params,
-            data=data_str,
-        ) as resp:
+        lane = self.default_priority if priority is None else priority
+
+        async def send(extra_headers: Optional[dict[str, str]] = None) -> RawResponse:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(lane)
+            async with session.request(
+                method,
+                url,
+                headers={**headers, **extra_headers} if extra_headers else headers,
+                params=real_params,
+                data=data_str,
+            ) as resp:
+                return await RawResponse.read(resp)
+
+        path = endpoint.strip("/")
+        is_get = method.upper() == "GET"
+        scope = token_scope(path, token, real_params or ())
+        key = (path, tuple(sorted(real_params or ())), scope)
+        rule = persist = None
+        if is_get and self.cache is not None:
+            rule = self._ttl_rule(self.cache_ttls, path)
+        if is_get and self.disk_cache is not None and scope == "public":
+            persist = self._ttl_rule(self.persist_ttls, path)
+        disk_key = f"{path}?{urllib.parse.urlencode(key[1])}"
+        conditional = is_get and any(
+            fnmatch.fnmatchcase(path, pattern) for pattern in self.conditional_endpoints
+        )
+
+        def remember(data: Any, size: int) -> None:
+            if rule is not None:
+                self.cache.set(key, data, rule(data) if callable(rule) else rule, size)
+
+        async def fetch() -> Any:
+            if persist is not None:
+                body = await self.disk_cache.get(disk_key)
+                if body is not None:
+                    data = codec.loads(body)
+                    remember(data, len(body))
+                    return data
+            validated = self._validators.get(key) if conditional else None
+            if validated is not None:
+                etag, last_modified, _, _ = validated
+                extra = {}
+                if etag:
+                    extra["If-None-Match"] = etag
+                if last_modified:
+                    extra["If-Modified-Since"] = last_modified
+                resp = await (retry or self.retry_policy).run(
+                    method, endpoint, lambda: send(extra),
+                )
+            else:
+                resp = await (retry or self.retry_policy).run(method, endpoint, send)
+            if resp.status == 304 and validated is not None:
+                data, size = validated[2], validated[3]
+                remember(data, size)
+                return data
             if resp.status == 204:
                 return None
-            body = await resp.json()
             if resp.status >= 400:
-                raise OsuApiError(resp.status, str(body))
-            return body
-
-    async def get(self, endpoint: str, **params: Any) -> Any:
-        cleaned = {k: v for k, v in params.items() if v is not None}
-        return await self.request("GET", endpoint, params=cleaned or None)
+                raise OsuApiError(resp.status, resp.error_message())
+            data = resp.json()
+            remember(data, len(resp.body))
+            if conditional:
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._validators.set(
+                        key, (etag, last_modified, data, len(resp.body)),
+                        _VALIDATOR_TTL, len(resp.body),
+                    )
+            if persist is not None:
+                ttl = persist(data) if callable(persist) else persist
+                if ttl > 0:
+                    await self.disk_cache.set(disk_key, resp.body, ttl)
+            return data
 
-    async def post(self, endpoint: str, *, params: dict | None = None, json_body: dict | None = None) -> Any:
-        return await self.request("POST", endpoint, params=params, json_body=json_body)
+        if not is_get:
+            return await fetch()
+        if rule is not None and not fresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        # Identical concurrent GETs share one network call and parsed body.
+        # Flights are kept per rate-limiter lane so a caller never queues
+        # behind a lower lane; a lower-lane caller joins a higher one.
+        flight_lane = next((p for p in Priority if p < lane and (key, p) in self._inflight), lane)
+        return await self._inflight.do((key, flight_lane), fetch)
+
+
+class BoundOsuApi(_VerbHelpers):
+    """A lightweight per-token view over a shared :class:`OsuApi`.
+
+    The view owns no session or token state of its own: every request is
+    forwarded to the parent with the pinned token, so concurrent views never
+    leak credentials into each other.
+    """
 
-    async def put(self, endpoint: str, *, params: dict | None = None, json_body: dict | None = None) -> Any:
-        return await self.request("PUT", endpoint, params=params, json_body=json_body)
+    def __init__(
+        self,
+        api: OsuApi,
+        access_token: str,
+        token_type: str = "Bearer",
+        priority: Optional[Priority] = None,
+        fresh: bool = False,
+    ):
+        self._parent = api
+        self._access_token = access_token
+        self._token_type = token_type
+        self._priority = priority
+        self._fresh = fresh
 
-    async def delete(self, endpoint: str, **params: Any) -> Any:
-        cleaned = {k: v for k, v in params.items() if v is not None}
-        return await self.request("DELETE", endpoint, params=cleaned or None)
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+        **options: Any,
+    ) -> Any:
+        options.setdefault("priority", self._priority)
+        options.setdefault("fresh", self._fresh)
+        return await self._parent.request(
+            method,
+            endpoint,
+            params=params,
+            json_body=json_body,
+            access_token=self._access_token,
+            token_type=self._token_type,
+            **options,
+        )
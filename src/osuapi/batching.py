@@ -0,0 +1,120 @@
+"""Coalesce individual lookups into batched requests (DataLoader pattern)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFn = Callable[[list[K], Any], Awaitable[dict[K, V]]]
+
+
+class BatchLoader(Generic[K, V]):
+    """Collect :meth:`load` calls for a short window and resolve them together.
+
+    Calls arriving within *window* seconds of the first one are gathered
+    and passed to *batch_fn* as one list of up to *max_batch* distinct keys;
+    a full batch is dispatched immediately. *batch_fn* returns a mapping of
+    key to value, and keys missing from it resolve to ``None``.
+
+    Each call may pass a *context* (e.g. a bound API view); the batch runs
+    with the context of its first caller, so contexts must be
+    interchangeable for the data being loaded. If the batch fails with an
+    error accepted by *retry_on* (e.g. that caller's token was revoked),
+    the first caller gets the error and every other caller's keys are
+    loaded again with its own context, so one bad context does not fail
+    the whole batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        *,
+        max_batch: int = 50,
+        window: float = 0.005,
+        retry_on: Optional[Callable[[Exception], bool]] = None,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.window = window
+        self._retry_on = retry_on
+        self._pending: dict[K, list[tuple[asyncio.Future, Any]]] = {}
+        self._context: Any = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.loads = 0
+        self.retries = 0
+
+    async def load(self, key: K, context: Any = None) -> Optional[V]:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        if not self._pending:
+            self._context = context
+            self._timer = loop.call_later(self.window, self._dispatch)
+        self._pending.setdefault(key, []).append((fut, context))
+        self.loads += 1
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        return await fut
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self.batches += 1
+        asyncio.ensure_future(self._run(batch, self._context))
+        self._context = None
+
+    async def _run(
+        self,
+        batch: dict[K, list[tuple[asyncio.Future, Any]]],
+        context: Any,
+        retry: bool = True,
+    ) -> None:
+        try:
+            results = await self._batch_fn(list(batch), context)
+        except asyncio.CancelledError:
+            for waiters in batch.values():
+                for fut, _ in waiters:
+                    fut.cancel()
+            raise
+        except Exception as e:
+            if retry and self._retry_on is not None and self._retry_on(e):
+                await self._retry(batch, context, e)
+                return
+            for waiters in batch.values():
+                for fut, _ in waiters:
+                    if not fut.done():
+                        fut.set_exception(e)
+            return
+        for key, waiters in batch.items():
+            value = results.get(key)
+            for fut, _ in waiters:
+                if not fut.done():
+                    fut.set_result(value)
+
+    async def _retry(
+        self,
+        batch: dict[K, list[tuple[asyncio.Future, Any]]],
+        failed: Any,
+        error: Exception,
+    ) -> None:
+        # Regroup by caller context; the one that failed keeps its error.
+        groups: dict[int, tuple[Any, dict[K, list[tuple[asyncio.Future, Any]]]]] = {}
+        for key, waiters in batch.items():
+            for fut, context in waiters:
+                if context is failed:
+                    if not fut.done():
+                        fut.set_exception(error)
+                    continue
+                group = groups.setdefault(id(context), (context, {}))[1]
+                group.setdefault(key, []).append((fut, context))
+        self.retries += len(groups)
+        await asyncio.gather(*(
+            self._run(group, context, retry=False) for context, group in groups.values()
+        ))
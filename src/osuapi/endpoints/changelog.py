@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from ..api import OsuApi
+from ..pagination import CursorPaginator
 
 
 class ChangelogEndpoint:
@@ -50,6 +51,41 @@ class ChangelogEndpoint:
             params["message_formats[]"] = message_formats
         return await self._api.request("GET", "changelog", params=params or None)
 
+    def iter_changelog_builds(
+        self,
+        *,
+        from_version: Optional[str] = None,
+        max_id: Optional[int] = None,
+        stream: Optional[str] = None,
+        to: Optional[str] = None,
+        message_formats: Optional[list[str]] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CursorPaginator:
+        """Iterate changelog builds, newest first, paging backwards by ``max_id``.
+
+        The listing has no ``cursor_string``; the cursor is the ``max_id`` of
+        the next page (one below the oldest build seen so far).
+        """
+        def next_max_id(page: dict[str, Any], builds: list[Any]) -> Optional[str]:
+            ids = [b["id"] for b in builds if isinstance(b, dict) and "id" in b]
+            return str(min(ids) - 1) if ids else None
+
+        return CursorPaginator(
+            lambda cursor: self.get_changelog_listing(
+                from_version=from_version,
+                max_id=int(cursor) if cursor is not None else None,
+                stream=stream,
+                to=to,
+                message_formats=message_formats,
+            ),
+            "builds",
+            cursor=str(max_id) if max_id is not None else None,
+            next_cursor=next_max_id,
+            max_items=max_items,
+            max_pages=max_pages,
+        )
+
     async def lookup_changelog_build(
         self,
         changelog: str,
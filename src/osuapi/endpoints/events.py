@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from ..api import OsuApi
+from ..pagination import CursorPaginator
 
 
 class EventsEndpoint:
@@ -28,3 +29,20 @@ class EventsEndpoint:
             sort=sort,
             cursor_string=cursor_string,
         )
+
+    def iter_events(
+        self,
+        *,
+        sort: Optional[str] = None,
+        cursor_string: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CursorPaginator:
+        """Iterate GET /events across pages, following ``cursor_string``."""
+        return CursorPaginator(
+            lambda cursor: self.get_events(sort=sort, cursor_string=cursor),
+            "events",
+            cursor=cursor_string,
+            max_items=max_items,
+            max_pages=max_pages,
+        )
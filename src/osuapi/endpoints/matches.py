@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from ..api import OsuApi
+from ..pagination import CursorPaginator
 
 
 class MatchesEndpoint:
@@ -36,6 +37,27 @@ class MatchesEndpoint:
             params["cursor_string"] = cursor_string
         return await self._api.request("GET", "matches", params=params or None)
 
+    def iter_matches(
+        self,
+        *,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        active: Optional[bool] = None,
+        cursor_string: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CursorPaginator:
+        """Iterate GET /matches across pages, following ``cursor_string``."""
+        return CursorPaginator(
+            lambda cursor: self.get_matches(
+                limit=limit, sort=sort, active=active, cursor_string=cursor,
+            ),
+            "matches",
+            cursor=cursor_string,
+            max_items=max_items,
+            max_pages=max_pages,
+        )
+
     async def get_match(
         self,
         match_id: int,
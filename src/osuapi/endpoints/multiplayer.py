@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from ..api import OsuApi
+from ..pagination import CursorPaginator
 
 
 class MultiplayerEndpoint:
@@ -61,6 +62,28 @@ class MultiplayerEndpoint:
             cursor_string=cursor_string,
         )
 
+    def iter_playlist_scores(
+        self,
+        room_id: int,
+        playlist_id: int,
+        *,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        cursor_string: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CursorPaginator:
+        """Iterate a playlist item's scores across pages, following ``cursor_string``."""
+        return CursorPaginator(
+            lambda cursor: self.get_playlist_scores(
+                room_id, playlist_id, limit=limit, sort=sort, cursor_string=cursor,
+            ),
+            "scores",
+            cursor=cursor_string,
+            max_items=max_items,
+            max_pages=max_pages,
+        )
+
     async def get_room_leaderboard(self, room_id: int) -> dict[str, Any]:
         """GET /rooms/{room}/leaderboard"""
         return await self._api.get(f"rooms/{room_id}/leaderboard")
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any, Optional
 
 from ..api import OsuApi
+from ..pagination import CursorPaginator
 from ..models.score import Score
 
 
@@ -37,3 +38,20 @@ class ScoresEndpoint:
             ruleset=ruleset,
             cursor_string=cursor_string,
         )
+
+    def iter_scores(
+        self,
+        *,
+        ruleset: Optional[str] = None,
+        cursor_string: Optional[str] = None,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CursorPaginator:
+        """Iterate GET /scores across pages, following ``cursor_string``."""
+        return CursorPaginator(
+            lambda cursor: self.get_scores(ruleset=ruleset, cursor_string=cursor),
+            "scores",
+            cursor=cursor_string,
+            max_items=max_items,
+            max_pages=max_pages,
+        )
@@ -27,12 +27,25 @@ class UsersEndpoint:
         self,
         ids: list[int],
         include_variant_statistics: bool = False,
+        mode: Optional[str] = None,
     ) -> list[UserExtended]:
+        """GET /users – up to 50 users in one request.
+
+        The listing carries per-ruleset ``statistics_rulesets`` instead of
+        ``statistics``; with *mode* set, that ruleset's entry is exposed as
+        :attr:`UserExtended.statistics` like :meth:`get_user` does.
+        """
         params: dict[str, Any] = {"ids[]": [str(i) for i in ids]}
         if include_variant_statistics:
             params["include_variant_statistics"] = "true"
         data = await self._api.request("GET", "users", params=params)
-        return [UserExtended.from_dict(u) for u in data.get("users", [])]
+        users = []
+        for u in data.get("users", []):
+            rulesets = u.get("statistics_rulesets") or {}
+            if mode and "statistics" not in u and rulesets.get(mode):
+                u = {**u, "statistics": rulesets[mode]}
+            users.append(UserExtended.from_dict(u))
+        return users
 
     async def get_own_data(self, mode: Optional[str] = None) -> UserExtended:
         endpoint = "me"
@@ -0,0 +1,126 @@
+"""Async iteration over cursor-paginated osu! API endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+PageFetcher = Callable[[Optional[str]], Awaitable[dict[str, Any]]]
+NextCursor = Callable[[dict[str, Any], list[Any]], Optional[str]]
+
+
+def cursor_string_of(page: dict[str, Any], items: list[Any]) -> Optional[str]:
+    """Default cursor extractor: the ``cursor_string`` field of the page."""
+    return page.get("cursor_string") or None
+
+
+class CursorPaginator:
+    """``async for`` over every item of a cursor-paginated endpoint.
+
+    *fetch_page* receives the cursor (``None`` for the first page) and
+    returns the raw page; items are read from ``page[items_key]``. While
+    the caller consumes one page the next one is already being fetched.
+    Iteration stops when a page is empty, there is no further cursor, or
+    the *max_items* / *max_pages* budget is spent.
+
+    After (or during) iteration :attr:`cursor` is the cursor to pass back
+    as *cursor* to resume later: the next page's cursor once the current
+    page is fully consumed, otherwise the current page's own cursor (so a
+    resumed iteration may repeat a few items, but never skips any). Once
+    the last page has been consumed :attr:`exhausted` is set.
+
+    Usage::
+
+        pages = api.scores.iter_scores(ruleset="osu", max_pages=3)
+        async for score in pages:
+            ...
+        save(pages.cursor)
+    """
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        items_key: str,
+        *,
+        cursor: Optional[str] = None,
+        next_cursor: NextCursor = cursor_string_of,
+        max_items: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> None:
+        self._fetch_page = fetch_page
+        self._items_key = items_key
+        self._next_cursor = next_cursor
+        self.max_items = max_items
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.cursor = cursor
+        self.exhausted = False
+        self.pages_fetched = 0
+        self.items_yielded = 0
+
+    def _items_spent(self) -> bool:
+        return self.max_items is not None and self.items_yielded >= self.max_items
+
+    def _budget_left(self, upcoming: int = 0) -> bool:
+        if self.max_pages is not None and self.pages_fetched >= self.max_pages:
+            return False
+        if self.max_items is not None and self.items_yielded + upcoming >= self.max_items:
+            return False
+        return True
+
+    def _start(self, cursor: Optional[str]) -> asyncio.Task:
+        self.pages_fetched += 1
+        return asyncio.ensure_future(self._fetch_page(cursor))
+
+    async def pages(self) -> AsyncIterator[tuple[dict[str, Any], list[Any]]]:
+        """Yield ``(page, items)`` pairs, honouring the page budget."""
+        if self.exhausted or not self._budget_left():
+            return
+        current = self.cursor
+        pending: Optional[asyncio.Task] = self._start(current)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                items = list(page.get(self._items_key) or [])
+                following = self._next_cursor(page, items) if items else None
+                if following == current:
+                    following = None
+                if following is not None and self.prefetch and self._budget_left(len(items)):
+                    pending = self._start(following)
+                yield page, items
+                self.cursor = following
+                if following is None:
+                    self.exhausted = True
+                    break
+                if self._items_spent():
+                    break
+                if pending is None:
+                    if not self._budget_left():
+                        break
+                    pending = self._start(following)
+                current = following
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await pending
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        pages = self.pages()
+        try:
+            async for _, items in pages:
+                for item in items:
+                    if self._items_spent():
+                        return
+                    self.items_yielded += 1
+                    yield item
+        finally:
+            # Stop any read-ahead request right away rather than at GC time.
+            await pages.aclose()
+
+    async def collect(self) -> list[Any]:
+        """Consume the iterator into a list."""
+        return [item async for item in self]
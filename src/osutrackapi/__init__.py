@@ -10,6 +10,7 @@ Usage::
 
 from .api import OsuTrackApi, OsuTrackApiError
 from .enums import GameMode, ScoreRank
+from .history import OsuTrackHistory
 from .models import (
     BestPlay,
     HiScore,
@@ -22,6 +23,7 @@ from .models import (
 __all__ = [
     "OsuTrackApi",
     "OsuTrackApiError",
+    "OsuTrackHistory",
     "GameMode",
     "ScoreRank",
     "BestPlay",
@@ -7,6 +7,7 @@ from typing import Any, Optional, Union
 
 import aiohttp
 
+from ..net import NO_RETRY, HttpTransport, RawResponse, RetryPolicy, SingleFlight
 from .enums import GameMode
 from .models import (
     BestPlay,
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://osutrack-api.ameo.dev"
 
+# POST /update records a new snapshot server-side; never replay it blindly.
+DEFAULT_RETRY_POLICY = RetryPolicy(overrides={"update": NO_RETRY})
+
 
 class OsuTrackApiError(Exception):
     def __init__(self, status: int, message: str):
@@ -39,15 +43,25 @@ class OsuTrackApi:
         await api.close()
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ) -> None:
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self._inflight = SingleFlight()
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
+        if self.transport is not None:
+            return await self.transport.get_session()
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession()
         return self._session
 
     async def close(self) -> None:
+        # A shared transport is closed by its owner, not by each client.
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -68,11 +82,22 @@ class OsuTrackApi:
     ) -> Any:
         session = await self._get_session()
         url = f"{BASE_URL}/{endpoint.lstrip('/')}"
-        async with session.request(method, url, params=params) as resp:
+
+        async def send() -> RawResponse:
+            async with session.request(method, url, params=params) as resp:
+                return await RawResponse.read(resp)
+
+        async def fetch() -> Any:
+            resp = await self.retry_policy.run(method, endpoint, send)
             if resp.status != 200:
-                text = await resp.text()
-                raise OsuTrackApiError(resp.status, text)
-            return await resp.json()
+                raise OsuTrackApiError(resp.status, resp.text())
+            return resp.json()
+
+        if method.upper() != "GET":
+            return await fetch()
+        # Several commands (chart, peak) read the same history at once.
+        key = (endpoint.strip("/"), tuple(sorted((params or {}).items())))
+        return await self._inflight.do(key, fetch)
 
     # ------------------------------------------------------------------
     # Endpoints
@@ -0,0 +1,298 @@
+"""Local SQLite mirror of osutrack history, synced incrementally."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Any, Awaitable, Callable, Optional, Union
+
+import aiohttp
+
+from ..net import SingleFlight
+from .api import OsuTrackApi, OsuTrackApiError
+from .enums import GameMode
+from .models import RecordedScore, StatsUpdate
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats_history (
+    user   TEXT    NOT NULL,
+    mode   INTEGER NOT NULL,
+    ts     REAL    NOT NULL,
+    record TEXT    NOT NULL,
+    PRIMARY KEY (user, mode, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS hiscores (
+    user       TEXT    NOT NULL,
+    mode       INTEGER NOT NULL,
+    beatmap_id INTEGER NOT NULL,
+    score      INTEGER NOT NULL,
+    score_time REAL    NOT NULL,
+    record     TEXT    NOT NULL,
+    PRIMARY KEY (user, mode, beatmap_id, score)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS hiscores_time ON hiscores (user, mode, score_time);
+CREATE TABLE IF NOT EXISTS coverage (
+    series  TEXT    NOT NULL,
+    user    TEXT    NOT NULL,
+    mode    INTEGER NOT NULL,
+    since   REAL    NOT NULL,
+    synced  REAL    NOT NULL,
+    PRIMARY KEY (series, user, mode)
+);
+"""
+
+_DAY = 86400.0
+# Re-fetch this much before the last sync so records stamped late
+# (clock skew, day-granular "from" filtering) are not missed.
+_SYNC_OVERLAP = _DAY
+
+
+def _date_epoch(date: str) -> float:
+    """UTC midnight of a ``YYYY-MM-DD`` date."""
+    day = datetime.datetime.strptime(date, "%Y-%m-%d")
+    return day.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+def _epoch_date(epoch: float) -> str:
+    return datetime.datetime.fromtimestamp(epoch, datetime.timezone.utc).strftime("%Y-%m-%d")
+
+
+def _timestamp_epoch(value: str) -> Optional[float]:
+    """Parse an osutrack ISO-8601 timestamp (naive values are UTC)."""
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+class OsuTrackHistory:
+    """Per-user, per-mode osutrack history kept in one SQLite file.
+
+    Stats snapshots and recorded hiscores are mirrored as separate series,
+    indexed by user, mode and time. The first request for a user fetches the asked-for range; afterwards
+    only records newer than the last sync are downloaded, and older ranges
+    are backfilled once when first asked for. Range queries are then
+    answered locally, and within *sync_interval* seconds of the last sync
+    without contacting osutrack at all (:meth:`invalidate` after posting
+    an update). Recorded history never changes, so stored rows are kept
+    forever. If osutrack is unreachable, the locally stored records are
+    served instead.
+    """
+
+    def __init__(self, api: OsuTrackApi, path: str, sync_interval: float = 60) -> None:
+        self.api = api
+        self.path = path
+        self.sync_interval = sync_interval
+        self._recent: dict[tuple[str, str, int], float] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._syncs = SingleFlight()
+        self.fetches = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Coverage bookkeeping
+    # ------------------------------------------------------------------
+
+    def _coverage(self, series: str, user: str, mode: int) -> Optional[tuple[float, float]]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT since, synced FROM coverage WHERE series = ? AND user = ? AND mode = ?",
+                (series, user, mode),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _store(
+        self,
+        series: str,
+        user: str,
+        mode: int,
+        sql: str,
+        rows: list[tuple],
+        since: float,
+        synced: float,
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(sql, rows)
+                conn.execute(
+                    "INSERT INTO coverage (series, user, mode, since, synced) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (series, user, mode) DO UPDATE SET"
+                    " since = MIN(since, excluded.since), synced = MAX(synced, excluded.synced)",
+                    (series, user, mode, since, synced),
+                )
+
+    async def _sync(
+        self,
+        series: str,
+        user: str,
+        mode: int,
+        since: float,
+        fetch: Callable[[str, int, str, Optional[str]], Awaitable[list]],
+        to_rows: Callable[[str, int, list], list[tuple]],
+        insert_sql: str,
+    ) -> None:
+        """Bring *series* for ``(user, mode)`` up to date from *since* onwards."""
+        coverage = await asyncio.to_thread(self._coverage, series, user, mode)
+        recent = self._recent.get((series, user, mode))
+        if (
+            coverage is not None and since >= coverage[0]
+            and recent is not None and time.monotonic() - recent < self.sync_interval
+        ):
+            return
+        # (from, to, covered since, synced up to) for each request to make
+        ranges: list[tuple[str, Optional[str], float, float]] = []
+        if coverage is None:
+            ranges.append((_epoch_date(since), None, since, time.time()))
+        else:
+            covered_since, synced = coverage
+            if since < covered_since:
+                ranges.append((_epoch_date(since), _epoch_date(covered_since), since, synced))
+            ranges.append((_epoch_date(synced - _SYNC_OVERLAP), None, covered_since, time.time()))
+        try:
+            for from_date, to_date, covered, synced in ranges:
+                records = await fetch(user, mode, from_date, to_date)
+                self.fetches += 1
+                await asyncio.to_thread(
+                    self._store, series, user, mode, insert_sql,
+                    to_rows(user, mode, records), covered, synced,
+                )
+            self._recent[(series, user, mode)] = time.monotonic()
+        except (OsuTrackApiError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if coverage is None:
+                raise
+            logger.warning("osutrack %s sync failed for %s, serving stored data: %s", series, user, e)
+
+    def invalidate(self, user: Union[int, str], mode: Union[GameMode, int] = GameMode.OSU) -> None:
+        """Make the next query for ``(user, mode)`` sync with osutrack."""
+        user, mode_value = str(user), OsuTrackApi._mode_value(mode)
+        for key in [k for k in self._recent if k[1:] == (user, mode_value)]:
+            del self._recent[key]
+
+    async def _synced(self, series: str, user: str, mode: int, since: float, *args: Any) -> None:
+        # Concurrent commands for the same user share one sync.
+        await self._syncs.do(
+            (series, user, mode, since),
+            lambda: self._sync(series, user, mode, since, *args),
+        )
+
+    @staticmethod
+    def _range(from_date: Optional[str], to_date: Optional[str]) -> tuple[float, float]:
+        start = _date_epoch(from_date) if from_date else 0.0
+        end = _date_epoch(to_date) + _DAY if to_date else float("inf")
+        return start, end
+
+    # ------------------------------------------------------------------
+    # Stats history
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _stats_rows(user: str, mode: int, records: list[StatsUpdate]) -> list[tuple]:
+        rows = []
+        for record in records:
+            ts = _timestamp_epoch(record.timestamp)
+            if ts is not None:
+                rows.append((user, mode, ts, json.dumps(asdict(record), separators=(",", ":"))))
+        return rows
+
+    def _query_stats(self, user: str, mode: int, start: float, end: float) -> list[StatsUpdate]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT record FROM stats_history"
+                " WHERE user = ? AND mode = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (user, mode, start, end),
+            ).fetchall()
+        return [StatsUpdate.from_dict(json.loads(row[0])) for row in rows]
+
+    async def get_stats_history(
+        self,
+        user: Union[int, str],
+        mode: Union[GameMode, int] = GameMode.OSU,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> list[StatsUpdate]:
+        """Stats snapshots between *from_date* and *to_date* (``YYYY-MM-DD``, inclusive)."""
+        user, mode_value = str(user), OsuTrackApi._mode_value(mode)
+        start, end = self._range(from_date, to_date)
+        await self._synced(
+            "stats_history", user, mode_value, start,
+            self.api.get_stats_history,
+            self._stats_rows,
+            "INSERT OR IGNORE INTO stats_history (user, mode, ts, record) VALUES (?, ?, ?, ?)",
+        )
+        return await asyncio.to_thread(self._query_stats, user, mode_value, start, end)
+
+    # ------------------------------------------------------------------
+    # Hiscores
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _hiscore_rows(user: str, mode: int, records: list[RecordedScore]) -> list[tuple]:
+        rows = []
+        for record in records:
+            ts = _timestamp_epoch(record.score_time)
+            if ts is not None:
+                rows.append((
+                    user, mode, record.beatmap_id, record.score, ts,
+                    json.dumps(asdict(record), separators=(",", ":")),
+                ))
+        return rows
+
+    def _query_hiscores(self, user: str, mode: int, start: float, end: float) -> list[RecordedScore]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT record FROM hiscores"
+                " WHERE user = ? AND mode = ? AND score_time >= ? AND score_time < ?"
+                " ORDER BY score_time",
+                (user, mode, start, end),
+            ).fetchall()
+        return [RecordedScore.from_dict(json.loads(row[0])) for row in rows]
+
+    async def get_hiscores(
+        self,
+        user: Union[int, str],
+        mode: Union[GameMode, int] = GameMode.OSU,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> list[RecordedScore]:
+        """Recorded best scores set between *from_date* and *to_date* (inclusive).
+
+        A score is stored once per ``(beatmap_id, score)``, however often
+        overlapping syncs return it.
+        """
+        user, mode_value = str(user), OsuTrackApi._mode_value(mode)
+        start, end = self._range(from_date, to_date)
+        await self._synced(
+            "hiscores", user, mode_value, start,
+            self.api.get_hiscores,
+            self._hiscore_rows,
+            "INSERT OR IGNORE INTO hiscores (user, mode, beatmap_id, score, score_time, record)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+        )
+        return await asyncio.to_thread(self._query_hiscores, user, mode_value, start, end)
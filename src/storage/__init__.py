@@ -0,0 +1,38 @@
+"""Persistent state storage (tokens, account links, news state)."""
+
+from __future__ import annotations
+
+import os
+
+from .base import Storage
+from .jsonfile import JsonStorage
+from .memory import MemoryStorage
+from .sqlite import SqliteStorage
+
+BACKENDS = ("json", "sqlite", "memory")
+
+
+def open_storage(backend: str, data_dir: str) -> Storage:
+    """Create the *backend* storage rooted at *data_dir*.
+
+    ``"json"`` keeps one file per namespace, ``"sqlite"`` one WAL-mode
+    database (importing existing JSON files on first use) and ``"memory"``
+    nothing at all.
+    """
+    if backend == "json":
+        return JsonStorage(data_dir)
+    if backend == "sqlite":
+        return SqliteStorage(os.path.join(data_dir, "osu_storage.sqlite3"), import_dir=data_dir)
+    if backend == "memory":
+        return MemoryStorage()
+    raise ValueError(f"Unknown storage backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+
+
+__all__ = [
+    "BACKENDS",
+    "JsonStorage",
+    "MemoryStorage",
+    "SqliteStorage",
+    "Storage",
+    "open_storage",
+]
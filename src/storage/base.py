@@ -0,0 +1,111 @@
+"""Storage interface shared by every backend."""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class Storage(ABC):
+    """Namespaced key-value store for small JSON-serialisable records.
+
+    Each *namespace* (e.g. ``"osu_tokens"``) is an independent mapping of
+    string keys to values. Methods are synchronous and thread-safe, so
+    callers may run them in a worker thread to keep the event loop free.
+
+    Writes made inside :meth:`transaction` are applied together: a file
+    backend rewrites each touched namespace once, SQLite commits once.
+    Transactions nest; only the outermost one commits.
+
+    Account links (``platform_id -> osu_id``) have their own methods so a
+    backend can index them both ways; by default they are entries of the
+    :attr:`LINKS` namespace.
+    """
+
+    LINKS = "osu_links"
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def items(self, namespace: str) -> dict[str, Any]:
+        """Return a copy of every entry in *namespace*."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        ...
+
+    def set_many(self, namespace: str, values: dict[str, Any]) -> None:
+        with self.transaction():
+            for key, value in values.items():
+                self.set(namespace, key, value)
+
+    # ------------------------------------------------------------------
+
+    def links(self) -> dict[str, str]:
+        """Every account link as ``platform_id -> osu_id``."""
+        return {str(p): str(o) for p, o in self.items(self.LINKS).items()}
+
+    def get_link(self, platform_id: str) -> Optional[str]:
+        osu_id = self.get(self.LINKS, platform_id)
+        return None if osu_id is None else str(osu_id)
+
+    def linked_platform_ids(self, osu_id: str) -> list[str]:
+        """Platform IDs linked to *osu_id*, sorted."""
+        return sorted(p for p, o in self.links().items() if o == osu_id)
+
+    def set_link(self, platform_id: str, osu_id: str) -> None:
+        self.set(self.LINKS, platform_id, osu_id)
+
+    def delete_link(self, platform_id: str) -> None:
+        self.delete(self.LINKS, platform_id)
+
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._lock:
+            self._depth += 1
+            try:
+                if self._depth == 1:
+                    self._begin()
+                yield
+            except BaseException:
+                if self._depth == 1:
+                    self._rollback()
+                raise
+            else:
+                if self._depth == 1:
+                    self._commit()
+            finally:
+                self._depth -= 1
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._depth > 0
+
+    def _begin(self) -> None:
+        pass
+
+    def _commit(self) -> None:
+        pass
+
+    def _rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
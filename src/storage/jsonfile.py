@@ -0,0 +1,84 @@
+"""JSON-file storage backend: one ``<namespace>.json`` file per namespace."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any
+
+from .memory import MemoryStorage
+
+logger = logging.getLogger(__name__)
+
+
+class JsonStorage(MemoryStorage):
+    """Namespaces held in memory and persisted as flat JSON objects.
+
+    A namespace file is read the first time the namespace is used. Every
+    committed write rewrites the files of the namespaces it touched via a
+    temporary file and :func:`os.replace`, so a crash never leaves a
+    truncated file behind; batch writes in :meth:`transaction` to rewrite
+    each file once. Commits block on disk I/O, so async callers should run
+    them with :func:`asyncio.to_thread`.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._dirty: set[str] = set()
+        self._unwritten: set[str] = set()
+
+    def file_for(self, namespace: str) -> str:
+        return os.path.join(self.path, f"{namespace}.json")
+
+    def _namespace(self, namespace: str) -> dict[str, Any]:
+        data = self._data.get(namespace)
+        if data is None:
+            data = self._data[namespace] = self._read(namespace)
+        return data
+
+    def _read(self, namespace: str) -> dict[str, Any]:
+        try:
+            with open(self.file_for(namespace), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning("Ignoring unreadable storage file %s: %s", self.file_for(namespace), e)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, namespace: str) -> None:
+        path = self.file_for(namespace)
+        os.makedirs(self.path, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._data.get(namespace, {}), f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+
+    def _touch(self, namespace: str, key: str) -> None:
+        super()._touch(namespace, key)
+        self._dirty.add(namespace)
+
+    def _begin(self) -> None:
+        self._unwritten = set(self._dirty)
+
+    def _commit(self) -> None:
+        # A failed write leaves the namespace dirty for the next commit; the
+        # values stay in memory, so the undo log is dropped either way.
+        try:
+            for namespace in sorted(self._dirty):
+                self._write(namespace)
+                self._dirty.discard(namespace)
+        finally:
+            super()._commit()
+
+    def _rollback(self) -> None:
+        # Namespaces whose last write failed still need writing.
+        self._dirty = self._unwritten
+        super()._rollback()
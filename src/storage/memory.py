@@ -0,0 +1,66 @@
+"""In-memory storage backend (tests, benchmarks, throwaway deployments)."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from .base import Storage
+
+_MISSING = object()
+
+
+class MemoryStorage(Storage):
+    """Dict-of-dicts storage that is lost when the process exits.
+
+    Values are deep-copied in and out, so callers see the same isolation
+    they would get from a persistent backend. A rolled-back transaction
+    restores every key it touched.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._data: dict[str, dict[str, Any]] = {}
+        self._undo: dict[tuple[str, str], Any] = {}
+
+    def _namespace(self, namespace: str) -> dict[str, Any]:
+        return self._data.setdefault(namespace, {})
+
+    def _touch(self, namespace: str, key: str) -> None:
+        if self.in_transaction:
+            self._undo.setdefault((namespace, key), self._namespace(namespace).get(key, _MISSING))
+
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value = self._namespace(namespace).get(key, _MISSING)
+            return default if value is _MISSING else copy.deepcopy(value)
+
+    def items(self, namespace: str) -> dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._namespace(namespace))
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self.transaction():
+            self._touch(namespace, key)
+            self._namespace(namespace)[key] = copy.deepcopy(value)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self.transaction():
+            if key in self._namespace(namespace):
+                self._touch(namespace, key)
+                del self._namespace(namespace)[key]
+
+    # ------------------------------------------------------------------
+
+    def _commit(self) -> None:
+        self._undo.clear()
+
+    def _rollback(self) -> None:
+        for (namespace, key), value in self._undo.items():
+            if value is _MISSING:
+                self._namespace(namespace).pop(key, None)
+            else:
+                self._namespace(namespace)[key] = value
+        self._undo.clear()
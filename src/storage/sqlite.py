@@ -0,0 +1,185 @@
+"""SQLite storage backend (WAL mode, one row per key)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Optional
+
+from .base import Storage
+from .jsonfile import JsonStorage
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key       TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imported (
+    namespace TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS links (
+    platform_id TEXT PRIMARY KEY,
+    osu_id      TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS links_osu_id ON links (osu_id);
+"""
+
+
+class SqliteStorage(Storage):
+    """All namespaces in one SQLite database, values stored as JSON text.
+
+    Single-key writes touch one row instead of rewriting a whole file, and
+    a :meth:`transaction` commits any number of them at once. When
+    *import_dir* is given, the first use of a namespace imports the
+    matching :class:`JsonStorage` file from that directory, so switching
+    backends keeps existing data.
+
+    Account links live in a ``links`` table keyed by platform ID with an
+    index on the osu! ID; links found in the generic :attr:`LINKS`
+    namespace (imported JSON, or databases created before the table
+    existed) are moved there on first use.
+    """
+
+    def __init__(self, path: str, import_dir: Optional[str] = None) -> None:
+        super().__init__()
+        self.path = path
+        self._import_dir = import_dir
+        self._checked: set[str] = set()
+        self._links_ready = False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _ensure(self, namespace: str) -> None:
+        if namespace in self._checked:
+            return
+        self._checked.add(namespace)
+        if self._import_dir is None:
+            return
+        with self.transaction():
+            row = self._conn.execute(
+                "SELECT 1 FROM imported WHERE namespace = ?", (namespace,)
+            ).fetchone()
+            if row is not None:
+                return
+            legacy = JsonStorage(self._import_dir).items(namespace)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                [(namespace, k, json.dumps(v, ensure_ascii=False)) for k, v in legacy.items()],
+            )
+            self._conn.execute("INSERT INTO imported (namespace) VALUES (?)", (namespace,))
+        if legacy:
+            logger.info("Imported %d %s entries into %s", len(legacy), namespace, self.path)
+
+    def _ensure_links(self) -> None:
+        if self._links_ready:
+            return
+        with self.transaction():
+            self._ensure(self.LINKS)
+            rows = self._conn.execute(
+                "SELECT key, value FROM kv WHERE namespace = ?", (self.LINKS,)
+            ).fetchall()
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO links (platform_id, osu_id) VALUES (?, ?)",
+                    [(key, str(json.loads(value))) for key, value in rows],
+                )
+                self._conn.execute("DELETE FROM kv WHERE namespace = ?", (self.LINKS,))
+                logger.info("Moved %d account links into the links table of %s", len(rows), self.path)
+            self._links_ready = True
+
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            self._ensure(namespace)
+            row = self._conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def items(self, namespace: str) -> dict[str, Any]:
+        with self._lock:
+            self._ensure(namespace)
+            rows = self._conn.execute(
+                "SELECT key, value FROM kv WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self.transaction():
+            self._ensure(namespace)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+                (namespace, key, encoded),
+            )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self.transaction():
+            self._ensure(namespace)
+            self._conn.execute(
+                "DELETE FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    # ------------------------------------------------------------------
+
+    def links(self) -> dict[str, str]:
+        with self._lock:
+            self._ensure_links()
+            return dict(self._conn.execute("SELECT platform_id, osu_id FROM links").fetchall())
+
+    def get_link(self, platform_id: str) -> Optional[str]:
+        with self._lock:
+            self._ensure_links()
+            row = self._conn.execute(
+                "SELECT osu_id FROM links WHERE platform_id = ?", (platform_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def linked_platform_ids(self, osu_id: str) -> list[str]:
+        with self._lock:
+            self._ensure_links()
+            rows = self._conn.execute(
+                "SELECT platform_id FROM links WHERE osu_id = ? ORDER BY platform_id", (osu_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def set_link(self, platform_id: str, osu_id: str) -> None:
+        with self.transaction():
+            self._ensure_links()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO links (platform_id, osu_id) VALUES (?, ?)",
+                (platform_id, osu_id),
+            )
+
+    def delete_link(self, platform_id: str) -> None:
+        with self.transaction():
+            self._ensure_links()
+            self._conn.execute("DELETE FROM links WHERE platform_id = ?", (platform_id,))
+
+    # ------------------------------------------------------------------
+
+    def _begin(self) -> None:
+        self._conn.execute("BEGIN")
+
+    def _commit(self) -> None:
+        self._conn.execute("COMMIT")
+
+    def _rollback(self) -> None:
+        self._conn.execute("ROLLBACK")
+        # Imports are rolled back too; re-check those namespaces next time.
+        self._checked.clear()
+        self._links_ready = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,8 +5,6 @@ from __future__ import annotations
 import os
 from typing import Any
 
-import yaml
-
 from .osutrackapi import GameMode
 
 _help_cache: dict | None = None
@@ -15,14 +13,21 @@ _info_cache: dict | None = None
 _PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
+def _load_yaml(path: str) -> dict:
+    # PyYAML is imported on first use; its C loader is much faster when built.
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
 def load_help_data() -> dict:
     global _help_cache
     if _help_cache is not None:
         return _help_cache
     path = os.path.join(_PLUGIN_DIR, "help.yaml")
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            _help_cache = yaml.safe_load(f) or {}
+        _help_cache = _load_yaml(path)
     except Exception:
         _help_cache = {}
     return _help_cache
@@ -34,8 +39,7 @@ def load_info_data() -> dict:
         return _info_cache
     path = os.path.join(_PLUGIN_DIR, "info.yaml")
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            _info_cache = yaml.safe_load(f) or {}
+        _info_cache = _load_yaml(path)
     except Exception:
         _info_cache = {}
     return _info_cache
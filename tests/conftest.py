@@ -0,0 +1,64 @@
+"""Shared fixtures. ``src`` is imported directly (AstrBot is not needed)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any, Callable, Optional
+
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeResponse:
+    """Just enough of ``aiohttp.ClientResponse`` for ``RawResponse.read``."""
+
+    def __init__(self, status: int = 200, body: Any = None, headers: Optional[dict[str, str]] = None):
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers or {}))
+        self._body = body if isinstance(body, bytes) else json.dumps(body).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> FakeResponse:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+
+class FakeSession:
+    """Records requests and answers them with ``handler(method, url, **kwargs)``."""
+
+    closed = False
+
+    def __init__(self, handler: Callable[..., FakeResponse]):
+        self.handler = handler
+        self.calls: list[dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append({"method": method, "url": url, **kwargs})
+        return self.handler(method, url, **kwargs)
+
+
+@pytest.fixture
+def fake_api():
+    """An ``OsuApi`` wired to a :class:`FakeSession`; returns ``(api, session)``."""
+    from src.net import ResponseCache
+    from src.osuapi.api import OsuApi
+
+    def make(handler: Callable[..., FakeResponse], **kwargs: Any):
+        session = FakeSession(handler)
+        api = OsuApi(1, "secret", cache=ResponseCache(1024 * 1024), **kwargs)
+
+        async def get_session() -> FakeSession:
+            return session
+
+        api._get_session = get_session
+        return api, session
+
+    return make
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.analytics import (
+    DAY,
+    ScoreFrame,
+    StatsFrame,
+    attribute_pp_gain,
+    epoch_seconds,
+    lttb,
+    rolling_mean,
+    summarize,
+)
+
+START = 1_700_006_400.0  # 2023-11-15 00:00 UTC
+
+
+def iso(epoch: float) -> str:
+    return np.datetime64(int(epoch * 1000), "ms").astype(str) + "Z"
+
+
+def update(day: float, pp: float, rank: int, playcount: int, accuracy: float = 98.0):
+    return SimpleNamespace(timestamp=iso(START + day * DAY), pp_raw=pp, pp_rank=rank,
+                           accuracy=accuracy, playcount=playcount)
+
+
+def score(day: float, pp: float, beatmap_id: int, rank: str = "S"):
+    return SimpleNamespace(score_time=iso(START + day * DAY), pp=pp, beatmap_id=beatmap_id, rank=rank)
+
+
+def test_epoch_seconds_accepts_z_and_offsets():
+    assert epoch_seconds(["2023-11-15T00:00:00Z"]).tolist() == [START]
+    assert epoch_seconds(["2023-11-15T00:00:00+00:00"]).tolist() == [START]
+    assert len(epoch_seconds([])) == 0
+
+
+def test_frames_sort_by_time_and_daily_keeps_the_last_snapshot():
+    frame = StatsFrame.from_updates([
+        update(1.5, 1020, 900, 12), update(0.2, 1000, 1000, 10),
+        update(1.1, 1010, 950, 11), update(3.0, 1050, 800, 20),
+    ])
+    assert frame.pp.tolist() == [1000, 1010, 1020, 1050]
+    assert frame.daily().pp.tolist() == [1000, 1020, 1050]
+
+
+def test_rolling_mean_is_trailing():
+    assert rolling_mean(np.array([2.0, 4.0, 6.0, 8.0]), 2).tolist() == [2.0, 3.0, 5.0, 7.0]
+    assert rolling_mean(np.array([1.0, 2.0]), 1).tolist() == [1.0, 2.0]
+
+
+def test_pp_gain_is_split_across_the_days_new_hiscores():
+    daily = StatsFrame.from_updates([update(0, 1000, 1, 1), update(1, 1030, 1, 2), update(2, 1040, 1, 3)])
+    scores = ScoreFrame.from_scores([score(1.2, 200, 1), score(1.4, 100, 2)])
+    attribution = attribute_pp_gain(daily, scores)
+    assert attribution.gain.tolist() == pytest.approx([20.0, 10.0])
+    assert attribution.unattributed == pytest.approx(10.0)
+
+
+def test_summarize():
+    stats = StatsFrame.from_updates([
+        update(0, 1000, 5000, 100, 97.5), update(1, 1030, 4800, 110),
+        update(2, 1030, 4800, 110), update(3, 1045, 4700, 125, 98.5),
+    ])
+    scores = ScoreFrame.from_scores([score(1.5, 250, 11), score(3.5, 150, 12)])
+    summary = summarize(stats, scores, days=3)
+
+    assert summary.snapshots == 4
+    assert summary.pp_change == pytest.approx(45)
+    assert summary.rank_change == 300
+    assert summary.playcount_gain == 25
+    assert summary.active_days == 2
+    assert summary.avg_daily_gain == pytest.approx(15)
+    assert summary.best_day == START + DAY and summary.best_day_gain == pytest.approx(30)
+    assert summary.new_hiscores == 2
+    assert summary.top_gains == [(11, 250.0, pytest.approx(30)), (12, 150.0, pytest.approx(15))]
+
+
+def test_summarize_without_history():
+    summary = summarize(StatsFrame.from_updates([]), ScoreFrame.from_scores([]), days=7)
+    assert summary.snapshots == 0 and summary.best_day is None and summary.top_gains == []
+
+
+# ----------------------------------------------------------------------
+# LTTB
+# ----------------------------------------------------------------------
+
+
+def test_lttb_keeps_short_series_untouched():
+    x = np.arange(10.0)
+    assert lttb(x, x, 20).tolist() == list(range(10))
+    assert lttb(x, x, 2).tolist() == list(range(10))
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(10.0)
+    y = np.array([0, 0, 0, 9, 0, 0, -5, 0, 0, 0.0])
+    assert lttb(x, y, 5).tolist() == [0, 2, 3, 6, 9]
+
+
+def test_lttb_output_is_bounded_and_ordered():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 1e6, 20_000))
+    y = np.cumsum(rng.normal(size=20_000))
+    keep = lttb(x, y, 600)
+    assert len(keep) == 600
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_keeps_isolated_spikes_in_long_series():
+    x = np.arange(20_000.0)
+    y = np.zeros(20_000)
+    y[[1234, 15_321]] = [50.0, -40.0]
+    keep = lttb(x, y, 600)
+    assert 1234 in keep and 15_321 in keep
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.osuapi import BatchLoader, OsuApiError
+
+
+class Token:
+    def __init__(self, name: str, valid: bool = True) -> None:
+        self.name = name
+        self.valid = valid
+
+
+def user_loader(**kwargs) -> tuple[BatchLoader, list]:
+    calls: list[tuple[list[int], str]] = []
+
+    async def load_users(ids: list[int], token: Token) -> dict[int, str]:
+        calls.append((sorted(ids), token.name))
+        if not token.valid:
+            raise OsuApiError(401, "invalid token")
+        return {i: f"user{i}" for i in ids if i > 0}
+
+    return BatchLoader(load_users, **kwargs), calls
+
+
+def test_concurrent_loads_become_one_batch():
+    loader, calls = user_loader()
+    alice = Token("alice")
+
+    async def main():
+        return await asyncio.gather(*(loader.load(i, alice) for i in (3, 1, 2, 1)))
+
+    assert asyncio.run(main()) == ["user3", "user1", "user2", "user1"]
+    assert calls == [([1, 2, 3], "alice")]
+    assert (loader.batches, loader.loads) == (1, 4)
+
+
+def test_missing_keys_resolve_to_none():
+    loader, _ = user_loader()
+    assert asyncio.run(loader.load(-1, Token("alice"))) is None
+
+
+def test_full_batches_are_dispatched_immediately():
+    loader, calls = user_loader(max_batch=2, window=10)
+    app = Token("app")
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(loader.load(1, app), loader.load(2, app)), 1)
+
+    assert asyncio.run(main()) == ["user1", "user2"]
+    assert calls == [([1, 2], "app")]
+
+
+def test_errors_fail_the_whole_batch_without_retry_on():
+    loader, calls = user_loader()
+
+    async def main():
+        return await asyncio.gather(
+            loader.load(1, Token("revoked", valid=False)), loader.load(2, Token("bob")),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, OsuApiError) for r in results)
+    assert len(calls) == 1
+
+
+def test_auth_failure_retries_other_callers_with_their_own_context():
+    loader, calls = user_loader(retry_on=lambda e: isinstance(e, OsuApiError) and e.status == 401)
+    revoked, bob, carol = Token("revoked", valid=False), Token("bob"), Token("carol")
+
+    async def main():
+        return await asyncio.gather(
+            loader.load(1, revoked), loader.load(2, bob), loader.load(3, carol), loader.load(1, carol),
+            return_exceptions=True,
+        )
+
+    first, *rest = asyncio.run(main())
+    assert isinstance(first, OsuApiError) and first.status == 401
+    assert rest == ["user2", "user3", "user1"]
+    assert calls[0] == ([1, 2, 3], "revoked")
+    assert sorted(calls[1:]) == [([1, 3], "carol"), ([2], "bob")]
+    assert loader.retries == 2
+
+
+def test_other_errors_are_not_retried():
+    loader, calls = user_loader(retry_on=lambda e: False)
+
+    async def main():
+        return await asyncio.gather(
+            loader.load(1, Token("revoked", valid=False)), loader.load(2, Token("bob")),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(r, OsuApiError) for r in asyncio.run(main()))
+    assert len(calls) == 1
+
+
+def test_retried_callers_get_their_own_errors():
+    loader, calls = user_loader(retry_on=lambda e: True)
+
+    async def main():
+        return await asyncio.gather(
+            loader.load(1, Token("a", valid=False)), loader.load(2, Token("b", valid=False)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, OsuApiError) for r in results)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("status,retried", [(401, True), (403, True), (404, False), (500, False)])
+def test_client_retries_batches_only_on_auth_errors(status, retried):
+    from src.client.osu_client import _is_auth_error
+
+    assert _is_auth_error(OsuApiError(status, "x")) is retried
+    assert not _is_auth_error(ValueError("x"))
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src import charts
+from src.charts import ChartRenderer
+
+
+def thread_name() -> bytes:
+    return threading.current_thread().name.encode()
+
+
+class FailingExecutor(Executor):
+    """An executor whose workers cannot be started or die immediately."""
+
+    def __init__(self, error: BaseException, on_submit: bool) -> None:
+        self.error = error
+        self.on_submit = on_submit
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs):
+        if self.on_submit:
+            raise self.error
+        future: Future = Future()
+        future.set_exception(self.error)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+def render(renderer: ChartRenderer, fn=thread_name, *args) -> bytes:
+    async def main():
+        return await renderer.render(fn, *args)
+
+    return asyncio.run(main())
+
+
+def test_zero_workers_render_in_a_thread():
+    renderer = ChartRenderer(workers=0)
+    assert render(renderer) != threading.current_thread().name.encode()
+    assert renderer.stats().rendered == 1
+
+
+def test_falls_back_to_a_thread_when_the_pool_cannot_be_created(monkeypatch, caplog):
+    def no_processes(*args, **kwargs):
+        raise OSError("sem_open not available")
+
+    monkeypatch.setattr(charts, "ProcessPoolExecutor", no_processes)
+    renderer = ChartRenderer(workers=2)
+    with caplog.at_level(logging.WARNING, logger=charts.logger.name):
+        assert render(renderer)
+    assert renderer.workers == 0
+    assert "sem_open" in caplog.text
+
+
+@pytest.mark.parametrize("error,on_submit", [
+    (OSError("fork/spawn failed"), True),
+    (BrokenProcessPool("worker died"), True),
+    (BrokenProcessPool("worker died"), False),
+])
+def test_falls_back_to_a_thread_when_workers_fail(error, on_submit):
+    pool = FailingExecutor(error, on_submit)
+    renderer = ChartRenderer(workers=2)
+    renderer._pool = pool
+    assert render(renderer)
+    assert pool.shut_down
+    assert renderer.workers == 0 and renderer._pool is None
+
+    # Later charts go straight to the thread.
+    assert render(renderer)
+    assert renderer.stats().rendered == 2
+
+
+def test_renderer_errors_are_not_treated_as_a_broken_pool():
+    def fail() -> bytes:
+        raise ValueError("bad data")
+
+    renderer = ChartRenderer(workers=0)
+    with pytest.raises(ValueError):
+        render(renderer, fail)
+
+
+def test_renders_a_chart_in_a_worker_process():
+    renderer = ChartRenderer(workers=1)
+    try:
+        png = render(renderer, charts.render_rank_chart, "user", "osu", 7,
+                     charts.Series([1.7e9, 1.7e9 + 86400], [1000, 900]))
+    finally:
+        renderer.close()
+    assert png.startswith(b"\x89PNG")
+    assert renderer.workers == 1
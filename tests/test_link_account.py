@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+
+from src.client.link_account import LinkAccountManager
+from src.storage import MemoryStorage, SqliteStorage
+
+
+def test_links_are_indexed_both_ways_and_persisted(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "db.sqlite3"))
+
+    async def main():
+        links = LinkAccountManager(storage)
+        assert links.link(123, "qq:1")
+        assert links.link(123, "qq:2")
+        assert not links.link(456, "qq:1")  # already linked elsewhere
+        assert links.unlink("qq:2")
+        assert not links.unlink("qq:2")
+        await links.close()
+        return links
+
+    links = asyncio.run(main())
+    assert links.get_osu_id("qq:1") == "123"
+    assert links.get_platform_ids(123) == ["qq:1"]
+
+    reloaded = LinkAccountManager(storage)
+    assert reloaded.get_platform_ids("123") == ["qq:1"]
+    assert not reloaded.is_linked("qq:2")
+    storage.close()
+
+
+def test_legacy_file_is_imported_once(tmp_path):
+    legacy = tmp_path / "osuaccount.json"
+    legacy.write_text(json.dumps({"platform_to_osu": {"qq:1": "123"}}), encoding="utf-8")
+    storage = MemoryStorage()
+
+    links = LinkAccountManager(storage, legacy_file=str(legacy))
+    assert links.get_osu_id("qq:1") == "123"
+    links.unlink("qq:1")
+
+    # Unlinking the last account must not bring the legacy links back.
+    assert LinkAccountManager(storage, legacy_file=str(legacy)).get_osu_id("qq:1") is None
+
+
+def test_many_links_load_and_update_quickly(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "db.sqlite3"))
+    with storage.transaction():
+        for i in range(100_000):
+            storage.set_link(f"qq:{i}", str(i // 2))
+
+    async def main():
+        started = time.perf_counter()
+        links = LinkAccountManager(storage)
+        loaded = time.perf_counter() - started
+        assert links.get_platform_ids(49_999) == ["qq:99998", "qq:99999"]
+        started = time.perf_counter()
+        for i in range(1000):
+            links.unlink(f"qq:{i}")
+            links.link(i, f"qq:{i}")
+        await links.close()
+        return loaded, time.perf_counter() - started
+
+    loaded, updated = asyncio.run(main())
+    assert loaded < 2 and updated < 2
+    assert storage.get_link("qq:999") == "999"
+    assert storage.linked_platform_ids("0") == ["qq:0"]
+    storage.close()
+
+
+class FailingStorage(MemoryStorage):
+    def set(self, namespace, key, value):
+        raise OSError("disk full")
+
+
+def test_failed_write_through_is_logged(caplog):
+    async def main():
+        links = LinkAccountManager(FailingStorage())
+        assert links.link(123, "qq:1")
+        await links.close()
+        await asyncio.sleep(0)  # let the done-callback run
+        return links
+
+    with caplog.at_level(logging.ERROR, logger="src.client.link_account"):
+        links = asyncio.run(main())
+    assert links.get_osu_id("qq:1") == "123"
+    assert any("qq:1" in r.getMessage() and "disk full" in r.getMessage() for r in caplog.records)
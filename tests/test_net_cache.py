@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from src.net import ResponseCache
+from src.net import cache as cache_module
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_hit_and_miss_are_counted(clock):
+    cache = ResponseCache(100)
+    assert cache.get("a") is None
+    cache.set("a", {"v": 1}, ttl=10, size=10)
+    assert cache.get("a") == {"v": 1}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 10)
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = ResponseCache(100)
+    cache.set("a", 1, ttl=10, size=10)
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats().expirations == 1
+    assert cache.stats().size == 0
+
+
+def test_size_budget_evicts_least_recently_used(clock):
+    cache = ResponseCache(30)
+    cache.set("a", 1, ttl=60, size=10)
+    cache.set("b", 2, ttl=60, size=10)
+    cache.set("c", 3, ttl=60, size=10)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("d", 4, ttl=60, size=10)
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == [1, 3, 4]
+    assert cache.stats().size == 30
+    assert cache.stats().evictions == 1
+
+
+def test_replacing_a_key_updates_the_size(clock):
+    cache = ResponseCache(100)
+    cache.set("a", 1, ttl=60, size=40)
+    cache.set("a", 2, ttl=60, size=15)
+    assert cache.stats().size == 15
+    assert cache.get("a") == 2
+
+
+def test_oversized_and_zero_ttl_values_are_not_cached(clock):
+    cache = ResponseCache(10)
+    cache.set("big", 1, ttl=60, size=11)
+    cache.set("now", 1, ttl=0, size=1)
+    assert len(cache) == 0
+
+
+def test_invalidate_and_clear(clock):
+    cache = ResponseCache(100)
+    cache.set("a", 1, ttl=60, size=10)
+    cache.set("b", 2, ttl=60, size=10)
+    cache.invalidate("a")
+    assert cache.get("a") is None and cache.stats().size == 10
+    cache.clear()
+    assert len(cache) == 0 and cache.stats().size == 0
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import math
+
+from src.net import DiskCache
+
+
+def test_disk_cache_round_trip_and_persistence(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+
+    async def main():
+        cache = DiskCache(path)
+        assert await cache.get("beatmaps/1") is None
+        await cache.set("beatmaps/1", b'{"id":1}' * 100, math.inf)
+        assert await cache.get("beatmaps/1") == b'{"id":1}' * 100
+        cache.close()
+        reopened = DiskCache(path)
+        body = await reopened.get("beatmaps/1")
+        reopened.close()
+        return cache, body
+
+    cache, body = asyncio.run(main())
+    assert body == b'{"id":1}' * 100
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_disk_cache_ignores_and_purges_expired_entries(tmp_path, monkeypatch):
+    from src.net import diskcache
+
+    path = str(tmp_path / "cache.sqlite3")
+    now = [1_000_000.0]
+    monkeypatch.setattr(diskcache.time, "time", lambda: now[0])
+
+    async def main():
+        cache = DiskCache(path)
+        await cache.set("wiki/a", b"a", 60)
+        await cache.set("scores/1", b"s", None)
+        now[0] += 61
+        expired, kept = await cache.get("wiki/a"), await cache.get("scores/1")
+        cache.close()
+        return expired, kept
+
+    assert asyncio.run(main()) == (None, b"s")
+
+    reopened = DiskCache(path)
+    rows = reopened._connect().execute("SELECT key FROM responses").fetchall()
+    reopened.close()
+    assert rows == [("scores/1",)]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.net import Priority, RateLimiter
+
+
+def test_rejects_non_positive_rates():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_burst_is_granted_without_waiting():
+    limiter = RateLimiter(600, burst=3)
+
+    async def main():
+        return [await limiter.acquire() for _ in range(3)]
+
+    assert asyncio.run(main()) == [0.0, 0.0, 0.0]
+    assert limiter.stats().delayed == 0
+
+
+def test_queued_callers_are_released_by_priority_then_fifo():
+    # 1200/min = one token every 50ms; the single burst token is spent first.
+    limiter = RateLimiter(1200, burst=1)
+    order: list[str] = []
+
+    async def take(name: str, priority: Priority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    async def main():
+        await limiter.acquire()
+        tasks = [
+            asyncio.ensure_future(take("bg", Priority.BACKGROUND)),
+            asyncio.ensure_future(take("tool", Priority.TOOL)),
+            asyncio.ensure_future(take("user-1", Priority.INTERACTIVE)),
+            asyncio.ensure_future(take("user-2", Priority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        queued = limiter.stats().queued
+        await asyncio.gather(*tasks)
+        return queued
+
+    queued = asyncio.run(main())
+    assert queued == {"interactive": 2, "tool": 1, "background": 1}
+    assert order == ["user-1", "user-2", "tool", "bg"]
+    stats = limiter.stats()
+    assert stats.delayed == 4 and stats.max_wait > 0
+
+
+def test_cancelled_waiters_give_up_their_place():
+    limiter = RateLimiter(1200, burst=1)
+
+    async def main():
+        await limiter.acquire()
+        cancelled = asyncio.ensure_future(limiter.acquire(Priority.INTERACTIVE))
+        waiting = asyncio.ensure_future(limiter.acquire(Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, 1)
+        return limiter.queue_depth
+
+    assert asyncio.run(main()) == 0
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import time
+
+import aiohttp
+import pytest
+
+from conftest import FakeResponse
+from src.net import NO_RETRY, RawResponse, RetryPolicy, parse_retry_after
+from src.net import retry as retry_module
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def responses(*items):
+    """A ``send`` callable returning *items* in turn (exceptions are raised)."""
+    queue = list(items)
+    calls = []
+
+    async def send() -> RawResponse:
+        calls.append(1)
+        item = queue.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        return await RawResponse.read(item)
+
+    send.calls = calls
+    return send
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after(" 7 ") == 7.0
+    assert parse_retry_after("soon") is None
+    later = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 31
+    earlier = email.utils.formatdate(time.time() - 30, usegmt=True)
+    assert parse_retry_after(earlier) == 0.0
+
+
+def test_retries_server_errors_until_success(sleeps):
+    send = responses(FakeResponse(503), FakeResponse(502), FakeResponse(200, {"ok": True}))
+    resp = asyncio.run(RetryPolicy(base_delay=0.5, max_delay=8).run("GET", "users/1", send))
+    assert resp.status == 200
+    assert len(send.calls) == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+
+def test_gives_up_after_max_attempts_and_returns_last_response(sleeps):
+    send = responses(*(FakeResponse(500) for _ in range(3)))
+    resp = asyncio.run(RetryPolicy(max_attempts=3).run("GET", "users/1", send))
+    assert resp.status == 500
+    assert len(send.calls) == 3
+
+
+def test_client_errors_are_not_retried(sleeps):
+    send = responses(FakeResponse(404))
+    assert asyncio.run(RetryPolicy().run("GET", "users/1", send)).status == 404
+    assert sleeps == []
+
+
+def test_retry_after_sets_the_minimum_delay(sleeps):
+    send = responses(FakeResponse(429, headers={"Retry-After": "5"}), FakeResponse(200, {}))
+    asyncio.run(RetryPolicy(max_delay=1).run("GET", "users/1", send))
+    assert sleeps == [5.0]
+
+
+def test_retry_after_beyond_the_cap_is_returned_immediately(sleeps):
+    send = responses(FakeResponse(429, headers={"Retry-After": "120"}), FakeResponse(200, {}))
+    resp = asyncio.run(RetryPolicy(max_retry_after=30).run("GET", "users/1", send))
+    assert resp.status == 429
+    assert sleeps == [] and len(send.calls) == 1
+
+
+def test_non_idempotent_methods_are_not_replayed(sleeps):
+    send = responses(FakeResponse(503), FakeResponse(200, {}))
+    assert asyncio.run(RetryPolicy().run("POST", "beatmaps/1/attributes", send)).status == 503
+    assert len(send.calls) == 1
+
+
+def test_endpoint_overrides_apply(sleeps):
+    policy = RetryPolicy(overrides={
+        "beatmaps/*/attributes": RetryPolicy(methods=frozenset({"POST"})),
+    })
+    send = responses(FakeResponse(503), FakeResponse(200, {}))
+    assert asyncio.run(policy.run("POST", "/beatmaps/1/attributes", send)).status == 200
+
+
+def test_connection_errors_are_retried_then_raised(sleeps):
+    error = aiohttp.ClientConnectionError("reset")
+    send = responses(error, FakeResponse(200, {}))
+    assert asyncio.run(RetryPolicy().run("GET", "users/1", send)).status == 200
+
+    send = responses(error, error)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        asyncio.run(RetryPolicy(max_attempts=2).run("GET", "users/1", send))
+    assert len(send.calls) == 2
+
+
+def test_no_retry_policy_sends_once(sleeps):
+    send = responses(FakeResponse(503))
+    assert asyncio.run(NO_RETRY.run("GET", "users/1", send)).status == 503
+    assert len(send.calls) == 1
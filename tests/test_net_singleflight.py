@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.net import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    runs = []
+
+    async def fetch():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def main():
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+        again = await flight.do("k", fetch)
+        return results, again
+
+    results, again = asyncio.run(main())
+    assert all(r is results[0] for r in results)
+    assert again == {"id": 1}
+    assert len(runs) == 2
+    assert (flight.started, flight.shared, flight.in_flight) == (2, 4, 0)
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.in_flight == 0
+
+
+def test_cancelling_one_waiter_does_not_cancel_the_call():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from conftest import FakeResponse, FakeSession
+from src.client import osu_client as osu_client_module
+from src.client.osu_client import OsuApiClient
+from src.client.user_index import UsernameIndex
+from src.net import ResponseCache
+from src.storage import MemoryStorage
+
+
+def make_client(handler, **kwargs):
+    async def ensure_token(platform_id):
+        return f"token-{platform_id}"
+
+    api = SimpleNamespace(
+        client_id=1, client_secret="secret", redirect_uri="", transport=None,
+        rate_limiter=None, cache=ResponseCache(1024 * 1024), disk_cache=None,
+    )
+    client = OsuApiClient(SimpleNamespace(api=api, ensure_token=ensure_token), **kwargs)
+    session = FakeSession(handler)
+
+    async def get_session():
+        return session
+
+    client._api._get_session = get_session
+    return client, session
+
+
+def profile_handler():
+    versions = iter(range(1, 100))
+    return lambda method, url, **kw: FakeResponse(body={"id": 2, "username": f"v{next(versions)}"})
+
+
+def test_revalidation_bypasses_the_response_cache(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(osu_client_module.time, "time", lambda: now[0])
+    client, session = make_client(profile_handler(), profile_fresh=10, profile_max_age=600)
+
+    async def main():
+        # A plain lookup leaves users/2 in the shared response cache (60s).
+        await client.get_user("qq:1", 2)
+        first, first_at = await client.get_user_swr("qq:1", 2)
+        now[0] += 11
+        stale, stale_at = await client.get_user_swr("qq:1", 2)
+        await asyncio.gather(*client._revalidating.values())
+        fresh, fresh_at = await client.get_user_swr("qq:1", 2)
+        return (first.username, first_at), (stale.username, stale_at), (fresh.username, fresh_at)
+
+    first, stale, fresh = asyncio.run(main())
+    # The first SWR fetch does not reuse the plain lookup's cached body...
+    assert first == ("v2", 1000.0)
+    # ...the stale copy is served while a refresh runs...
+    assert stale == ("v2", 1000.0)
+    # ...and the refresh downloads a new body instead of the cached one.
+    assert fresh == ("v3", 1011.0)
+    assert len(session.calls) == 3
+
+
+def test_swr_disabled_still_reports_download_time(monkeypatch):
+    monkeypatch.setattr(osu_client_module.time, "time", lambda: 500.0)
+    client, session = make_client(profile_handler(), profile_max_age=0)
+
+    async def main():
+        await client.get_own_data("qq:1")
+        return await client.get_own_data_swr("qq:1")
+
+    profile, fetched_at = asyncio.run(main())
+    assert (profile.username, fetched_at) == ("v2", 500.0)
+    assert len(session.calls) == 2
+
+
+def users_handler(users: dict[str, dict]):
+    """Answer ``users/{id or @name}`` from *users*; anything else is a 404."""
+    def handle(method, url, **kw):
+        key = url.rsplit("/", 1)[-1]
+        if key in users:
+            return FakeResponse(body=users[key])
+        return FakeResponse(404, {"error": "not found"})
+    return handle
+
+
+def test_deleted_users_are_evicted_from_the_username_index():
+    index = UsernameIndex(MemoryStorage())
+    index.remember(SimpleNamespace(id=2, username="Gone", previous_usernames=[]))
+    client, session = make_client(users_handler({"@Gone": {"id": 3, "username": "Gone"}}), user_index=index)
+
+    user = asyncio.run(client.get_user("qq:1", "Gone"))
+    assert user.id == 3
+    assert [c["url"].rsplit("/", 1)[-1] for c in session.calls] == ["2", "@Gone"]
+    assert index.lookup("gone") == 3
+
+
+def test_renamed_users_are_evicted_from_the_username_index():
+    index = UsernameIndex(MemoryStorage())
+    index.remember(SimpleNamespace(id=2, username="OldName", previous_usernames=[]))
+    client, session = make_client(users_handler({
+        "2": {"id": 2, "username": "NewName"},
+        "@OldName": {"id": 5, "username": "OldName"},
+    }), user_index=index)
+
+    user = asyncio.run(client.get_user("qq:1", "OldName"))
+    assert (user.id, user.username) == (5, "OldName")
+    assert index.lookup("oldname") == 5 and index.lookup("newname") == 2
+
+
+def test_indexed_names_skip_the_resolution_round_trip():
+    index = UsernameIndex(MemoryStorage())
+    index.remember(SimpleNamespace(id=2, username="peppy", previous_usernames=[]))
+    client, session = make_client(users_handler({"2": {"id": 2, "username": "peppy"}}), user_index=index)
+
+    assert asyncio.run(client.get_user("qq:1", "peppy")).id == 2
+    assert len(session.calls) == 1
+
+
+def test_brief_lookups_fall_back_when_the_indexed_id_is_gone():
+    index = UsernameIndex(MemoryStorage())
+    index.remember(SimpleNamespace(id=2, username="Gone", previous_usernames=[]))
+    client, session = make_client(users_handler({
+        "users": {"users": []},
+        "@Gone": {"id": 3, "username": "Gone"},
+    }), user_index=index)
+
+    assert asyncio.run(client.get_user_brief("qq:1", "Gone")).id == 3
+    assert index.lookup("gone") == 3
+
+
+def test_events_are_paged_with_cursors():
+    pages = {None: ([1, 2], "p2"), "p2": ([3, 4], "p3"), "p3": ([5], None)}
+
+    def handler(method, url, **kw):
+        cursor = dict(kw.get("params") or {}).get("cursor_string")
+        ids, following = pages[cursor]
+        return FakeResponse(body={"events": [{"id": i} for i in ids], "cursor_string": following})
+
+    client, session = make_client(handler)
+
+    async def main():
+        events = await client.iter_events("qq:1", max_items=3)
+        return [e["id"] for e in await events.collect()]
+
+    assert asyncio.run(main()) == [1, 2, 3]
+    assert len(session.calls) == 2
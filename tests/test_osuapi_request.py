@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from conftest import FakeResponse
+from src.net import DiskCache, Priority, RateLimiter
+from src.osuapi.api import OsuApiError
+
+
+def test_cacheable_gets_are_served_from_memory(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"id": 2}))
+
+    async def main():
+        first = await api.request("GET", "users/2/osu", access_token="alice")
+        second = await api.request("GET", "users/2/osu", access_token="bob")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second == {"id": 2}
+    assert len(session.calls) == 1
+
+
+def test_token_scoped_gets_are_cached_per_token(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"me": kw["headers"]["Authorization"]}))
+
+    async def main():
+        return [await api.request("GET", "me", access_token=t) for t in ("alice", "bob", "alice")]
+
+    results = asyncio.run(main())
+    assert [r["me"] for r in results] == ["Bearer alice", "Bearer bob", "Bearer alice"]
+    assert len(session.calls) == 2
+
+
+def test_uncached_endpoints_always_hit_the_network(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body=[]))
+
+    async def main():
+        for _ in range(2):
+            await api.request("GET", "users/2/scores/recent", access_token="alice")
+
+    asyncio.run(main())
+    assert len(session.calls) == 2
+
+
+def test_conditional_get_reuses_the_body_on_304(fake_api):
+    bodies = iter([
+        FakeResponse(body={"news_posts": [1]}, headers={"ETag": '"v1"'}),
+        FakeResponse(304),
+    ])
+    api, session = fake_api(lambda method, url, **kw: next(bodies))
+
+    async def main():
+        first = await api.request("GET", "news", access_token="alice")
+        api.cache.clear()  # force a revalidation instead of a cache hit
+        second = await api.request("GET", "news", access_token="alice")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second == {"news_posts": [1]}
+    assert "If-None-Match" not in session.calls[0]["headers"]
+    assert session.calls[1]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_settled_objects_are_persisted_to_disk(fake_api, tmp_path):
+    ranked = {"id": 75, "status": "ranked"}
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"))
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body=ranked), disk_cache=disk)
+
+    async def main():
+        await api.request("GET", "beatmaps/75", access_token="alice")
+        api.cache.clear()
+        return await api.request("GET", "beatmaps/75", access_token="bob")
+
+    assert asyncio.run(main()) == ranked
+    assert len(session.calls) == 1
+    assert disk.hits == 1
+    disk.close()
+
+
+def test_errors_raise_osu_api_error(fake_api):
+    api, _ = fake_api(lambda method, url, **kw: FakeResponse(404, {"error": "not found"}))
+    with pytest.raises(OsuApiError) as info:
+        asyncio.run(api.request("GET", "users/0", access_token="alice"))
+    assert info.value.status == 404
+
+
+def test_fresh_requests_skip_the_cache_but_refresh_it(fake_api):
+    versions = iter(range(1, 10))
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"version": next(versions)}))
+
+    async def main():
+        cached = await api.request("GET", "users/2", access_token="alice")
+        fresh = await api.bind("alice", fresh=True).request("GET", "users/2")
+        after = await api.request("GET", "users/2", access_token="alice")
+        return cached, fresh, after
+
+    cached, fresh, after = asyncio.run(main())
+    assert (cached["version"], fresh["version"], after["version"]) == (1, 2, 2)
+    assert len(session.calls) == 2
+
+
+def test_interactive_gets_do_not_wait_on_a_background_flight(fake_api):
+    # 1200/min: one token every 50ms, and the only burst token is spent first.
+    limiter = RateLimiter(1200, burst=1)
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"id": 2}), rate_limiter=limiter)
+    done: list[str] = []
+
+    async def get(name: str, priority: Priority) -> None:
+        await api.request("GET", "users/2", access_token="alice", priority=priority)
+        done.append(name)
+
+    async def main():
+        await limiter.acquire()
+        background = asyncio.ensure_future(get("background", Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        await get("interactive", Priority.INTERACTIVE)
+        await background
+
+    asyncio.run(main())
+    assert done == ["interactive", "background"]
+    assert len(session.calls) == 2
+
+
+def test_lower_lanes_join_a_higher_lane_flight(fake_api):
+    limiter = RateLimiter(1200, burst=1)
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"id": 2}), rate_limiter=limiter)
+
+    async def main():
+        await limiter.acquire()
+        return await asyncio.gather(
+            api.request("GET", "users/2", access_token="alice", priority=Priority.TOOL),
+            api.request("GET", "users/2", access_token="alice", priority=Priority.BACKGROUND),
+        )
+
+    assert asyncio.run(main()) == [{"id": 2}, {"id": 2}]
+    assert len(session.calls) == 1
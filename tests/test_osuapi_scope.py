@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from conftest import FakeResponse
+from src.osuapi.api import token_scope
+
+
+@pytest.mark.parametrize("endpoint", [
+    "users/2/osu", "beatmaps/75", "beatmapsets/search", "rankings/osu/performance", "news",
+])
+def test_public_endpoints_are_shared(endpoint):
+    assert token_scope(endpoint, "tok") == "public"
+
+
+@pytest.mark.parametrize("endpoint", [
+    "me", "me/osu", "friends", "beatmaps/75/scores/users/2", "comments", "comments/123",
+])
+def test_personal_endpoints_are_scoped_to_the_token(endpoint):
+    assert token_scope(endpoint, "tok") == "tok"
+
+
+@pytest.mark.parametrize("params", [
+    [("s", "mine")],
+    [("s", "favourites")],
+    [("played", "played")],
+    [("played", "unplayed")],
+    [("r", "S")],
+    [("c", "recommended")],
+    [("c", "featured_artists.follows")],
+])
+def test_personal_search_filters_are_scoped_to_the_token(params):
+    assert token_scope("beatmapsets/search", "tok", [("q", "freedom dive")] + params) == "tok"
+
+
+@pytest.mark.parametrize("params", [[("s", "ranked")], [("s", "any"), ("m", "0")], [("c", "featured_artists")]])
+def test_generic_search_filters_are_shared(params):
+    assert token_scope("beatmapsets/search", "tok", params) == "public"
+
+
+@pytest.mark.parametrize("params,scope", [
+    ([("filter", "friends")], "tok"),
+    ([("country", "JP"), ("filter", "friends")], "tok"),
+    ([("filter", "all")], "public"),
+    ([("country", "JP")], "public"),
+])
+def test_friend_rankings_are_scoped_to_the_token(params, scope):
+    assert token_scope("rankings/osu/performance", "tok", params) == scope
+
+
+def test_friend_rankings_are_not_served_from_another_users_cache(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(
+        body={"ranking": [{"viewer": kw["headers"]["Authorization"]}]},
+    ))
+
+    async def main():
+        return [
+            await api.request("GET", "rankings/osu/performance", params={"filter": "friends"}, access_token=token)
+            for token in ("alice", "bob")
+        ]
+
+    alice, bob = asyncio.run(main())
+    assert alice["ranking"][0]["viewer"] == "Bearer alice"
+    assert bob["ranking"][0]["viewer"] == "Bearer bob"
+    assert len(session.calls) == 2
+
+
+def test_personal_search_is_not_served_from_another_users_cache(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(
+        body={"beatmapsets": [{"owner": kw["headers"]["Authorization"]}]},
+    ))
+
+    async def search(token: str, section: str):
+        return await api.request("GET", "beatmapsets/search", params={"s": section}, access_token=token)
+
+    async def main():
+        alice = await search("alice", "mine")
+        bob = await search("bob", "mine")
+        await search("alice", "ranked")
+        await search("bob", "ranked")
+        return alice, bob
+
+    alice, bob = asyncio.run(main())
+    assert alice["beatmapsets"][0]["owner"] == "Bearer alice"
+    assert bob["beatmapsets"][0]["owner"] == "Bearer bob"
+    # Two personal searches, one shared "ranked" search.
+    assert len(session.calls) == 3
+
+
+def test_concurrent_personal_searches_are_not_coalesced(fake_api):
+    api, session = fake_api(lambda method, url, **kw: FakeResponse(body={"beatmapsets": []}))
+
+    async def main():
+        await asyncio.gather(*(
+            api.request("GET", "beatmapsets/search", params={"s": "favourites"}, access_token=token)
+            for token in ("alice", "bob")
+        ))
+
+    asyncio.run(main())
+    assert sorted(c["headers"]["Authorization"] for c in session.calls) == ["Bearer alice", "Bearer bob"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from src.osuapi.pagination import CursorPaginator
+
+
+def pages_of(*pages: list[int]):
+    """A page fetcher over *pages*; cursors are the page index as a string."""
+    requested: list[Optional[str]] = []
+
+    async def fetch(cursor: Optional[str]) -> dict:
+        requested.append(cursor)
+        index = int(cursor or 0)
+        following = str(index + 1) if index + 1 < len(pages) else None
+        return {"items": pages[index], "cursor_string": following}
+
+    fetch.requested = requested
+    return fetch
+
+
+def test_iterates_every_page():
+    fetch = pages_of([1, 2], [3, 4], [5])
+    paginator = CursorPaginator(fetch, "items")
+    assert asyncio.run(paginator.collect()) == [1, 2, 3, 4, 5]
+    assert paginator.exhausted and paginator.cursor is None
+    assert fetch.requested == [None, "1", "2"]
+
+
+def test_max_items_stops_early_and_keeps_a_resumable_cursor():
+    fetch = pages_of([1, 2], [3, 4], [5])
+    paginator = CursorPaginator(fetch, "items", max_items=3)
+    assert asyncio.run(paginator.collect()) == [1, 2, 3]
+    assert not paginator.exhausted
+    # Stopped inside page "1": resuming repeats it rather than skipping items.
+    assert paginator.cursor == "1"
+
+    resumed = CursorPaginator(fetch, "items", cursor=paginator.cursor)
+    assert asyncio.run(resumed.collect()) == [3, 4, 5]
+
+
+def test_max_pages_limits_requests():
+    fetch = pages_of([1], [2], [3])
+    paginator = CursorPaginator(fetch, "items", max_pages=2)
+    assert asyncio.run(paginator.collect()) == [1, 2]
+    assert paginator.pages_fetched == 2
+    assert paginator.cursor == "2"
+
+
+def test_empty_page_ends_iteration():
+    paginator = CursorPaginator(pages_of([], [1]), "items")
+    assert asyncio.run(paginator.collect()) == []
+    assert paginator.exhausted
+
+
+def test_repeated_cursor_ends_iteration():
+    calls = []
+
+    async def fetch(cursor):
+        calls.append(cursor)
+        return {"items": [len(calls)], "cursor_string": "same"}
+
+    assert asyncio.run(CursorPaginator(fetch, "items", cursor="same").collect()) == [1]
+    assert calls == ["same"]
+
+
+def test_without_prefetch_pages_are_fetched_on_demand():
+    fetch = pages_of([1, 2], [3])
+
+    async def main():
+        paginator = CursorPaginator(fetch, "items", prefetch=False)
+        async for item in paginator:
+            if item == 1:
+                return list(fetch.requested)
+
+    assert asyncio.run(main()) == [None]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from src.storage import BACKENDS, JsonStorage, MemoryStorage, SqliteStorage, open_storage
+
+
+@pytest.fixture(params=BACKENDS)
+def storage(request, tmp_path):
+    store = open_storage(request.param, str(tmp_path))
+    yield store
+    store.close()
+
+
+def test_get_set_delete(storage):
+    assert storage.get("ns", "a") is None
+    assert storage.get("ns", "a", default=0) == 0
+    storage.set("ns", "a", {"token": "x", "n": [1, 2]})
+    storage.set("other", "a", "unrelated")
+    assert storage.get("ns", "a") == {"token": "x", "n": [1, 2]}
+    storage.delete("ns", "a")
+    storage.delete("ns", "missing")
+    assert storage.items("ns") == {}
+    assert storage.items("other") == {"a": "unrelated"}
+
+
+def test_items_returns_a_copy(storage):
+    storage.set("ns", "a", {"v": 1})
+    snapshot = storage.items("ns")
+    snapshot["a"]["v"] = 2
+    snapshot["b"] = 3
+    assert storage.items("ns") == {"a": {"v": 1}}
+
+
+def test_transaction_applies_all_writes(storage):
+    with storage.transaction():
+        storage.set("ns", "a", 1)
+        storage.set_many("ns", {"b": 2, "c": 3})
+        assert storage.in_transaction
+    assert not storage.in_transaction
+    assert storage.items("ns") == {"a": 1, "b": 2, "c": 3}
+
+
+def test_failed_transaction_rolls_back(storage):
+    storage.set("ns", "kept", 1)
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.set("ns", "kept", 2)
+            storage.set("ns", "new", 3)
+            storage.delete("ns", "kept")
+            raise RuntimeError("boom")
+    assert storage.items("ns") == {"kept": 1}
+
+
+def test_nested_failure_rolls_back_the_outer_transaction(storage):
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.set("ns", "outer", 1)
+            with storage.transaction():
+                storage.set("ns", "inner", 2)
+            raise RuntimeError("boom")
+    assert storage.items("ns") == {}
+
+
+def test_links_are_indexed_both_ways(storage):
+    storage.set_link("qq:2", "123")
+    storage.set_link("qq:1", "123")
+    storage.set_link("qq:3", "456")
+    storage.set_link("qq:3", "789")  # relinking replaces the old row
+    assert storage.get_link("qq:3") == "789"
+    assert storage.linked_platform_ids("123") == ["qq:1", "qq:2"]
+    assert storage.linked_platform_ids("456") == []
+    storage.delete_link("qq:2")
+    assert storage.get_link("qq:2") is None
+    assert storage.links() == {"qq:1": "123", "qq:3": "789"}
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        open_storage("redis", str(tmp_path))
+    assert isinstance(open_storage("memory", str(tmp_path)), MemoryStorage)
+
+
+# ----------------------------------------------------------------------
+# Backend specifics
+# ----------------------------------------------------------------------
+
+
+def test_json_writes_one_file_per_namespace_on_commit(tmp_path):
+    store = JsonStorage(str(tmp_path))
+    with store.transaction():
+        store.set("osu_tokens", "1", {"access_token": "a"})
+        assert not os.path.exists(store.file_for("osu_tokens"))
+    with open(store.file_for("osu_tokens"), encoding="utf-8") as f:
+        assert json.load(f) == {"1": {"access_token": "a"}}
+    assert JsonStorage(str(tmp_path)).items("osu_tokens") == {"1": {"access_token": "a"}}
+
+
+def test_json_ignores_unreadable_files(tmp_path):
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+    assert JsonStorage(str(tmp_path)).items("broken") == {}
+
+
+def test_sqlite_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "db.sqlite3")
+    store = SqliteStorage(path)
+    store.set("ns", "a", "ä")
+    store.close()
+    reopened = SqliteStorage(path)
+    assert reopened.get("ns", "a") == "ä"
+    reopened.close()
+
+
+def test_sqlite_imports_json_files_once(tmp_path):
+    JsonStorage(str(tmp_path)).set("osu_links", "qq:1", 123)
+    path = str(tmp_path / "db.sqlite3")
+
+    store = SqliteStorage(path, import_dir=str(tmp_path))
+    assert store.items("osu_links") == {"qq:1": 123}
+    store.delete("osu_links", "qq:1")
+    store.close()
+
+    # Deleted entries must not be re-imported from the old file.
+    reopened = SqliteStorage(path, import_dir=str(tmp_path))
+    assert reopened.items("osu_links") == {}
+    reopened.close()
+
+
+def test_sqlite_reverse_link_lookup_uses_the_osu_id_index(tmp_path):
+    store = SqliteStorage(str(tmp_path / "db.sqlite3"))
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT platform_id FROM links WHERE osu_id = ? ORDER BY platform_id", ("1",)
+    ).fetchall()
+    store.close()
+    assert any("links_osu_id" in row[-1] for row in plan)
+
+
+def test_sqlite_moves_key_value_links_into_the_links_table(tmp_path):
+    JsonStorage(str(tmp_path)).set("osu_links", "qq:1", 123)
+    path = str(tmp_path / "db.sqlite3")
+    store = SqliteStorage(path, import_dir=str(tmp_path))
+    store.set("osu_links", "qq:2", "456")  # written by an older version
+    assert store.links() == {"qq:1": "123", "qq:2": "456"}
+    assert store.items("osu_links") == {}
+    store.delete_link("qq:1")
+    store.close()
+
+    reopened = SqliteStorage(path, import_dir=str(tmp_path))
+    assert reopened.links() == {"qq:2": "456"}
+    reopened.close()
+
+
+def test_json_failed_write_then_rollback_stays_consistent(tmp_path, monkeypatch):
+    store = JsonStorage(str(tmp_path))
+    store.set("ns", "a", 1)
+    write = store._write
+
+    def fail(namespace):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_write", fail)
+    with pytest.raises(OSError):
+        store.set("ns", "a", 2)
+    # The value is kept in memory and the namespace still needs writing.
+    assert store.get("ns", "a") == 2
+
+    monkeypatch.setattr(store, "_write", write)
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.set("ns", "a", 3)
+            store.set("ns", "b", 4)
+            raise RuntimeError("boom")
+    # Only the rolled-back transaction is undone, not the failed commit.
+    assert store.items("ns") == {"a": 2}
+
+    store.set("other", "x", 0)
+    assert JsonStorage(str(tmp_path)).items("ns") == {"a": 2}
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+from src.client import user_index as user_index_module
+from src.client.user_index import UsernameIndex
+from src.storage import JsonStorage, MemoryStorage
+
+
+def user(user_id: int, username: str, previous=()):
+    return SimpleNamespace(id=user_id, username=username, previous_usernames=list(previous))
+
+
+def test_lookup_by_current_and_previous_names():
+    index = UsernameIndex(MemoryStorage())
+    index.remember(user(2, "peppy", previous=["Peppy Old"]))
+    assert index.lookup("@PEPPY") == 2
+    assert index.lookup("peppy old") == 2
+    assert index.lookup("nobody") is None
+
+
+def test_writes_are_debounced_and_run_off_the_event_loop(tmp_path, monkeypatch):
+    storage = JsonStorage(str(tmp_path))
+    index = UsernameIndex(storage, save_interval=0.01)
+    path = storage.file_for(UsernameIndex.NAMESPACE)
+    writers: list[str] = []
+    write = index._write
+
+    def recording_write(changes):
+        writers.append(threading.current_thread().name)
+        write(changes)
+
+    monkeypatch.setattr(index, "_write", recording_write)
+
+    async def main():
+        main_thread = threading.current_thread().name
+        for i in range(1, 6):
+            index.remember(user(i, f"user{i}"))
+        assert not (tmp_path / path).exists()
+        await asyncio.sleep(0.1)
+        return main_thread
+
+    main_thread = asyncio.run(main())
+    assert len(writers) == 1 and writers[0] != main_thread
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 5
+    assert UsernameIndex(JsonStorage(str(tmp_path))).lookup("user3") == 3
+
+
+def test_changes_outside_a_loop_wait_for_flush():
+    storage = MemoryStorage()
+    index = UsernameIndex(storage, save_interval=3600)
+    index.remember(user(7, "seven"))
+    assert storage.items(UsernameIndex.NAMESPACE) == {}
+
+    asyncio.run(index.flush())
+    assert UsernameIndex(storage).lookup("seven") == 7
+
+
+def test_evicted_and_forgotten_names_are_deleted_from_storage():
+    storage = MemoryStorage()
+    index = UsernameIndex(storage, max_entries=2)
+    for i in range(1, 4):
+        index.remember(user(i, f"user{i}"))
+    index.forget("user3")
+    asyncio.run(index.flush())
+    assert list(storage.items(UsernameIndex.NAMESPACE)) == ["user2"]
+
+
+def test_legacy_file_is_imported_once(tmp_path):
+    legacy = tmp_path / "osu_usernames.json"
+    legacy.write_text(json.dumps({"names": {"peppy": [2, 1e12, True]}}), encoding="utf-8")
+    storage = MemoryStorage()
+
+    index = UsernameIndex(storage, legacy_file=str(legacy))
+    assert index.lookup("peppy") == 2
+    index.forget("peppy")
+    asyncio.run(index.flush())
+    assert UsernameIndex(storage, legacy_file=str(legacy)).lookup("peppy") is None
+
+
+def test_matches_current_and_previous_names():
+    index = UsernameIndex(MemoryStorage())
+    peppy = user(2, "peppy", previous=["Peppy Old"])
+    assert index.matches(peppy, "@PEPPY")
+    assert index.matches(peppy, "peppy old")
+    assert not index.matches(peppy, "someone")
+
+
+def test_missing_names_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(user_index_module.time, "monotonic", lambda: now[0])
+    index = UsernameIndex(MemoryStorage(), negative_ttl=10)
+    index.remember_missing("ghost")
+    assert index.is_missing("@Ghost")
+    now[0] += 10
+    assert not index.is_missing("ghost")
+
+
+def test_missing_names_are_bounded(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(user_index_module.time, "monotonic", lambda: now[0])
+    index = UsernameIndex(MemoryStorage(), negative_ttl=10, max_missing=3)
+    for name in ("a", "b", "c", "d"):
+        index.remember_missing(name)
+    assert list(index._missing) == ["b", "c", "d"]
+
+    # Expired entries are swept on the next insert, not only when looked up.
+    now[0] += 10
+    index.remember_missing("e")
+    assert list(index._missing) == ["e"]
+
+
+def test_remembering_a_user_clears_its_missing_mark():
+    index = UsernameIndex(MemoryStorage())
+    index.remember_missing("late")
+    index.remember(user(9, "late"))
+    assert not index.is_missing("late")